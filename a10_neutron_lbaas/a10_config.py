@@ -16,6 +16,7 @@ import logging
 import os
 import runpy
 import sys
+import threading
 
 # This is ConfigParser pre-Python3
 if sys.version_info < (3,):
@@ -26,11 +27,20 @@ else:
 from debtcollector import removals
 
 from a10_neutron_lbaas import a10_exceptions as a10_ex
+from a10_neutron_lbaas import name_expressions
+from a10_neutron_lbaas import vport_templates
 from a10_neutron_lbaas.etc import config as blank_config
 from a10_neutron_lbaas.etc import defaults
 
 LOG = logging.getLogger(__name__)
 
+# A10Config.shared() instances, per (config dir, provider)
+_SHARED = {}
+_SHARED_LOCK = threading.Lock()
+
+# Parsed neutron.conf files, per path, with the mtime they were parsed at
+_NEUTRON_CONF = {}
+
 
 class ConfigModule(object):
     def __init__(self, d, provider=None):
@@ -55,7 +65,14 @@ class ConfigModule(object):
 
 class A10Config(object):
 
+    # Process state that outlives a reload of config.py
+    _RUNTIME_STATE = ('_config_dir', '_config_path', '_provider', '_device_registry')
+
     def __init__(self, config_dir=None, config=None, provider=None):
+        self._config_dir = None
+        self._config_path = None
+        self._provider = provider
+
         if config is not None:
             self._config = config
             self._load_config()
@@ -72,7 +89,49 @@ class A10Config(object):
 
         self._load_config()
 
-    def _find_config_dir(self, config_dir):
+    @classmethod
+    def shared(cls, config_dir=None, provider=None):
+        """The process-wide config for a config dir and provider.
+
+        config.py is run once per process for each, instead of once for
+        every plugin, database engine or API call that needs settings.
+        """
+        key = (cls._find_config_dir(config_dir), provider)
+        with _SHARED_LOCK:
+            config = _SHARED.get(key)
+            if config is None:
+                config = _SHARED[key] = cls(config_dir=key[0], provider=provider)
+            return config
+
+    @property
+    def config_path(self):
+        return self._config_path
+
+    def reload(self):
+        """Re-read config.py and switch to it if it is valid.
+
+        The new settings are loaded and checked in full before anything is
+        swapped in, all in one assignment, so a reader never sees half of
+        each. A broken file raises and leaves the running config alone.
+        Returns the names of the devices that were added, removed or changed.
+        """
+        new = A10Config(config=ConfigModule.load(self._config_path, provider=self._provider))
+
+        changed = set(self._devices) ^ set(new._devices)
+        changed.update(k for k in set(self._devices) & set(new._devices)
+                       if self._devices[k] != new._devices[k])
+
+        state = dict(new.__dict__)
+        for k in self._RUNTIME_STATE:
+            state[k] = self.__dict__.get(k)
+        self.__dict__ = state
+
+        LOG.info("A10Config: reloaded %s, devices changed: %s",
+                 self._config_path, sorted(changed))
+        return changed
+
+    @staticmethod
+    def _find_config_dir(config_dir):
         # Look for config in the virtual environment
         # virtualenv puts the original prefix in sys.real_prefix
         # pyenv puts it in sys.base_prefix
@@ -103,6 +162,7 @@ class A10Config(object):
                 LOG.debug("global setting %s=%s", dk, getattr(self._config, dk))
 
         self._devices = {}
+        self._device_registry = None
         if not hasattr(self._config, "devices"):
             self._config.devices = {}
 
@@ -189,6 +249,18 @@ class A10Config(object):
         if hasattr(self._config, "monitor_expressions"):
             self._monitor_expressions = self._config.monitor_expressions
 
+        # Compiled once here instead of for every object created
+        self._name_matchers = dict(
+            (id(x), name_expressions.NameMatcher(x)) for x in (
+                self._vport_expressions, self._virtual_server_expressions,
+                self._service_group_expressions, self._member_expressions,
+                self._monitor_expressions))
+
+        # The static part of every vport's defaults, per device and protocol
+        self._vport_templates = vport_templates.VportTemplates(
+            self._config.vport_default_conditions)
+        self._vport_templates.prime(self._devices, self._vport_defaults)
+
         # self._vlan_interfaces = {}
         # if hasattr(self._config, "vlan_interfaces"):
         #    self._vlan_interfaces = self._config.vlan_interfaces
@@ -214,13 +286,23 @@ class A10Config(object):
 
         if os.path.exists(neutron_conf):
             LOG.debug("found neutron.conf file in /etc")
-            n = ini.ConfigParser()
-            n.read(neutron_conf)
+            n = self._parse_neutron_conf(neutron_conf)
             try:
                 return n.get(section, option)
             except (ini.NoSectionError, ini.NoOptionError):
                 pass
 
+    @staticmethod
+    def _parse_neutron_conf(path):
+        mtime = os.path.getmtime(path)
+        cached = _NEUTRON_CONF.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        n = ini.ConfigParser()
+        n.read(path)
+        _NEUTRON_CONF[path] = (mtime, n)
+        return n
+
     def _get_neutron_db_string(self):
         z = self._get_neutron_conf('database', 'connection')
 
@@ -233,26 +315,28 @@ class A10Config(object):
     def get(self, key):
         return getattr(self._config, key)
 
+    @property
+    def device_registry(self):
+        # Orchestrated devices live in the database, indexed in memory
+        if self._device_registry is None:
+            from a10_neutron_lbaas.db import device_registry
+
+            self._device_registry = device_registry.DeviceRegistry(
+                refresh_interval=self.get('device_registry_refresh_interval'),
+                refresh_margin=self.get('device_registry_refresh_margin'))
+        return self._device_registry
+
     def get_device(self, device_name, db_session=None):
         if device_name in self._devices:
             return self._devices.get(device_name, {})
         if self.get('use_database'):
-            from a10_neutron_lbaas.db import models
-
-            instance = models.A10DeviceInstance.find_by(name=device_name, db_session=db_session)
-            if instance is not None:
-                self._devices[device_name] = instance.as_dict()
-                return self._devices[device_name]
+            return self.device_registry.get(device_name, db_session=db_session)
         return None
 
-    # TODO(dougwig) -- later - use of this method should be considered a scalability killer
     def get_devices(self, db_session=None):
         if self.get('use_database'):
-            from a10_neutron_lbaas.db import models
-
             d = dict(self._devices.items())
-            for x in models.A10DeviceInstance.find_all():
-                d[x.name] = x.as_dict()
+            d.update(self.device_registry.all(db_session=db_session))
             return d
         return self._devices
 
@@ -262,6 +346,9 @@ class A10Config(object):
     def get_vport_defaults(self):
         return self._vport_defaults
 
+    def get_vport_template(self, device_cfg, protocol):
+        return self._vport_templates.get(device_cfg, protocol, self.get_vport_defaults())
+
     def get_vport_expressions(self):
         return self._vport_expressions
 
@@ -277,6 +364,13 @@ class A10Config(object):
     def get_monitor_expressions(self):
         return self._monitor_expressions
 
+    def get_name_matcher(self, expressions):
+        matcher = self._name_matchers.get(id(expressions))
+        if matcher is None or matcher.expressions is not expressions:
+            # Not one of our tables (e.g. supplied by hooks); compile it now
+            matcher = name_expressions.NameMatcher(expressions)
+        return matcher
+
     # backwards compat
     @removals.remove
     @property
@@ -16,7 +16,7 @@ import logging
 
 import acos_client.errors as acos_errors
 
-from a10_neutron_lbaas.vthunder import keystone as keystone_helpers
+from a10_neutron_lbaas.db import api as db_api
 
 LOG = logging.getLogger(__name__)
 
@@ -36,37 +36,79 @@ class A10Context(object):
         LOG.debug("A10Context obj=%s", openstack_lbaas_obj)
         LOG.debug("A10Context action=%s", self.action)
         self.partition_name = "shared"
+        self.db_session = None
+        self.client = None
 
     def _get_device(self):
         if self.device_name:
-            d = self.a10_driver.config.get_device(self.device_name)
+            d = self.a10_driver.config.get_device(self.device_name, db_session=self.db_session)
         else:
             d = self.a10_driver._select_a10_device(self.tenant_id, a10_context=self,
                                                    lbaas_obj=self.openstack_lbaas_obj,
-                                                   action=self.action)
+                                                   action=self.action,
+                                                   db_session=self.db_session)
         return d
 
+    def _open_db_session(self):
+        # One session, and one commit, for everything this operation does in
+        # the database. Write contexts get it on the primary.
+        if self.a10_driver.config.get('use_database'):
+            self.db_session = db_api.get_session(readonly=True, expire_on_commit=False)
+
+    def _close_db_session(self, exc_type):
+        if self.db_session is None:
+            return
+        try:
+            if exc_type is None:
+                self.db_session.commit()
+            else:
+                self.db_session.rollback()
+        finally:
+            self.db_session.close()
+            self.db_session = None
+
     def _get_client(self, device_cfg):
-        return self.a10_driver._get_a10_client(device_cfg, action=self.action)
+        # The partition hint lets a session pool hand back a session that
+        # already has our partition active.
+        return self.a10_driver._get_a10_client(device_cfg, action=self.action,
+                                               partition=self._appliance_partition())
 
     def __enter__(self):
-        self.get_tenant_id()
-        self.device_cfg = self._get_device()
-        self.client = self._get_client(self.device_cfg)
-        self.get_partition_key()
-        self.select_appliance_partition()
-        if hasattr(self.hooks, 'after_select_partition'):
-            self.hooks.after_select_partition(self)
+        self._open_db_session()
+        try:
+            self.get_tenant_id()
+            self.device_cfg = self._get_device()
+            self.get_partition_key()
+            self.client = self._get_client(self.device_cfg)
+            self.select_appliance_partition()
+            if hasattr(self.hooks, 'after_select_partition'):
+                self.hooks.after_select_partition(self)
+        except Exception as e:
+            try:
+                if self.client is not None:
+                    self._release_client(type(e))
+            finally:
+                self._close_db_session(type(e))
+            raise
         return self
 
+    def _release_client(self, exc_type):
+        # acos_client logs in again (and, for clients from new_client(),
+        # re-activates the partition) when the device drops a session. A
+        # session that still failed that way is not handed out again.
+        discard = exc_type is not None and issubclass(exc_type, acos_errors.InvalidSessionID)
+        # Deleting a partition logs the session off underneath us
+        discard = discard or getattr(self, "partition_deleted", False)
+        self.a10_driver._release_a10_client(self.client, discard=discard)
+
     def __exit__(self, exc_type, exc_value, traceback):
-        try:
-            self.client.session.close()
-        except acos_errors.InvalidSessionID:
-            pass
+        self._release_client(exc_type)
 
-        if hasattr(self.hooks, 'a10_context_exit_final'):
-            self.hooks.a10_context_exit_final(self)
+        try:
+            if hasattr(self.hooks, 'a10_context_exit_final'):
+                self.hooks.a10_context_exit_final(self)
+        finally:
+            self._close_db_session(exc_type)
 
         if exc_type is not None:
             return False
@@ -81,54 +123,101 @@ class A10Context(object):
         # If use_parent_project is enabled, return that. Else, typical behavior.
         self.partition_key = self.tenant_id
         if self.a10_driver.config.get("use_parent_project") and self.openstack_context:
-            # Hoping we can avoid making this call but I don't think thats possible
-            keystone_context = keystone_helpers.KeystoneFromContext(self.a10_driver.config,
-                                                                    self.openstack_context)
-            thisproject = keystone_context.client.projects.get(self.tenant_id)
-            if not thisproject.parent_id == thisproject.domain_id:
-                self.partition_key = thisproject.parent_id
-
-    def select_appliance_partition(self):
-        self.get_partition_key()
+            parent_id = self.a10_driver.project_hierarchy.parent_of(self.openstack_context,
+                                                                    self.tenant_id)
+            if parent_id is not None:
+                self.partition_key = parent_id
 
+    def _appliance_partition(self):
         name = self.device_cfg.get("shared_partition", "shared")
 
         if self.device_cfg['v_method'].lower() == 'adp':
             name = self.partition_key[0:13]
 
-        # If we are not using appliance partitions, we are done.
+        return name
+
+    def _session_pool(self):
+        # Partition state is only tracked for sessions borrowed from the pool
+        pool = getattr(self.a10_driver, 'session_pool', None)
+        if pool is not None and pool.tracks(self.client):
+            return pool
+
+    def _activate_partition(self, name):
+        pool = self._session_pool()
+        if pool is not None:
+            pool.activate_partition(self.client, name)
+        elif name != 'shared':
+            self.client.system.partition.active(name)
+
+    def select_appliance_partition(self):
+        self.get_partition_key()
+
+        name = self._appliance_partition()
+
+        # If we are not using appliance partitions, we are done, as long as
+        # a reused session is not still parked in somebody else's partition.
         if name == 'shared':
+            self._activate_partition(name)
             return
 
         self.partition_name = name
 
-        try:
-            self.client.system.partition.active(name)
-            return
-        except acos_errors.NotFound:
-            pass
+        pool = self._session_pool()
+        exists = None
+        if pool is not None:
+            exists = pool.partition_exists(self.device_cfg, self.client, name)
+
+        if exists is not False:
+            try:
+                self._activate_partition(name)
+                return
+            except acos_errors.NotFound:
+                if pool is not None:
+                    pool.partition_deleted(self.device_cfg, name)
 
         # Create it if not found
-        self.hooks.partition_create(self.client, self.openstack_context, name)
-        self.client.system.partition.active(name)
+        try:
+            self.hooks.partition_create(self.client, self.openstack_context, name)
+        except acos_errors.Exists:
+            # Somebody else got there since we last looked
+            pass
+        if pool is not None:
+            pool.partition_created(self.device_cfg, name)
+        self._activate_partition(name)
 
 
 class A10WriteContext(A10Context):
 
+    def __enter__(self):
+        # Database reads for the rest of this operation go to the primary
+        db_api.begin_writes()
+        try:
+            return super(A10WriteContext, self).__enter__()
+        except Exception:
+            db_api.end_writes()
+            raise
+
     def __exit__(self, exc_type, exc_value, traceback):
-        if exc_type is None and self.device_cfg.get('write_memory', True):
-            try:
+        try:
+            if exc_type is None and self.device_cfg.get('write_memory', True):
                 partition_deleted = getattr(self, "partition_deleted", False)
                 partition_name = None if partition_deleted else self.partition_name
-                self.client.system.action.activate_and_write(partition_name)
 
-            except acos_errors.InvalidSessionID:
-                pass
+                scheduler = self.a10_driver.write_memory_scheduler
+                if scheduler is not None:
+                    # Coalesced and written in the background, followed by ha sync
+                    scheduler.schedule(self.device_cfg, partition_name)
+                else:
+                    try:
+                        self.client.system.action.activate_and_write(partition_name)
+                    except acos_errors.InvalidSessionID:
+                        pass
 
-            for v in self.device_cfg.get('ha_sync_list', []):
-                self.client.ha.sync(v['ip'], v['username'], v['password'])
+                    self.a10_driver._ha_sync(self.client, self.device_cfg)
 
-        super(A10WriteContext, self).__exit__(exc_type, exc_value, traceback)
+            super(A10WriteContext, self).__exit__(exc_type, exc_value, traceback)
+        finally:
+            db_api.end_writes()
 
 
 class A10ReplayContext(A10WriteContext):
@@ -186,6 +275,12 @@ class A10DeleteContextBase(A10WriteContext):
                 if not name:
                     return
                 self.hooks.partition_delete(self.client, self.openstack_context, name)
+                pool = self._session_pool()
+                if pool is not None:
+                    pool.partition_deleted(self.device_cfg, name)
+                scheduler = self.a10_driver.write_memory_scheduler
+                if scheduler is not None:
+                    scheduler.partition_deleted(self.device_cfg['name'], name)
                 # Run post-post cleanup hook if exists
                 if hasattr(self.hooks, "partition_delete_last"):
                     self.hooks.partition_delete_last(self.client, self.openstack_context, name,
@@ -12,7 +12,11 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import atexit
 import logging
+import os
+import tempfile
+import threading
 
 import acos_client
 
@@ -20,17 +24,12 @@ from a10_neutron_lbaas import a10_config
 from a10_neutron_lbaas import monkey_patch
 from a10_neutron_lbaas import version
 
-from a10_neutron_lbaas.v1 import handler_hm as v1_handler_hm
-from a10_neutron_lbaas.v1 import handler_member as v1_handler_member
-from a10_neutron_lbaas.v1 import handler_pool as v1_handler_pool
-from a10_neutron_lbaas.v1 import handler_vip as v1_handler_vip
-from a10_neutron_lbaas.v2 import handler_hm as v2_handler_hm
-from a10_neutron_lbaas.v2 import handler_l7policy as v2_handler_l7policy
-from a10_neutron_lbaas.v2 import handler_l7rule as v2_handler_l7rule
-from a10_neutron_lbaas.v2 import handler_lb as v2_handler_lb
-from a10_neutron_lbaas.v2 import handler_listener as v2_handler_listener
-from a10_neutron_lbaas.v2 import handler_member as v2_handler_member
-from a10_neutron_lbaas.v2 import handler_pool as v2_handler_pool
+from a10_neutron_lbaas.acos import session_pool
+
+# The handlers, and the optional helpers set up in _late_init, are imported
+# on first use: between them they pull in neutron's db mixins,
+# a10_openstack_lib and the openstack API clients, which most processes
+# that import the driver never need.
 
 logging.basicConfig()
 LOG = logging.getLogger(__name__)
@@ -38,6 +37,10 @@ LOG = logging.getLogger(__name__)
 
 class A10OpenstackLBBase(object):
 
+    # Handlers keep references to these, so are rebuilt if one is replaced
+    _HANDLER_DEPENDENCIES = frozenset([
+        'openstack_driver', 'hooks', 'neutron', 'barbican_client', 'cert_db'])
+
     def __init__(self, openstack_driver,
                  plumbing_hooks_class=None,
                  neutron_hooks_module=None,
@@ -46,6 +49,8 @@ class A10OpenstackLBBase(object):
                  config_dir=None,
                  provider=None,
                  cert_db=None):
+        self._handlers_lock = threading.RLock()
+        self._handlers = {}
         self.openstack_driver = openstack_driver
         self.plumbing_hooks_class = plumbing_hooks_class
         self.neutron = neutron_hooks_module
@@ -55,6 +60,12 @@ class A10OpenstackLBBase(object):
         self.config_dir = config_dir
         self.provider = provider
         self.hooks = None
+        self.session_pool = None
+        self.write_memory_scheduler = None
+        self.ha_sync_executor = None
+        self._project_hierarchy = None
+        self.stats_poller = None
+        self.config_watcher = None
 
         LOG.info("A10-neutron-lbaas: pre-initializing, version=%s, acos_client=%s",
                  version.VERSION, acos_client.VERSION)
@@ -73,6 +84,29 @@ class A10OpenstackLBBase(object):
         if self.config is None:
             self.config = a10_config.A10Config(config_dir=self.config_dir, provider=provider)
 
+        if self.config.get('session_pool_size'):
+            self.session_pool = session_pool.SessionPool(
+                max_idle=self.config.get('session_pool_size'),
+                idle_timeout=self.config.get('session_pool_idle_timeout'))
+            atexit.register(self.session_pool.close_all)
+
+        if self.config.get('ha_sync_async'):
+            from a10_neutron_lbaas.acos import ha_sync
+
+            self.ha_sync_executor = ha_sync.HASyncExecutor(
+                self, workers=self.config.get('ha_sync_workers'))
+            atexit.register(self.ha_sync_executor.stop)
+
+        if self.config.get('write_memory_coalesce_window'):
+            from a10_neutron_lbaas.acos import write_memory
+
+            self.write_memory_scheduler = write_memory.WriteMemoryScheduler(
+                self,
+                window=self.config.get('write_memory_coalesce_window'),
+                max_delay=self.config.get('write_memory_max_delay'))
+            # Registered last, so that it is flushed first at exit
+            atexit.register(self.write_memory_scheduler.stop)
+
         if self.plumbing_hooks_class is not None:
             self.hooks = self.plumbing_hooks_class(self)
         else:
@@ -81,6 +115,52 @@ class A10OpenstackLBBase(object):
         if self.config.get('verify_appliances'):
             self._verify_appliances()
 
+        if self.config.get('config_reload_interval') and self.config.config_path:
+            from a10_neutron_lbaas import config_watcher
+
+            self.config_watcher = config_watcher.ConfigWatcher(
+                self, interval=self.config.get('config_reload_interval'))
+            self.config_watcher.start()
+            atexit.register(self.config_watcher.stop)
+
+    def __setattr__(self, name, value):
+        super(A10OpenstackLBBase, self).__setattr__(name, value)
+        if name in self._HANDLER_DEPENDENCIES:
+            self.__dict__['_handlers'] = {}
+
+    def _handler(self, name, build):
+        """The handler called name, built with build() on first use.
+
+        Handlers are built once, after _late_init (which building the first
+        one triggers), and then shared by every thread calling the driver.
+        They must not keep any per-request state on themselves; everything
+        an operation needs lives on its A10Context.
+        """
+        handler = self._handlers.get(name)
+        if handler is None:
+            with self._handlers_lock:
+                handler = self._handlers.get(name)
+                if handler is None:
+                    handler = build()
+                    self._handlers[name] = handler
+        return handler
+
+    @property
+    def project_hierarchy(self):
+        """The keystone project tree cache, for use_parent_project.
+
+        Built on first use rather than in _late_init, so that it is there
+        when a reloaded config turns use_parent_project on.
+        """
+        if self._project_hierarchy is None:
+            with self._handlers_lock:
+                if self._project_hierarchy is None:
+                    from a10_neutron_lbaas.vthunder import keystone as keystone_helpers
+
+                    self._project_hierarchy = keystone_helpers.ProjectHierarchy(
+                        self.config, ttl=self.config.get('project_hierarchy_ttl'))
+        return self._project_hierarchy
+
     def _select_a10_device(self, tenant_id, a10_context=None, lbaas_obj=None, **kwargs):
         if hasattr(self.hooks, 'select_device_with_lbaas_obj'):
             return self.hooks.select_device_with_lbaas_obj(
@@ -91,11 +171,34 @@ class A10OpenstackLBBase(object):
     def _get_a10_client(self, device_info, **kwargs):
         if hasattr(self.hooks, 'get_a10_client'):
             return self.hooks.get_a10_client(device_info, **kwargs)
+        elif self.session_pool is not None:
+            return self.session_pool.acquire(device_info, partition=kwargs.get('partition'))
         else:
-            return acos_client.Client(
-                device_info['host'], device_info['api_version'],
-                device_info['username'], device_info['password'],
-                port=device_info['port'], protocol=device_info['protocol'])
+            return session_pool.new_client(device_info)
+
+    def _ha_sync(self, client, device_cfg):
+        if self.ha_sync_executor is not None:
+            self.ha_sync_executor.schedule(device_cfg)
+            return
+
+        for v in device_cfg.get('ha_sync_list', []):
+            client.ha.sync(v['ip'], v['username'], v['password'])
+
+    def _release_a10_client(self, client, **kwargs):
+        if hasattr(self.hooks, 'release_a10_client'):
+            self.hooks.release_a10_client(client, **kwargs)
+        elif self.session_pool is not None:
+            self.session_pool.release(client, **kwargs)
+        else:
+            session_pool.close_client(client)
+
+    def _config_changed(self, device_names):
+        # Everything cached for a device that did not change stays warm
+        if self.session_pool is not None:
+            for name in device_names:
+                self.session_pool.invalidate(name)
+        if hasattr(self.hooks, 'config_changed'):
+            self.hooks.config_changed(device_names)
 
     def _verify_appliances(self):
         LOG.info("A10Driver: verifying appliances")
@@ -105,8 +208,12 @@ class A10OpenstackLBBase(object):
 
         for k, v in self.config.get_devices().items():
             try:
-                LOG.info("A10Driver: appliance(%s) = %s", k,
-                         self._get_a10_client(v).system.information())
+                client = self._get_a10_client(v)
+                try:
+                    LOG.info("A10Driver: appliance(%s) = %s", k,
+                             client.system.information())
+                finally:
+                    self._release_a10_client(client)
             except Exception:
                 LOG.error("A10Driver: unable to connect to configured"
                           "appliance, name=%s", k)
@@ -114,12 +221,34 @@ class A10OpenstackLBBase(object):
 
 class A10OpenstackLBV2(A10OpenstackLBBase):
 
+    def _late_init(self, provider):
+        super(A10OpenstackLBV2, self)._late_init(provider)
+
+        if self.config.get('stats_poll_interval'):
+            from a10_neutron_lbaas.v2 import stats_poller as v2_stats_poller
+
+            state_dir = self.config.get('stats_poll_state_dir')
+            if not state_dir:
+                state_dir = os.path.join(tempfile.gettempdir(), 'a10-stats-poller')
+            self.stats_poller = v2_stats_poller.StatsPoller(
+                self,
+                interval=self.config.get('stats_poll_interval'),
+                max_age=self.config.get('stats_poll_max_age'),
+                state_dir=state_dir)
+            self.stats_poller.start()
+            atexit.register(self.stats_poller.stop)
+
     @property
     def lb(self):
-        return v2_handler_lb.LoadbalancerHandler(
-            self,
-            self.openstack_driver.load_balancer,
-            neutron=self.neutron)
+        def build():
+            from a10_neutron_lbaas.v2 import handler_lb
+
+            return handler_lb.LoadbalancerHandler(
+                self,
+                self.openstack_driver.load_balancer,
+                neutron=self.neutron)
+
+        return self._handler('lb', build)
 
     @property
     def loadbalancer(self):
@@ -127,62 +256,100 @@ class A10OpenstackLBV2(A10OpenstackLBBase):
 
     @property
     def listener(self):
-        return v2_handler_listener.ListenerHandler(
-            self,
-            self.openstack_driver.listener,
-            neutron=self.neutron,
-            barbican_client=self.barbican_client,
-            cert_db=self.cert_db)
+        def build():
+            from a10_neutron_lbaas.v2 import handler_listener
+
+            return handler_listener.ListenerHandler(
+                self,
+                self.openstack_driver.listener,
+                neutron=self.neutron,
+                barbican_client=self.barbican_client,
+                cert_db=self.cert_db)
+
+        return self._handler('listener', build)
 
     @property
     def pool(self):
-        return v2_handler_pool.PoolHandler(
-            self, self.openstack_driver.pool,
-            neutron=self.neutron)
+        def build():
+            from a10_neutron_lbaas.v2 import handler_pool
+
+            return handler_pool.PoolHandler(
+                self, self.openstack_driver.pool,
+                neutron=self.neutron)
+
+        return self._handler('pool', build)
 
     @property
     def member(self):
-        return v2_handler_member.MemberHandler(
-            self,
-            self.openstack_driver.member,
-            neutron=self.neutron)
+        def build():
+            from a10_neutron_lbaas.v2 import handler_member
+
+            return handler_member.MemberHandler(
+                self,
+                self.openstack_driver.member,
+                neutron=self.neutron)
+
+        return self._handler('member', build)
 
     @property
     def hm(self):
-        return v2_handler_hm.HealthMonitorHandler(
-            self,
-            self.openstack_driver.health_monitor,
-            neutron=self.neutron)
+        def build():
+            from a10_neutron_lbaas.v2 import handler_hm
+
+            return handler_hm.HealthMonitorHandler(
+                self,
+                self.openstack_driver.health_monitor,
+                neutron=self.neutron)
+
+        return self._handler('hm', build)
 
     @property
     def l7policy(self):
-        return v2_handler_l7policy.L7PolicyHandler(
-            self,
-            self.openstack_driver.l7policy,
-            neutron=self.neutron)
+        def build():
+            from a10_neutron_lbaas.v2 import handler_l7policy
+
+            return handler_l7policy.L7PolicyHandler(
+                self,
+                self.openstack_driver.l7policy,
+                neutron=self.neutron)
+
+        return self._handler('l7policy', build)
 
     @property
     def l7rule(self):
-        return v2_handler_l7rule.L7RuleHandler(
-            self,
-            self.openstack_driver.l7rule,
-            neutron=self.neutron)
+        def build():
+            from a10_neutron_lbaas.v2 import handler_l7rule
+
+            return handler_l7rule.L7RuleHandler(
+                self,
+                self.openstack_driver.l7rule,
+                neutron=self.neutron)
+
+        return self._handler('l7rule', build)
 
 
 class A10OpenstackLBV1(A10OpenstackLBBase):
 
     @property
     def pool(self):
-        return v1_handler_pool.PoolHandler(self)
+        from a10_neutron_lbaas.v1 import handler_pool
+
+        return handler_pool.PoolHandler(self)
 
     @property
     def vip(self):
-        return v1_handler_vip.VipHandler(self)
+        from a10_neutron_lbaas.v1 import handler_vip
+
+        return handler_vip.VipHandler(self)
 
     @property
     def member(self):
-        return v1_handler_member.MemberHandler(self)
+        from a10_neutron_lbaas.v1 import handler_member
+
+        return handler_member.MemberHandler(self)
 
     @property
     def hm(self):
-        return v1_handler_hm.HealthMonitorHandler(self)
+        from a10_neutron_lbaas.v1 import handler_hm
+
+        return handler_hm.HealthMonitorHandler(self)
@@ -0,0 +1,91 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import logging
+import sys
+import threading
+
+import acos_client.errors as acos_errors
+import six
+
+LOG = logging.getLogger(__name__)
+
+
+def fan_out(c, fn, items, workers=4):
+    """Return [fn(client, item) for item in items], with calls in parallel.
+
+    The context's own client works through the items alongside up to
+    workers-1 threads, each on a session borrowed from the session pool and
+    switched to the context's partition. Results come back in item order;
+    if any call fails, the first failure is raised once all threads are done.
+    Without a session pool the calls are simply made one after another.
+    """
+    items = list(items)
+    pool = c._session_pool()
+    workers = min(workers or 1, len(items))
+    if pool is None or workers <= 1:
+        return [fn(c.client, item) for item in items]
+
+    results = [None] * len(items)
+    errors = []
+    lock = threading.Lock()
+    todo = iter(range(len(items)))
+
+    def work(client):
+        while True:
+            with lock:
+                if errors:
+                    return
+                i = next(todo, None)
+            if i is None:
+                return
+            try:
+                results[i] = fn(client, items[i])
+            except Exception:
+                with lock:
+                    errors.append(sys.exc_info())
+                return
+
+    def borrowed():
+        try:
+            client = pool.acquire(c.device_cfg, partition=c.partition_name)
+        except Exception:
+            # The remaining workers will pick up the slack
+            LOG.exception("A10 fan out: unable to borrow a session")
+            return
+
+        n = len(errors)
+        try:
+            pool.activate_partition(client, c.partition_name)
+            work(client)
+        except Exception:
+            with lock:
+                errors.append(sys.exc_info())
+        finally:
+            discard = any(issubclass(e[0], acos_errors.InvalidSessionID)
+                          for e in errors[n:])
+            pool.release(client, discard=discard)
+
+    threads = [threading.Thread(target=borrowed, name='a10-fan-out')
+               for i in range(workers - 1)]
+    for t in threads:
+        t.daemon = True
+        t.start()
+    work(c.client)
+    for t in threads:
+        t.join()
+
+    if errors:
+        six.reraise(*errors[0])
+    return results
@@ -0,0 +1,164 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import collections
+import logging
+import threading
+import time
+
+LOG = logging.getLogger(__name__)
+
+
+class _Peer(object):
+
+    def __init__(self, device_cfg, peer):
+        self.device_cfg = device_cfg
+        self.peer = peer
+        self.pending_since = None
+        self.in_flight_since = None
+        self.last_synced = None
+        self.requested = 0
+        self.synced = 0
+        self.failed = 0
+
+    def lag(self, now):
+        oldest = [t for t in (self.pending_since, self.in_flight_since) if t is not None]
+        if not oldest:
+            return 0.0
+        return now - min(oldest)
+
+
+class HASyncExecutor(object):
+    """Runs ha sync in the background, one sync in flight per peer.
+
+    Requests for a peer that already has a sync queued are merged into it. A
+    request that arrives while the peer is syncing queues exactly one more
+    sync, since the running one may have missed the latest change.
+    """
+
+    def __init__(self, driver, workers=4):
+        self.driver = driver
+        self.workers = workers
+        self._cond = threading.Condition()
+        self._peers = {}
+        self._ready = collections.deque()
+        self._threads = []
+        self._stopped = False
+
+    def schedule(self, device_cfg):
+        now = time.time()
+        sync_now = []
+
+        with self._cond:
+            for v in device_cfg.get('ha_sync_list', []):
+                key = (device_cfg['name'], v['ip'])
+                p = self._peers.get(key)
+                if p is None:
+                    p = self._peers[key] = _Peer(device_cfg, v)
+                p.device_cfg = device_cfg
+                p.peer = v
+                p.requested += 1
+
+                if p.pending_since is not None:
+                    continue
+                p.pending_since = now
+                if self._stopped:
+                    sync_now.append(key)
+                elif p.in_flight_since is None:
+                    self._ready.append(key)
+
+            if not self._stopped:
+                self._start_workers()
+                self._cond.notify_all()
+
+        for key in sync_now:
+            self._sync(key)
+
+    def lag(self):
+        """Seconds since the oldest change not yet synced, per (device, peer ip)."""
+        now = time.time()
+        with self._cond:
+            return dict((k, p.lag(now)) for k, p in self._peers.items())
+
+    def stats(self):
+        with self._cond:
+            return dict((k, {'requested': p.requested,
+                             'synced': p.synced,
+                             'failed': p.failed,
+                             'last_synced': p.last_synced})
+                        for k, p in self._peers.items())
+
+    def stop(self, timeout=60):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        for t in self._threads:
+            t.join(timeout)
+
+        # Anything the workers did not get to is synced before we exit
+        with self._cond:
+            keys = [k for k, p in self._peers.items() if p.pending_since is not None]
+            self._ready.clear()
+        for key in keys:
+            self._sync(key)
+
+    def _start_workers(self):
+        self._threads = [t for t in self._threads if t.is_alive()]
+        while len(self._threads) < min(self.workers, len(self._ready)):
+            t = threading.Thread(target=self._run, name='a10-ha-sync')
+            t.daemon = True
+            t.start()
+            self._threads.append(t)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._ready and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                key = self._ready.popleft()
+            self._sync(key)
+
+    def _sync(self, key):
+        with self._cond:
+            p = self._peers[key]
+            if p.pending_since is None or p.in_flight_since is not None:
+                return
+            p.in_flight_since = p.pending_since
+            p.pending_since = None
+            device_cfg, peer = p.device_cfg, p.peer
+
+        ok = False
+        client = None
+        try:
+            client = self.driver._get_a10_client(device_cfg)
+            client.ha.sync(peer['ip'], peer['username'], peer['password'])
+            ok = True
+        except Exception:
+            LOG.exception("A10 ha sync: %s to %s failed", device_cfg['name'], peer['ip'])
+        finally:
+            if client is not None:
+                self.driver._release_a10_client(client)
+
+        with self._cond:
+            p.in_flight_since = None
+            if ok:
+                p.synced += 1
+                p.last_synced = time.time()
+            else:
+                p.failed += 1
+            if p.pending_since is not None and not self._stopped:
+                self._ready.append(key)
+                self._cond.notify()
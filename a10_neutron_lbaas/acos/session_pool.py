@@ -0,0 +1,321 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import collections
+import logging
+import threading
+import time
+
+import acos_client
+import acos_client.errors as acos_errors
+
+LOG = logging.getLogger(__name__)
+
+
+def _reactivate_after_reauth(client):
+    # When the device drops a session mid-operation, acos_client logs in
+    # again and retries the request, but its attempt to re-activate the
+    # partition fails quietly, so the retry would run in shared. Activate
+    # the partition the client was in whenever a new session is opened,
+    # and leave word of where the new session is for the session pool.
+    authenticate = client.session.authenticate
+
+    def authenticate_and_reactivate(*args, **kwargs):
+        r = authenticate(*args, **kwargs)
+        partition = client.current_partition
+        session_id = client.session.session_id
+        if partition != 'shared' and session_id is not None:
+            LOG.debug("A10 session re-authenticated, re-activating partition %s", partition)
+            client.current_partition = 'shared'
+            client.system.partition.active(partition)
+        client.a10_session_partition = (session_id, client.current_partition)
+        return r
+
+    client.session.authenticate = authenticate_and_reactivate
+    return client
+
+
+def new_client(device_info):
+    return _reactivate_after_reauth(acos_client.Client(
+        device_info['host'], device_info['api_version'],
+        device_info['username'], device_info['password'],
+        port=device_info['port'], protocol=device_info['protocol']))
+
+
+def close_client(client):
+    try:
+        client.session.close()
+    except acos_errors.InvalidSessionID:
+        pass
+
+
+def _device_key(device_info):
+    # Everything that goes into building a client; a device whose address or
+    # credentials change gets a fresh set of sessions.
+    return (device_info.get('name'), device_info['host'], device_info['port'],
+            device_info['protocol'], device_info['username'],
+            device_info['password'], str(device_info['api_version']))
+
+
+class _PooledSession(object):
+
+    def __init__(self, key, name, client):
+        self.key = key
+        self.name = name
+        self.client = client
+        self.last_used = time.time()
+        self.partition = 'shared'
+        self.session_id = None
+
+    def active_partition(self):
+        """The partition the session has active, or None if we can't tell."""
+        session_id = self.client.session.session_id
+        if session_id == self.session_id:
+            return self.partition
+
+        # acos_client opened a new session behind our back. new_client()
+        # clients say which partition it ended up in; for anything else
+        # the partition has to be activated again.
+        known = getattr(self.client, 'a10_session_partition', None)
+        if not isinstance(known, tuple) or known[0] != session_id:
+            return None
+        self.session_id, self.partition = known
+        return self.partition
+
+
+class _KnownPartitions(object):
+
+    def __init__(self):
+        self.names = set()
+        self.complete = False
+
+
+class SessionPool(object):
+    """Per-device pool of authenticated aXAPI sessions.
+
+    A10 contexts borrow a client with acquire() and hand it back with
+    release() instead of logging in and out for every operation. At most
+    max_idle sessions are kept per device; anything borrowed beyond that is
+    closed when it comes back. Sessions left idle for longer than
+    idle_timeout seconds are logged off rather than reused, which should be
+    set below the appliance's own session timeout so that we never hand out
+    a session the device has already forgotten.
+
+    The pool also remembers which partition each session has active and
+    which partitions exist on each device, so that callers going through
+    activate_partition() only switch partitions when they have to.
+    """
+
+    def __init__(self, max_idle=4, idle_timeout=60, client_factory=None):
+        self.max_idle = max_idle
+        self.idle_timeout = idle_timeout
+        self._client_factory = client_factory or new_client
+        self._lock = threading.Lock()
+        self._idle = collections.defaultdict(collections.deque)
+        self._borrowed = {}
+        self._partitions = collections.defaultdict(_KnownPartitions)
+        self._last_sweep = time.time()
+
+    def acquire(self, device_info, client_factory=None, partition=None):
+        """Borrow a client for a device.
+
+        Callers that select their own partition pass it as a hint, and get a
+        session already parked there if one is idle. Without a hint the
+        session is handed out in the shared partition.
+        """
+        key = _device_key(device_info)
+        now = time.time()
+        entry = None
+
+        with self._lock:
+            expired = self._expire(key, now)
+            entry = self._take_idle(self._idle[key], partition)
+            expired.extend(self._maybe_sweep(now))
+
+        self._close_all(expired)
+
+        if entry is not None and partition is None:
+            try:
+                self._activate(entry, 'shared')
+            except Exception:
+                self._close_all([entry])
+                entry = None
+
+        if entry is None:
+            factory = client_factory or self._client_factory
+            entry = _PooledSession(key, device_info.get('name'), factory(device_info))
+            LOG.debug("SessionPool: new session for device %s", entry.name)
+
+        with self._lock:
+            self._borrowed[id(entry.client)] = entry
+
+        return entry.client
+
+    def release(self, client, discard=False):
+        with self._lock:
+            entry = self._borrowed.pop(id(client), None)
+
+        if entry is None:
+            # Not one of ours (hooks are free to build their own clients)
+            close_client(client)
+            return
+
+        if not discard and entry.key is not None:
+            entry.last_used = time.time()
+            with self._lock:
+                idle = self._idle[entry.key]
+                if len(idle) < self.max_idle:
+                    idle.append(entry)
+                    return
+
+        self._close_all([entry])
+
+    def tracks(self, client):
+        with self._lock:
+            return id(client) in self._borrowed
+
+    def activate_partition(self, client, name):
+        """Make `name` the active partition of a borrowed session.
+
+        Returns False if the session was already there and nothing was sent
+        to the device.
+        """
+        with self._lock:
+            entry = self._borrowed[id(client)]
+        return self._activate(entry, name)
+
+    def partition_exists(self, device_info, client, name):
+        """True or False if we know whether a partition exists, else None.
+
+        The partition list of an aXAPI v3 device is read once with the
+        given client; after that the list is kept up to date through
+        partition_created() and partition_deleted().
+        """
+        if name == 'shared':
+            return True
+
+        known = self._known_partitions(device_info, client)
+        with self._lock:
+            if name in known.names:
+                return True
+            if known.complete:
+                return False
+        return None
+
+    def partition_created(self, device_info, name):
+        with self._lock:
+            self._partitions[device_info.get('name')].names.add(name)
+
+    def partition_deleted(self, device_info, name):
+        with self._lock:
+            self._partitions[device_info.get('name')].names.discard(name)
+
+    def invalidate(self, device_name):
+        """Log off every idle session for a device, e.g. after a config change.
+
+        Sessions that are currently borrowed are discarded when released.
+        """
+        with self._lock:
+            stale = []
+            for key in [k for k in self._idle if k[0] == device_name]:
+                stale.extend(self._idle.pop(key))
+            for entry in self._borrowed.values():
+                if entry.name == device_name:
+                    entry.key = None
+            self._partitions.pop(device_name, None)
+        self._close_all(stale)
+
+    def close_all(self):
+        with self._lock:
+            stale = []
+            for idle in self._idle.values():
+                stale.extend(idle)
+            self._idle.clear()
+        self._close_all(stale)
+
+    def idle_count(self, device_name=None):
+        with self._lock:
+            return sum(len(v) for k, v in self._idle.items()
+                       if device_name is None or k[0] == device_name)
+
+    def _take_idle(self, idle, partition):
+        # LIFO, so that the warmest session gets reused and the surplus
+        # ages out; but a warm session in the wanted partition wins.
+        if not idle:
+            return None
+        for i in range(len(idle) - 1, -1, -1):
+            if idle[i].active_partition() == (partition or 'shared'):
+                entry = idle[i]
+                del idle[i]
+                return entry
+        return idle.pop()
+
+    def _activate(self, entry, name):
+        current = entry.active_partition()
+        if current == name:
+            return False
+
+        # acos_client keeps its own notion of the active partition, which
+        # goes stale when it re-authenticates; ours is authoritative, and
+        # when we don't know, the switch is always sent.
+        entry.client.current_partition = current
+        entry.client.system.partition.active(name)
+        entry.partition = name
+        entry.session_id = entry.client.session.session_id
+        return True
+
+    def _known_partitions(self, device_info, client):
+        name = device_info.get('name')
+        with self._lock:
+            known = self._partitions[name]
+            if known.complete or str(device_info['api_version']) != '3.0':
+                return known
+
+        try:
+            z = client.system.partition.all()
+            names = set(p['partition-name'] for p in
+                        z['partition-all']['oper'].get('partition-list', []))
+        except Exception:
+            LOG.debug("SessionPool: unable to list partitions on %s", name)
+            return known
+
+        with self._lock:
+            known.names.update(names)
+            known.complete = True
+        return known
+
+    def _expire(self, key, now):
+        expired = []
+        idle = self._idle.get(key)
+        while idle and now - idle[0].last_used > self.idle_timeout:
+            expired.append(idle.popleft())
+        return expired
+
+    def _maybe_sweep(self, now):
+        if now - self._last_sweep < self.idle_timeout:
+            return []
+        self._last_sweep = now
+        expired = []
+        for key in list(self._idle):
+            expired.extend(self._expire(key, now))
+            if not self._idle[key]:
+                del self._idle[key]
+        return expired
+
+    def _close_all(self, entries):
+        for entry in entries:
+            try:
+                close_client(entry.client)
+            except Exception:
+                LOG.debug("SessionPool: error closing session for %s", entry.name)
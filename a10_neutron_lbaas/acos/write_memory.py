@@ -0,0 +1,221 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import logging
+import threading
+import time
+
+import acos_client.errors as acos_errors
+
+LOG = logging.getLogger(__name__)
+
+
+class _PendingWrite(object):
+
+    def __init__(self, device_cfg, partition, now):
+        self.device_cfg = device_cfg
+        self.partition = partition
+        self.first = now
+        self.last = now
+        self.count = 1
+        self.failures = 0
+        self.retry_at = None
+
+    def due(self, window, max_delay):
+        due = min(self.last + window, self.first + max_delay)
+        if self.retry_at is not None:
+            due = max(due, self.retry_at)
+        return due
+
+
+class WriteMemoryScheduler(object):
+    """Collapses bursts of write memory calls per (device, partition).
+
+    A write context schedules a save instead of running one; the save happens
+    in a background worker once no further writes have arrived for `window`
+    seconds, and never later than `max_delay` seconds after the first
+    pending write. A save that fails is tried again, `retry_interval`
+    seconds later and doubling up to `max_retry_interval`, unless its
+    partition has been deleted since. stop() flushes anything still
+    pending.
+    """
+
+    def __init__(self, driver, window=1.0, max_delay=10.0, retry_interval=5.0,
+                 max_retry_interval=300.0):
+        self.driver = driver
+        self.window = window
+        self.max_delay = max_delay
+        self.retry_interval = retry_interval
+        self.max_retry_interval = max_retry_interval
+        self._cond = threading.Condition()
+        self._pending = {}
+        self._stats = {}
+        self._worker = None
+        self._stopped = False
+
+    def schedule(self, device_cfg, partition):
+        now = time.time()
+        key = (device_cfg['name'], partition)
+
+        with self._cond:
+            self._count(device_cfg['name'], 'requested')
+            if self._stopped:
+                pending = _PendingWrite(device_cfg, partition, now)
+            else:
+                pending = self._pending.get(key)
+                if pending is None:
+                    self._pending[key] = _PendingWrite(device_cfg, partition, now)
+                else:
+                    pending.device_cfg = device_cfg
+                    pending.last = now
+                    pending.count += 1
+                    pending = None
+                self._start_worker()
+                self._cond.notify()
+                return
+
+        # Late arrivals after shutdown are written synchronously
+        self._write(pending)
+
+    def partition_deleted(self, device_name, partition):
+        """Forget any pending save for a partition that is gone."""
+        with self._cond:
+            self._pending.pop((device_name, partition), None)
+
+    def flush(self):
+        with self._cond:
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for p in pending:
+            self._write(p)
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        self.flush()
+
+    def stats(self):
+        """Per-device counts of requested and performed saves."""
+        with self._cond:
+            return dict((k, dict(v)) for k, v in self._stats.items())
+
+    def _count(self, device_name, counter, n=1):
+        d = self._stats.setdefault(device_name, {
+            'requested': 0, 'written': 0, 'coalesced': 0, 'failed': 0})
+        d[counter] += n
+
+    def _start_worker(self):
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name='a10-write-memory')
+            self._worker.daemon = True
+            self._worker.start()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if self._stopped:
+                    return
+                ready = self._take_due(time.time())
+                if not ready:
+                    timeout = None
+                    if self._pending:
+                        timeout = max(0, min(
+                            p.due(self.window, self.max_delay)
+                            for p in self._pending.values()) - time.time())
+                    self._cond.wait(timeout)
+                    continue
+
+            for p in ready:
+                if not self._write(p):
+                    self._retry(p)
+
+    def _take_due(self, now):
+        ready = []
+        for key, p in list(self._pending.items()):
+            if p.due(self.window, self.max_delay) <= now:
+                ready.append(self._pending.pop(key))
+        return ready
+
+    def _retry(self, pending):
+        name = pending.device_cfg['name']
+        key = (name, pending.partition)
+        with self._cond:
+            if self._stopped:
+                return
+            pending.failures += 1
+            delay = min(self.max_retry_interval,
+                        self.retry_interval * 2 ** (pending.failures - 1))
+            pending.retry_at = time.time() + delay
+
+            newer = self._pending.get(key)
+            if newer is not None:
+                # Saved along with the writes that came in since
+                newer.first = min(newer.first, pending.first)
+                newer.count += pending.count
+                newer.failures = pending.failures
+                newer.retry_at = pending.retry_at
+            else:
+                self._pending[key] = pending
+            self._cond.notify()
+
+        LOG.warning("A10 write memory: retrying %s, partition %s, in %d seconds",
+                    name, pending.partition, delay)
+
+    def _gone(self, client, device_cfg, partition):
+        pool = getattr(self.driver, 'session_pool', None)
+        if pool is None or partition is None:
+            return False
+        try:
+            return pool.partition_exists(device_cfg, client, partition) is False
+        except Exception:
+            return False
+
+    def _write(self, pending):
+        """Returns False if the save failed and should be tried again."""
+        device_cfg = pending.device_cfg
+        name = device_cfg['name']
+        try:
+            client = self.driver._get_a10_client(device_cfg)
+        except Exception:
+            LOG.exception("A10 write memory: unable to connect to %s", name)
+            with self._cond:
+                self._count(name, 'failed')
+            return False
+
+        discard = False
+        try:
+            try:
+                client.system.action.activate_and_write(pending.partition)
+            except acos_errors.InvalidSessionID:
+                discard = True
+
+            self.driver._ha_sync(client, device_cfg)
+
+            with self._cond:
+                self._count(name, 'written')
+                self._count(name, 'coalesced', pending.count - 1)
+            return True
+        except Exception:
+            if self._gone(client, device_cfg, pending.partition):
+                LOG.info("A10 write memory: partition %s is gone from %s, not saving",
+                         pending.partition, name)
+                return True
+            LOG.exception("A10 write memory: save failed on %s, partition %s",
+                          name, pending.partition)
+            with self._cond:
+                self._count(name, 'failed')
+            return False
+        finally:
+            self.driver._release_a10_client(client, discard=discard)
@@ -0,0 +1,79 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import logging
+import os
+import threading
+
+LOG = logging.getLogger(__name__)
+
+
+def _file_id(path):
+    # Editors that write a new file and rename it over the old one change
+    # the inode; in-place writes change the mtime or size.
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime, st.st_size)
+
+
+class ConfigWatcher(object):
+    """Reloads config.py in the background when the file changes.
+
+    The file is checked every `interval` seconds. When it has changed, the
+    driver's A10Config re-reads it, and if it is valid the driver is told
+    which devices changed. A file that fails to load is logged and ignored,
+    and is tried again only once it changes again.
+    """
+
+    def __init__(self, driver, interval=5):
+        self.driver = driver
+        self.interval = interval
+        self._file_id = _file_id(driver.config.config_path)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='a10-config-watcher')
+            self._thread.daemon = True
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def check(self):
+        """Reload if the file changed. Returns the changed devices, or None."""
+        file_id = _file_id(self.driver.config.config_path)
+        if file_id is None or file_id == self._file_id:
+            return None
+        self._file_id = file_id
+
+        try:
+            changed = self.driver.config.reload()
+        except Exception:
+            LOG.exception("A10 config: %s is invalid, keeping the running config",
+                          self.driver.config.config_path)
+            return None
+
+        self.driver._config_changed(changed)
+        return changed
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                LOG.exception("A10 config: reload failed")
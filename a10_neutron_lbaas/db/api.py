@@ -11,51 +11,165 @@
 #    under the License.
 
 from contextlib import contextmanager
+import os
+import threading
 
 import sqlalchemy
+import sqlalchemy.engine.url
+import sqlalchemy.event
+import sqlalchemy.exc
 import sqlalchemy.ext.declarative
 import sqlalchemy.orm
 
 from a10_neutron_lbaas import a10_exceptions as ex
 
+# Inserting a row whose unique key is taken; neutron's sessions raise
+# oslo.db's translation instead of IntegrityError
+try:
+    from oslo_db import exception as db_exc
+    DUPLICATE_ERRORS = (sqlalchemy.exc.IntegrityError, db_exc.DBDuplicateEntry)
+except ImportError:
+    DUPLICATE_ERRORS = (sqlalchemy.exc.IntegrityError,)
+
 A10_CFG = None
 Base = sqlalchemy.ext.declarative.declarative_base()
 
+# One engine (and so one connection pool) and one sessionmaker per url, for
+# the life of the process.
+_ENGINES = {}
+_SESSIONMAKERS = {}
+_LOCK = threading.Lock()
+
+# Per-thread count of open write scopes; see begin_writes()
+_LOCAL = threading.local()
+
 
 def get_base():
     return Base
 
 
-def get_engine(url=None):
+def _config_get(key):
+    if A10_CFG is not None:
+        return A10_CFG.get(key)
+    from a10_neutron_lbaas.etc import defaults
+    return defaults.GLOBAL_DEFAULTS.get(key)
+
+
+def _engine_args(url):
+    args = {
+        'pool_recycle': _config_get('database_pool_recycle'),
+        'pool_pre_ping': _config_get('database_pool_pre_ping'),
+    }
+    # sqlite uses pools that have no notion of a size
+    if sqlalchemy.engine.url.make_url(url).get_backend_name() != 'sqlite':
+        args['pool_size'] = _config_get('database_pool_size')
+        args['max_overflow'] = _config_get('database_max_overflow')
+    return dict((k, v) for k, v in args.items() if v is not None)
+
+
+def _fork_safe(engine):
+    # neutron forks its API workers after we may already have connected;
+    # a connection inherited from the parent is never used by the child.
+    @sqlalchemy.event.listens_for(engine, "connect")
+    def connect(dbapi_connection, connection_record):
+        connection_record.info['pid'] = os.getpid()
+
+    @sqlalchemy.event.listens_for(engine, "checkout")
+    def checkout(dbapi_connection, connection_record, connection_proxy):
+        pid = os.getpid()
+        if connection_record.info.get('pid', pid) != pid:
+            connection_record.connection = connection_proxy.connection = None
+            raise sqlalchemy.exc.DisconnectionError(
+                "Connection record belongs to pid %s, attempting to check out in pid %s" %
+                (connection_record.info['pid'], pid))
+
+
+def begin_writes():
+    """Send every read on this thread to the primary until end_writes().
+
+    Write contexts hold this open, so that they read back what they (or the
+    device selection before them) just wrote, rather than a lagging replica.
+    """
+    _LOCAL.writes = getattr(_LOCAL, 'writes', 0) + 1
+
+
+def end_writes():
+    _LOCAL.writes = max(0, getattr(_LOCAL, 'writes', 0) - 1)
+
+
+def in_writes():
+    return getattr(_LOCAL, 'writes', 0) > 0
+
+
+def _resolve_url(url, readonly):
+    """Returns the url to use, and whether it is the read replica."""
     global A10_CFG
 
-    if url is None:
-        if A10_CFG is None:
-            from a10_neutron_lbaas import a10_config
-            A10_CFG = a10_config.A10Config()
+    if url is not None:
+        return url, False
+
+    if A10_CFG is None:
+        from a10_neutron_lbaas import a10_config
+        A10_CFG = a10_config.A10Config.shared()
+
+    if not A10_CFG.get('use_database'):
+        raise ex.InternalError("attempted to use database when it is disabled")
+    url = A10_CFG.get('database_connection')
+    replica = A10_CFG.get('database_replica_connection')
+    if readonly and not in_writes() and replica and replica != url:
+        return replica, True
+    return url, False
+
 
-        if not A10_CFG.get('use_database'):
-            raise ex.InternalError("attempted to use database when it is disabled")
-        url = A10_CFG.get('database_connection')
+def get_engine(url=None, readonly=False):
+    return _get_engine(_resolve_url(url, readonly)[0])
 
-    return sqlalchemy.create_engine(url)
 
+def _get_engine(url):
+    with _LOCK:
+        engine = _ENGINES.get(url)
+        if engine is None:
+            engine = sqlalchemy.create_engine(url, **_engine_args(url))
+            _fork_safe(engine)
+            _ENGINES[url] = engine
+        return engine
 
-def get_session(url=None, **kwargs):
-    DBSession = sqlalchemy.orm.sessionmaker(bind=get_engine(url=url))
+
+def get_session(url=None, readonly=False, **kwargs):
+    url, replica = _resolve_url(url, readonly)
+    engine = _get_engine(url)
+    with _LOCK:
+        DBSession = _SESSIONMAKERS.get(engine)
+        if DBSession is None:
+            DBSession = _SESSIONMAKERS[engine] = sqlalchemy.orm.sessionmaker(
+                bind=engine, info={'replica': replica})
     return DBSession(**kwargs)
 
 
+def dispose_engines():
+    """Close every pooled connection and forget the cached engines."""
+    with _LOCK:
+        engines = list(_ENGINES.values())
+        _ENGINES.clear()
+        _SESSIONMAKERS.clear()
+    for engine in engines:
+        engine.dispose()
+
+
 @contextmanager
-def magic_session(db_session=None, url=None):
+def magic_session(db_session=None, url=None, readonly=False):
     """Either does nothing with the session you already have or
     makes one that commits and closes no matter what happens
+
+    A readonly session goes to the read replica, if one is configured and
+    we are not inside a write context. A replica session handed in for
+    anything but reading is passed over for a session on the primary.
     """
 
-    if db_session is not None:
+    if db_session is not None and (readonly or not db_session.info.get('replica')):
         yield db_session
     else:
-        session = get_session(url, expire_on_commit=False)
+        session = get_session(url, readonly=readonly, expire_on_commit=False)
         try:
             try:
                 yield session
@@ -63,3 +177,29 @@ def magic_session(db_session=None, url=None):
                 session.commit()
         finally:
             session.close()
+
+
+def after_commit(db_session, func):
+    """Calls func once db_session commits the transaction it is in.
+
+    If the transaction is rolled back or closed instead, func is dropped.
+    """
+    pending = db_session.info.get('a10_after_commit')
+    if pending is None:
+        pending = db_session.info['a10_after_commit'] = []
+        sqlalchemy.event.listen(db_session, 'after_commit', _run_after_commit)
+        sqlalchemy.event.listen(db_session, 'after_transaction_end', _drop_after_commit)
+    pending.append(func)
+
+
+def _run_after_commit(session):
+    pending = session.info['a10_after_commit']
+    funcs = list(pending)
+    del pending[:]
+    for func in funcs:
+        func()
+
+
+def _drop_after_commit(session, transaction):
+    if transaction.parent is None:
+        del session.info['a10_after_commit'][:]
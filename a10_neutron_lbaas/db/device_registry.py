@@ -0,0 +1,171 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import collections
+import datetime
+import logging
+import threading
+import time
+
+from a10_neutron_lbaas.db import api as db_api
+from a10_neutron_lbaas.db import models
+
+LOG = logging.getLogger(__name__)
+
+# Bumped in a10_generations whenever a device instance is deleted
+GENERATION = 'device_instances'
+
+
+class DeviceRegistry(object):
+    """In-memory index of the a10_device_instances table.
+
+    The table is read in full once. After that only rows whose updated_at is
+    no more than `refresh_margin` seconds before the newest one already seen
+    are read, and deletions are picked up by checking the ids still present
+    when the 'device_instances' generation moves. updated_at is stamped
+    before the row commits, so a write that takes a while to commit can land
+    behind rows already seen; the margin has to cover the longest such
+    write. Refreshes happen at most every `refresh_interval` seconds, in a
+    background thread, while lookups are served from the index as it stands.
+    """
+
+    def __init__(self, refresh_interval=10, refresh_margin=60):
+        self.refresh_interval = refresh_interval
+        self.refresh_margin = datetime.timedelta(seconds=refresh_margin)
+        self._lock = threading.Lock()
+        self._by_name = {}
+        self._by_id = {}
+        self._by_tenant = collections.defaultdict(set)
+        self._watermark = None
+        self._generation = None
+        self._refreshed_at = None
+        self._refreshing = False
+        self._version = 0
+
+    def version(self, db_session=None):
+        """A number that changes whenever any device is added, changed or removed."""
+        self._maybe_refresh(db_session)
+        with self._lock:
+            return self._version
+
+    def get(self, name, db_session=None):
+        self._maybe_refresh(db_session)
+        with self._lock:
+            device = self._by_name.get(name)
+        if device is not None:
+            return device
+
+        # Possibly created since the last refresh
+        instance = models.A10DeviceInstance.find_by(name=name, db_session=db_session)
+        if instance is None:
+            return None
+        with self._lock:
+            self._add(instance)
+            return self._by_name[name]
+
+    def all(self, db_session=None):
+        self._maybe_refresh(db_session)
+        with self._lock:
+            return dict(self._by_name)
+
+    def for_tenant(self, tenant_id, db_session=None):
+        self._maybe_refresh(db_session)
+        with self._lock:
+            return [self._by_name[n] for n in sorted(self._by_tenant.get(tenant_id, ()))]
+
+    def refresh(self, db_session=None):
+        with db_api.magic_session(db_session, readonly=True) as db:
+            generation = models.A10Generation.current(GENERATION, db_session=db)
+
+            q = db.query(models.A10DeviceInstance)
+            watermark = self._watermark
+            if watermark is not None:
+                q = q.filter(
+                    models.A10DeviceInstance.updated_at >= watermark - self.refresh_margin)
+            changed = q.all()
+
+            ids = None
+            if self._generation is not None and generation != self._generation:
+                ids = set(x for x, in db.query(models.A10DeviceInstance.id))
+
+        with self._lock:
+            for instance in changed:
+                self._add(instance)
+                if self._watermark is None or instance.updated_at > self._watermark:
+                    self._watermark = instance.updated_at
+            if ids is not None:
+                for gone in set(self._by_id) - ids:
+                    self._remove(gone)
+            self._generation = generation
+            self._refreshed_at = time.time()
+
+        LOG.debug("A10 device registry: %d changed, %d devices",
+                  len(changed), len(self._by_name))
+
+    def _maybe_refresh(self, db_session):
+        with self._lock:
+            if self._refreshed_at is None:
+                background = False
+            elif self._refreshing:
+                return
+            elif time.time() - self._refreshed_at < self.refresh_interval:
+                return
+            else:
+                background = True
+            self._refreshing = True
+
+        if not background:
+            # Nothing to serve yet, so the first load is done inline
+            try:
+                self.refresh(db_session)
+            finally:
+                with self._lock:
+                    self._refreshing = False
+            return
+
+        t = threading.Thread(target=self._background_refresh, name='a10-device-registry')
+        t.daemon = True
+        t.start()
+
+    def _background_refresh(self):
+        try:
+            self.refresh()
+        except Exception:
+            LOG.exception("A10 device registry: refresh failed")
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def _add(self, instance):
+        old = self._by_id.get(instance.id)
+        if old is not None and old != instance.name:
+            self._remove(instance.id)
+
+        device = instance.as_dict()
+        if self._by_name.get(instance.name) != device:
+            self._version += 1
+        self._by_id[instance.id] = instance.name
+        self._by_name[instance.name] = device
+        self._by_tenant[instance.tenant_id].add(instance.name)
+
+    def _remove(self, id):
+        name = self._by_id.pop(id)
+        device = self._by_name.pop(name, None)
+        self._version += 1
+        if device is not None:
+            names = self._by_tenant.get(device.get('tenant_id'))
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del self._by_tenant[device.get('tenant_id')]
@@ -26,7 +26,7 @@ config = context.config
 
 # Override db location
 if getattr(config, 'connection', None) is None:
-    a10_cfg = a10_config.A10Config()
+    a10_cfg = a10_config.A10Config.shared()
     if not a10_cfg.get('use_database'):
         raise ex.InternalError("database not enabled")
     config.set_main_option("sqlalchemy.url", a10_cfg.get('database_connection'))
@@ -0,0 +1,54 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""a10_generations
+
+Revision ID: 5f0a3c7b9d21
+Revises: c4e1caaa618d
+Create Date: 2026-10-18 10:12:41.118204
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '5f0a3c7b9d21'
+down_revision = 'c4e1caaa618d'
+branch_labels = None
+depends_on = None
+
+import datetime  # noqa
+
+from alembic import op  # noqa
+import sqlalchemy as sa  # noqa
+
+
+# The counters the driver bumps, seeded so that workers never race to
+# insert them
+GENERATIONS = ['tenant_bindings', 'device_instances']
+
+
+def upgrade():
+    generations = op.create_table(
+        'a10_generations',
+        sa.Column('name', sa.String(64), primary_key=True, nullable=False),
+        sa.Column('generation', sa.Integer, nullable=False),
+        sa.Column('created_at', sa.DateTime, nullable=False),
+        sa.Column('updated_at', sa.DateTime, nullable=False)
+    )
+
+    now = datetime.datetime.now()
+    op.bulk_insert(generations, [
+        {'name': name, 'generation': 0, 'created_at': now, 'updated_at': now}
+        for name in GENERATIONS])
+
+
+def downgrade():
+    op.drop_table('a10_generations')
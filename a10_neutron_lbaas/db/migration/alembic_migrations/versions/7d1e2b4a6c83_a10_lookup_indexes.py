@@ -0,0 +1,76 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""a10 lookup indexes
+
+Revision ID: 7d1e2b4a6c83
+Revises: 5f0a3c7b9d21
+Create Date: 2026-10-18 14:03:27.560918
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '7d1e2b4a6c83'
+down_revision = '5f0a3c7b9d21'
+branch_labels = None
+depends_on = None
+
+import datetime  # noqa
+
+from alembic import op  # noqa
+import sqlalchemy as sa  # noqa
+
+
+def _delete_duplicates(table_name, column_name):
+    # Nothing stopped two workers from writing the same row before; keep
+    # the oldest one of each.
+    table = sa.table(table_name, sa.column('id'), sa.column(column_name),
+                     sa.column('created_at'))
+    column = table.c[column_name]
+    conn = op.get_bind()
+
+    dups = conn.execute(
+        sa.select([column]).group_by(column).having(sa.func.count() > 1)).fetchall()
+    for value, in dups:
+        rows = conn.execute(
+            sa.select([table.c.id, table.c.created_at]).where(column == value)).fetchall()
+        rows.sort(key=lambda r: (r.created_at is not None, r.created_at or datetime.datetime.min,
+                                 r.id))
+        conn.execute(table.delete().where(table.c.id.in_([r.id for r in rows[1:]])))
+
+
+def upgrade():
+    _delete_duplicates('a10_tenant_bindings', 'tenant_id')
+    _delete_duplicates('a10_slbs', 'loadbalancer_id')
+    op.create_unique_constraint(
+        'uniq_a10_tenant_bindings0tenant_id', 'a10_tenant_bindings', ['tenant_id'])
+    op.create_unique_constraint(
+        'uniq_a10_slbs0loadbalancer_id', 'a10_slbs', ['loadbalancer_id'])
+    # Device names are up to 1024 characters, more than MySQL will index
+    op.create_index(
+        'ix_a10_device_instances_name', 'a10_device_instances', ['name'],
+        mysql_length=255)
+    op.create_index(
+        'ix_a10_device_instances_updated_at', 'a10_device_instances', ['updated_at'])
+    op.create_index(
+        'ix_a10_certificatelistenerbindings_listener_id',
+        'a10_certificatelistenerbindings', ['listener_id'])
+
+
+def downgrade():
+    op.drop_index('ix_a10_certificatelistenerbindings_listener_id',
+                  'a10_certificatelistenerbindings')
+    op.drop_index('ix_a10_device_instances_updated_at', 'a10_device_instances')
+    op.drop_index('ix_a10_device_instances_name', 'a10_device_instances')
+    op.drop_constraint('uniq_a10_slbs0loadbalancer_id', 'a10_slbs', type_='unique')
+    op.drop_constraint('uniq_a10_tenant_bindings0tenant_id', 'a10_tenant_bindings',
+                       type_='unique')
@@ -30,13 +30,41 @@ def _get_date():
     return datetime.datetime.now()
 
 
+class _ColumnInfo(object):
+    """Mapper metadata for one model class, worked out on first use."""
+
+    def __init__(self, cls):
+        mapper = inspect(cls)
+        self.keys = []
+        self.defaults = []
+        self.onupdates = []
+        for key, column in mapper.columns.items():
+            self.keys.append(key)
+            if column.default is not None:
+                arg = column.default.arg
+                self.defaults.append((key, callable(arg), arg))
+            if column.onupdate is not None:
+                arg = column.onupdate.arg
+                self.onupdates.append((key, callable(arg), arg))
+        self.primary_key = [mapper.get_property_by_column(c).key for c in mapper.primary_key]
+
+    def fill(self, row, defaults):
+        for key, is_callable, arg in defaults:
+            if key not in row:
+                row[key] = arg(None) if is_callable else arg
+        return row
+
+
+_COLUMN_INFO = {}
+
+
 class A10Base(Base):
     __abstract__ = True
 
     @classmethod
     @contextmanager
     def _query(cls, db_session=None):
-        with db_api.magic_session(db_session) as db:
+        with db_api.magic_session(db_session, readonly=True) as db:
             yield db.query(cls)
 
     @classmethod
@@ -65,15 +93,20 @@ class A10Base(Base):
         with cls._query(db_session) as q:
             return q.all()
 
+    @classmethod
+    def _column_info(cls):
+        info = _COLUMN_INFO.get(cls)
+        if info is None:
+            info = _COLUMN_INFO[cls] = _ColumnInfo(cls)
+        return info
+
     @classmethod
     def create(cls, **kwargs):
         instance = cls(**kwargs)
         # Populate all the unspecified columns with their defaults
-        for key, column in inspect(cls).columns.items():
-            if key not in kwargs and column.default is not None:
-                arg = column.default.arg
-                column_default = arg if callable(arg) else lambda: arg
-                setattr(instance, key, column_default(instance))
+        for key, is_callable, arg in cls._column_info().defaults:
+            if key not in kwargs:
+                setattr(instance, key, arg(instance) if is_callable else arg)
         return instance
 
     @classmethod
@@ -84,10 +117,111 @@ class A10Base(Base):
             db.commit()
             return m
 
+    @classmethod
+    def create_and_flush(cls, db_session=None, **kwargs):
+        """Like create_and_save, but a caller's session is left uncommitted.
+
+        The row is written at once and committed with the rest of the
+        caller's transaction, or not at all.
+        """
+        m = cls.create(**kwargs)
+        with db_api.magic_session(db_session) as db:
+            db.add(m)
+            db.flush()
+            return m
+
+    @classmethod
+    def create_or_find(cls, unique_key, db_session=None, **kwargs):
+        """create_and_flush, or the row already holding the unique key.
+
+        Returns (row, created). When another worker inserts the same key
+        first, the insert is undone on its own, leaving the caller's
+        transaction usable, and the other worker's row is returned. It is
+        read with a locking read, which sees it even from a transaction
+        whose snapshot predates it.
+        """
+        m = cls.create(**kwargs)
+        with db_api.magic_session(db_session) as db:
+            try:
+                with db.begin_nested():
+                    db.add(m)
+                return m, True
+            except db_api.DUPLICATE_ERRORS:
+                pass
+            existing = db.query(cls).filter_by(
+                **{unique_key: kwargs[unique_key]}).with_for_update().first()
+            return existing, False
+
+    @classmethod
+    @contextmanager
+    def _bulk_session(cls, db_session):
+        # A session of our own is rolled back as a whole on failure, rather
+        # than committed with some of the batches in it.
+        with db_api.magic_session(db_session) as db:
+            try:
+                yield db
+            except Exception:
+                if db_session is None:
+                    db.rollback()
+                raise
+
+    @classmethod
+    def bulk_create(cls, rows, db_session=None, batch_size=500):
+        """Insert many rows, given as dicts of column values, in one transaction.
+
+        Rows get the same defaults as create(). Returns the rows as inserted.
+        """
+        info = cls._column_info()
+        rows = [info.fill(dict(r), info.defaults) for r in rows]
+        with cls._bulk_session(db_session) as db:
+            for i in range(0, len(rows), batch_size):
+                db.bulk_insert_mappings(cls, rows[i:i + batch_size])
+        return rows
+
+    @classmethod
+    def bulk_upsert(cls, rows, db_session=None, batch_size=500):
+        """Insert or update many rows, matched on primary key, in one transaction.
+
+        Rows that exist get only the given columns (and updated_at) written;
+        new rows get the same defaults as create(). Returns the rows as
+        written.
+        """
+        info = cls._column_info()
+        pk = info.primary_key
+        pk_columns = [getattr(cls, k) for k in pk]
+        rows = [dict(r) for r in rows]
+        with cls._bulk_session(db_session) as db:
+            for i in range(0, len(rows), batch_size):
+                batch = rows[i:i + batch_size]
+                keyed = [r for r in batch if all(k in r for k in pk)]
+                existing = set()
+                if keyed:
+                    if len(pk) == 1:
+                        q = db.query(pk_columns[0]).filter(
+                            pk_columns[0].in_([r[pk[0]] for r in keyed]))
+                    else:
+                        q = db.query(*pk_columns).filter(sa.or_(*[
+                            sa.and_(*[c == r[k] for c, k in zip(pk_columns, pk)])
+                            for r in keyed]))
+                    existing = set(tuple(x) for x in q)
+
+                inserts, updates = [], []
+                for r in batch:
+                    if tuple(r.get(k) for k in pk) in existing:
+                        updates.append(info.fill(r, info.onupdates))
+                    else:
+                        inserts.append(info.fill(r, info.defaults))
+                if inserts:
+                    db.bulk_insert_mappings(cls, inserts)
+                if updates:
+                    db.bulk_update_mappings(cls, updates)
+        return rows
+
     def as_dict(self):
-        d = dict(self.__dict__)
-        d.pop('_sa_instance_state', None)
-        return d
+        # Loaded column values only; relationships and expired attributes
+        # are left out rather than loaded.
+        d = self.__dict__
+        return dict((k, d[k]) for k in self._column_info().keys if k in d)
 
     def update(self, **kwargs):
         for key in kwargs:
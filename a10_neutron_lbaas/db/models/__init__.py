@@ -15,5 +15,6 @@
 # to allow existing code to run, while it's converted.
 
 from a10_neutron_lbaas.db.models.a10_device_instance import A10DeviceInstance
+from a10_neutron_lbaas.db.models.a10_generation import A10Generation
 from a10_neutron_lbaas.db.models.a10_slb import A10SLB
 from a10_neutron_lbaas.db.models.a10_tenant_binding import A10TenantBinding
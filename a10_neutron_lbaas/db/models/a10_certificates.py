@@ -29,6 +29,9 @@ class Certificate(model_base.A10BaseMixin, model_base.A10Base):
 
 class CertificateListenerBinding(model_base.A10BaseMixin, model_base.A10Base):
     __tablename__ = "a10_certificatelistenerbindings"
+    __table_args__ = (
+        sa.Index('ix_a10_certificatelistenerbindings_listener_id', 'listener_id'),
+    )
     certificate_id = sa.Column(sa.String(36), sa.ForeignKey("a10_certificates.id"),
                                nullable=False)
     certificate = orm.relationship(Certificate, uselist=False)
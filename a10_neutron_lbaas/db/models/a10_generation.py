@@ -0,0 +1,57 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import sqlalchemy as sa
+
+from a10_neutron_lbaas.db import api as db_api
+from a10_neutron_lbaas.db import model_base
+
+
+class A10Generation(model_base.A10Base):
+    """A counter that is bumped whenever rows cached by neutron workers change.
+
+    Workers compare the generation they last saw with the current one to
+    find out that their cache is stale.
+    """
+
+    __tablename__ = 'a10_generations'
+
+    name = sa.Column(sa.String(64), primary_key=True, nullable=False)
+    generation = sa.Column(sa.Integer, nullable=False, default=0)
+
+    @classmethod
+    def current(cls, name, db_session=None):
+        g = cls.get(name, db_session=db_session)
+        if g is None:
+            return 0
+        return g.generation
+
+    @classmethod
+    def bump(cls, name, db_session=None):
+        with db_api.magic_session(db_session) as db:
+            if cls._increment(db, name):
+                return
+            # The migration seeds the rows the driver uses. For any other
+            # name, two workers can both find no row and both insert one;
+            # the loser increments the winner's row instead.
+            try:
+                with db.begin_nested():
+                    db.add(cls.create(name=name, generation=1))
+            except db_api.DUPLICATE_ERRORS:
+                cls._increment(db, name)
+
+    @classmethod
+    def _increment(cls, db, name):
+        return db.query(cls).filter_by(name=name).update(
+            {cls.generation: cls.generation + 1}, synchronize_session=False) > 0
@@ -17,6 +17,9 @@ from a10_neutron_lbaas.db import model_base
 
 class A10SLB(model_base.A10BaseMixin, model_base.A10Base):
     __tablename__ = 'a10_slbs'
+    __table_args__ = (
+        sa.UniqueConstraint('loadbalancer_id', name='uniq_a10_slbs0loadbalancer_id'),
+    )
 
     # For vip specific binding (as opposed to tenant level binding), this will
     # differ from A10TenantBinding, if that row exists at all.
@@ -12,11 +12,15 @@
 
 import sqlalchemy as sa
 
+from a10_neutron_lbaas.db import api as db_api
 from a10_neutron_lbaas.db import model_base
 
 
 class A10TenantBinding(model_base.A10BaseMixin, model_base.A10Base):
     __tablename__ = "a10_tenant_bindings"
+    __table_args__ = (
+        sa.UniqueConstraint('tenant_id', name='uniq_a10_tenant_bindings0tenant_id'),
+    )
 
     device_name = sa.Column(sa.String(1024), nullable=False)
 
@@ -24,3 +28,11 @@ class A10TenantBinding(model_base.A10BaseMixin, model_base.A10Base):
     @classmethod
     def find_by_tenant_id(cls, tenant_id, db_session=None):
         return cls.find_by_attribute('tenant_id', tenant_id, db_session)
+
+    @classmethod
+    def count_by_device(cls, db_session=None):
+        """The number of tenants bound to each device, by device name."""
+        with db_api.magic_session(db_session, readonly=True) as db:
+            rows = db.query(cls.device_name, sa.func.count(cls.id)).group_by(
+                cls.device_name).all()
+        return dict(rows)
@@ -35,17 +35,151 @@
 
 # database_connection = None
 
+# An optional read replica of the database above. Lookups made outside of
+# write operations, such as stats requests and device lookups, are sent
+# there instead of to the primary.
+
+# database_replica_connection = None
+
+# The database engine, and its connection pool, is shared by the whole
+# process. Connections idle for longer than database_pool_recycle seconds
+# are replaced, and with database_pool_pre_ping each connection is checked
+# before it is handed out. Size settings are ignored for sqlite.
+
+# database_pool_size = 10
+# database_max_overflow = 20
+# database_pool_recycle = 3600
+# database_pool_pre_ping = True
+
+# Tenant to device bindings read from the database are cached per process,
+# for up to tenant_binding_cache_size tenants and tenant_binding_cache_ttl
+# seconds. Every tenant_binding_cache_check_interval seconds the cache checks
+# whether another neutron worker changed a binding, and empties itself if so.
+# Set the size to 0 to disable the cache.
+
+# tenant_binding_cache_size = 10000
+# tenant_binding_cache_ttl = 300
+# tenant_binding_cache_check_interval = 5
+
+# Orchestrated devices stored in the database are read once, and then only
+# new, changed and deleted devices are picked up, at most every
+# device_registry_refresh_interval seconds. Each refresh re-reads the devices
+# changed within device_registry_refresh_margin seconds of the newest change
+# already seen, so that a change which took a while to commit is not missed.
+# Set it above the longest a device write can take to commit.
+
+# device_registry_refresh_interval = 10
+# device_registry_refresh_margin = 60
+
 # Should only be set to true if projects have been created with
 # parent-child relationships within openstack.
 
 # use_parent_project = False
 
+# Project parents and children looked up for use_parent_project are cached
+# for this many seconds.
+
+# project_hierarchy_ttl = 300
+
 #
 # Used to persist partitions upon deletion of lb objects
 #
 
 # disable_partition_delete = False
 
+#
+# aXAPI sessions are pooled per device and reused across operations instead
+# of logging in and out for every request. session_pool_size is the number
+# of idle sessions kept per device (0 disables pooling), and sessions idle
+# for longer than session_pool_idle_timeout seconds are logged off. Keep the
+# timeout below the session idle timeout configured on the ACOS devices.
+#
+
+# session_pool_size = 4
+# session_pool_idle_timeout = 60
+
+#
+# By default every write operation is followed by a write memory (and any ha
+# sync) on the device. When write_memory_coalesce_window is set, saves are
+# instead collected per device and partition and performed in the
+# background once no further writes have arrived for that many seconds,
+# but never later than write_memory_max_delay seconds after the first
+# unsaved change. A save that fails is retried, backing off up to every five
+# minutes, until it succeeds or its partition is deleted. Pending saves are
+# flushed when neutron-server exits.
+#
+
+# write_memory_coalesce_window = 0
+# write_memory_max_delay = 10
+
+#
+# If True, the 'ha sync' to the peers in a device's ha_sync_list runs in the
+# background instead of inside the neutron API request. Sync requests for a
+# peer are merged while one is pending and at most one sync per peer is in
+# flight; ha_sync_workers bounds the number of peers synced at once.
+#
+
+# ha_sync_async = False
+# ha_sync_workers = 4
+
+#
+# Load balancer stats on aXAPI v3 devices fetch each listener's service
+# group and member stats in parallel, on up to stats_workers pooled sessions.
+# Set to 1 to make the calls one after another on a single session.
+#
+
+# stats_workers = 4
+
+#
+# When stats_poll_interval is set, a background poller sweeps every aXAPI v3
+# device for load balancer and pool stats every that many seconds, and stats
+# requests are answered from the last sweep as long as it is no older than
+# stats_poll_max_age seconds (default: twice the interval). Objects missing
+# from a fresh sweep are still fetched from the device.
+#
+# Only one neutron worker per host sweeps the devices: the workers elect it
+# with a lock file in stats_poll_state_dir (default: a10-stats-poller under
+# the system temp directory), and the others answer from the snapshots it
+# writes there.
+#
+
+# stats_poll_interval = 0
+# stats_poll_max_age = None
+# stats_poll_state_dir = None
+
+#
+# When config_reload_interval is set, this file is checked for changes every
+# that many seconds and re-read when it changes, without restarting
+# neutron-server. A file that fails to load is logged and the running
+# config is kept. Pooled sessions are dropped only for devices whose entry
+# changed. Settings that size the driver's background workers, pools and
+# caches still need a restart.
+#
+
+# config_reload_interval = 0
+
+#
+# With use_database, new tenants can be placed on the least loaded device
+# instead of by a hash of the tenant id, by setting device_scheduling_filters.
+# Filters drop the devices a tenant can't go on: "capacity" drops devices at
+# any of their max_tenants, max_partitions, max_virtual_servers, max_cpu or
+# max_sessions device settings, and "affinity" keeps a tenant named in
+# device_scheduling_affinity on devices whose "tags" list has its tag.
+# Weighers then score the devices left, each with a multiplier:
+# "free_capacity" (the fraction free of the most used max_* limit),
+# "tenants", "partitions", "virtual_servers", "cpu" and "sessions" (fewest
+# wins). Device loads are refreshed in the background every
+# device_scheduling_refresh_interval seconds; cpu and sessions need aXAPI v3.
+# Filter and weigher classes of your own can be given instead of names.
+# Tenants already bound to a device stay where they are.
+#
+
+# device_scheduling_filters = None
+# device_scheduling_filters = ["capacity", "affinity"]
+# device_scheduling_weighers = {"free_capacity": 1.0}
+# device_scheduling_refresh_interval = 60
+# device_scheduling_affinity = {"<tenant id>": "gold"}
+
 # Sometimes we need things from neutron. We will look in the usual places,
 # but this is here if you need to override the location.
 
@@ -197,6 +331,19 @@ devices = {
     # changes ACOS's running state. Turning this off also disables all ha sync
     # operations, regardless of the settings in ha_sync_list.
     #     "write_memory": True,
+    #
+    # Limits and tags for device_scheduling_filters; None means no limit.
+    #     "max_tenants": None,
+    #     "max_partitions": None,
+    #     "max_virtual_servers": None,
+    #     "max_cpu": None,
+    #     "max_sessions": None,
+    #     "tags": [],
+    #
+    # Share of new tenants placed by hash on this device, relative to the
+    # other devices. Adding or removing a device, or changing its weight,
+    # only moves the tenants that hash onto or off of that device.
+    #     "weight": 1,
     # },
 }
 
@@ -247,3 +394,14 @@ devices = {
 #     }
 # }
 vport_defaults = {}
+
+# Some vport_defaults only make sense for some vports: by default
+# "ha-conn-mirror" is only sent for tcp and udp vports, "template-http" only
+# for http and https vports, and "no-dest-nat" for everything but http and
+# https. These conditions apply to name expression matches too, and can be
+# replaced, or added for other keys, here. "op" is one of "=", "!=", "in"
+# and "not in".
+
+# vport_default_conditions = {
+#     "template-http": {"field": "protocol", "op": "in", "value": ["http", "https"]},
+# }
@@ -20,6 +20,16 @@ GLOBAL_DEFAULTS = {
     "verify_appliances": False,
     "use_database": False,
     "database_connection": None,
+    "database_replica_connection": None,
+    "database_pool_size": 10,
+    "database_max_overflow": 20,
+    "database_pool_recycle": 3600,
+    "database_pool_pre_ping": True,
+    "tenant_binding_cache_size": 10000,
+    "tenant_binding_cache_ttl": 300,
+    "tenant_binding_cache_check_interval": 5,
+    "device_registry_refresh_interval": 10,
+    "device_registry_refresh_margin": 60,
     "neutron_conf_dir": '/etc/neutron',
     "member_name_use_uuid": False,
     "keystone_auth_url": None,
@@ -27,7 +37,24 @@ GLOBAL_DEFAULTS = {
     "plumbing_hooks_class": a10_neutron_lbaas.plumbing_hooks.PlumbingHooks,
     "nova_api_version": "2.1",
     "vport_defaults": {},
-    "use_parent_project": False
+    "vport_default_conditions": {},
+    "use_parent_project": False,
+    "project_hierarchy_ttl": 300,
+    "session_pool_size": 4,
+    "session_pool_idle_timeout": 60,
+    "write_memory_coalesce_window": 0,
+    "write_memory_max_delay": 10,
+    "ha_sync_async": False,
+    "ha_sync_workers": 4,
+    "stats_workers": 4,
+    "stats_poll_interval": 0,
+    "stats_poll_max_age": None,
+    "stats_poll_state_dir": None,
+    "config_reload_interval": 0,
+    "device_scheduling_filters": None,
+    "device_scheduling_weighers": {"free_capacity": 1.0},
+    "device_scheduling_refresh_interval": 60,
+    "device_scheduling_affinity": {},
 }
 
 DEVICE_REQUIRED_FIELDS = [
@@ -0,0 +1,107 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import re
+
+from six import iteritems
+
+# Python 2 allows at most 100 groups in one pattern
+_MAX_GROUPS = 95
+
+# Anything that would mean something else, or fail, once the expression is
+# embedded in a bigger pattern: backreferences, named groups and global
+# inline flags.
+_NOT_COMBINABLE = re.compile(r'\\[1-9]|\(\?P[<=]|\(\?[aiLmsux]+\)')
+
+
+class _Single(object):
+
+    def __init__(self, regex, json):
+        self.regex = re.compile(regex)
+        self.json = json
+
+    def match(self, os_name):
+        if self.regex.search(os_name):
+            return self.json
+
+
+class _Combined(object):
+    """Several expressions tried in one pass, in order.
+
+    Each expression becomes a lookahead alternative anchored at the start of
+    the name, so the first alternative that can match anywhere wins, just as
+    if the expressions were searched one after the other.
+    """
+
+    def __init__(self):
+        self.parts = []
+        self.groups = 0
+        self.json = {}
+        self.regex = None
+
+    def fits(self, regex):
+        return self.groups + 1 + re.compile(regex).groups <= _MAX_GROUPS
+
+    def add(self, regex, json):
+        # The wrapper group closes after any groups of the expression itself,
+        # so it is the one lastindex reports when this alternative matches.
+        self.json[self.groups + 1] = json
+        self.groups += 1 + re.compile(regex).groups
+        self.parts.append('((?=[\\s\\S]*?(?:%s)))' % regex)
+
+    def compile(self):
+        self.regex = re.compile('(?:%s)' % '|'.join(self.parts))
+
+    def match(self, os_name):
+        m = self.regex.match(os_name)
+        if m:
+            return self.json[m.lastindex]
+
+
+class NameMatcher(object):
+    """A compiled *_expressions table.
+
+    match() returns the "json" of the first expression, in table order, whose
+    "regex" is found in the name, or None. Runs of expressions that can be
+    combined are matched with a single regex.
+    """
+
+    def __init__(self, expressions):
+        self.expressions = expressions
+        self._segments = []
+
+        combined = None
+        for k, v in list(iteritems(expressions or {})):
+            regex, json = v["regex"], v["json"]
+            if _NOT_COMBINABLE.search(regex):
+                combined = None
+                self._segments.append(_Single(regex, json))
+                continue
+            if combined is None or not combined.fits(regex):
+                combined = _Combined()
+                self._segments.append(combined)
+            combined.add(regex, json)
+
+        for s in self._segments:
+            if isinstance(s, _Combined):
+                s.compile()
+
+    def match(self, os_name):
+        if not os_name:
+            return None
+        for s in self._segments:
+            json = s.match(os_name)
+            if json is not None:
+                return json
+        return None
@@ -36,7 +36,7 @@ class A10DeviceInstanceDbMixin(common_db_mixin.CommonDbMixin,
 
     def __init__(self, *args, **kwargs):
         super(A10DeviceInstanceDbMixin, self).__init__(*args, **kwargs)
-        self.config = a10_config.A10Config()
+        self.config = a10_config.A10Config.shared()
 
     def _get_a10_device_instance(self, context, a10_device_instance_id):
         try:
@@ -117,6 +117,8 @@ class A10DeviceInstanceDbMixin(common_db_mixin.CommonDbMixin,
                       (id))
             instance = self._get_by_id(context, models.A10DeviceInstance, id)
             context.session.delete(instance)
+            # Tells every worker's device registry to look for deletions
+            models.A10Generation.bump('device_instances', db_session=context.session)
 
     def update_a10_device_instance(self, context, id, a10_device_instance):
         with context.session.begin(subtransactions=True):
@@ -96,7 +96,7 @@ class A10DeviceInstancePlugin(a10_device_instance.A10DeviceInstanceDbMixin):
         """Attempt to create instance using neutron context"""
         LOG.debug("A10DeviceInstancePlugin.create(): a10_device_instance=%s", a10_device_instance)
 
-        config = a10_config.A10Config()
+        config = a10_config.A10Config.shared()
         vthunder_defaults = config.get_vthunder_config()
 
         imgr = instance_manager.InstanceManager.from_config(config, context)
@@ -149,7 +149,7 @@ class A10DeviceInstancePlugin(a10_device_instance.A10DeviceInstanceDbMixin):
         instance = super(A10DeviceInstancePlugin, self).get_a10_device_instance(context,
                                                                                 id)
         nova_instance_id = instance.get("nova_instance_id")
-        config = a10_config.A10Config()
+        config = a10_config.A10Config.shared()
         imgr = instance_manager.InstanceManager.from_config(config, context)
         imgr.delete_instance(nova_instance_id)
 
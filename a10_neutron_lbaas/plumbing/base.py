@@ -12,9 +12,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import acos_client
-
 from a10_neutron_lbaas import a10_exceptions as ex
+from a10_neutron_lbaas.acos import session_pool
 
 
 class BasePlumbingHooks(object):
@@ -22,10 +21,24 @@ class BasePlumbingHooks(object):
     def __init__(self, driver, **kwargs):
         self.driver = driver
         self.client_wrapper_class = None
+        self._tenant_bindings = None
+
+    # Tenant to device bindings, when use_database is on, are looked up
+    # through this cache.
+
+    @property
+    def tenant_bindings(self):
+        if getattr(self, '_tenant_bindings', None) is None:
+            # Imports the db models, so not until a binding is looked up
+            from a10_neutron_lbaas.plumbing import binding_cache
+
+            self._tenant_bindings = binding_cache.TenantBindingCache.from_config(
+                getattr(self.driver, 'config', None))
+        return self._tenant_bindings
 
     # While you can override select_device in hooks to get custom selection
     # behavior, it is much easier to use the 'device_scheduling_filters'
-    # mechanism, as documented in the config file.
+    # mechanism, as documented in the config file (see plumbing.scheduler).
 
     def select_device(self, tenant_id, **kwargs):
         # Not a terribly useful scheduler
@@ -38,11 +51,27 @@ class BasePlumbingHooks(object):
     #                                  db_session=None, **kwargs):
     #     raise ex.NotImplemented()
 
+    # Clients come from the driver's session pool when it is enabled; every
+    # client handed out here must be given back through release_a10_client.
+
     def get_a10_client(self, device_info, **kwargs):
-        return acos_client.Client(
-            device_info['host'], device_info['api_version'],
-            device_info['username'], device_info['password'],
-            port=device_info['port'], protocol=device_info['protocol'])
+        pool = getattr(self.driver, 'session_pool', None)
+        if pool is not None:
+            return pool.acquire(device_info, partition=kwargs.get('partition'))
+        return session_pool.new_client(device_info)
+
+    def release_a10_client(self, client, discard=False, **kwargs):
+        pool = getattr(self.driver, 'session_pool', None)
+        if pool is not None:
+            pool.release(client, discard=discard)
+        else:
+            session_pool.close_client(client)
+
+    # Called after config.py was reloaded, with the names of the devices
+    # that were added, removed or changed.
+
+    def config_changed(self, device_names):
+        pass
 
     # Network plumbing hooks from here on out
 
@@ -0,0 +1,150 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import collections
+import logging
+import threading
+import time
+
+from a10_neutron_lbaas.db import api as db_api
+from a10_neutron_lbaas.db import models
+
+LOG = logging.getLogger(__name__)
+
+GENERATION = 'tenant_bindings'
+
+# Marks a tenant known to have no binding
+_UNBOUND = object()
+
+
+class TenantBindingCache(object):
+    """LRU cache of tenant -> device name, from a10_tenant_bindings.
+
+    Tenants without a binding are remembered too, but only for
+    `check_interval` seconds. Every worker that changes a binding bumps the
+    'tenant_bindings' row of a10_generations, and each cache compares that
+    generation with the one it last saw at most once per `check_interval`,
+    dropping everything when it has moved on. Between checks, looking up a
+    bound tenant does not touch the database at all.
+    """
+
+    def __init__(self, size=10000, ttl=300, check_interval=5):
+        self.size = size
+        self.ttl = ttl
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        self._generation = None
+        self._checked_at = 0
+
+    @classmethod
+    def from_config(cls, config):
+        if config is None:
+            return cls()
+        return cls(size=config.get('tenant_binding_cache_size'),
+                   ttl=config.get('tenant_binding_cache_ttl'),
+                   check_interval=config.get('tenant_binding_cache_check_interval'))
+
+    def get(self, tenant_id, db_session=None):
+        """The name of the device a tenant is bound to, or None."""
+        now = time.time()
+        self._check_generation(now, db_session)
+
+        with self._lock:
+            hit = self._entries.pop(tenant_id, None)
+            if hit is not None and hit[1] > now:
+                self._entries[tenant_id] = hit
+                return None if hit[0] is _UNBOUND else hit[0]
+
+        binding = models.A10TenantBinding.find_by_tenant_id(tenant_id, db_session=db_session)
+        if binding is None:
+            self._put(tenant_id, _UNBOUND, now + self.check_interval)
+            return None
+
+        self._put(tenant_id, binding.device_name, now + self.ttl)
+        return binding.device_name
+
+    def bind(self, tenant_id, device_name, db_session=None):
+        """Save a new binding, and let every other worker know.
+
+        Returns the device the tenant is bound to, which is another one if
+        another worker bound the tenant first. With a db_session of the
+        caller's, the binding is only cached here, and the generation only
+        bumped, once that session commits.
+        """
+        binding, created = models.A10TenantBinding.create_or_find(
+            'tenant_id', tenant_id=tenant_id, device_name=device_name,
+            db_session=db_session)
+        if not created:
+            LOG.debug("A10 tenant %s: bound to %s by another worker first",
+                      tenant_id, binding.device_name)
+            device_name = binding.device_name
+
+        def put():
+            # The bump gets its own short transaction, so that the caller's
+            # does not hold the a10_generations row lock until it commits.
+            if created:
+                self.invalidate(tenant_id)
+            self._put(tenant_id, device_name, time.time() + self.ttl)
+
+        if db_session is None:
+            put()
+        else:
+            db_api.after_commit(db_session, put)
+        return device_name
+
+    def invalidate(self, tenant_id=None, db_session=None):
+        """Forget one tenant (or everybody), here and in every other worker.
+
+        Call this after creating, moving or deleting tenant bindings. Every
+        worker's next generation check waits on the a10_generations row
+        until db_session commits, so keep it short.
+        """
+        with self._lock:
+            if tenant_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(tenant_id, None)
+            expected = None if self._generation is None else self._generation + 1
+
+        models.A10Generation.bump(GENERATION, db_session=db_session)
+        current = models.A10Generation.current(GENERATION, db_session=db_session)
+
+        with self._lock:
+            # Only skip the next flush if ours was the only change
+            if current == expected:
+                self._generation = current
+
+    def _put(self, tenant_id, value, expires):
+        if not self.size:
+            return
+        with self._lock:
+            self._entries.pop(tenant_id, None)
+            self._entries[tenant_id] = (value, expires)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def _check_generation(self, now, db_session):
+        with self._lock:
+            if now - self._checked_at < self.check_interval:
+                return
+            self._checked_at = now
+
+        current = models.A10Generation.current(GENERATION, db_session=db_session)
+        with self._lock:
+            if current != self._generation:
+                if self._generation is not None:
+                    LOG.debug("A10 tenant bindings changed elsewhere, dropping cache")
+                self._entries.clear()
+                self._generation = current
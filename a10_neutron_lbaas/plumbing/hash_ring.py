@@ -0,0 +1,132 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import bisect
+import hashlib
+
+# Points per unit of weight. Together with _hash and the point names below,
+# this matches the ring acos_client.Hash builds, so that tenants placed
+# before stay where they are.
+VNODES = 160
+
+
+def _hash(key):
+    return int(hashlib.md5(str(key).encode('utf-8')).hexdigest(), 16)
+
+
+def device_weights(devices):
+    """Ring nodes for a devices dict; a device's "weight" defaults to 1."""
+    return dict((name, cfg.get('weight', 1)) for name, cfg in devices.items())
+
+
+class HashRing(object):
+    """Weighted consistent hash ring.
+
+    Each node gets VNODES * weight points on the ring, and a key belongs to
+    the node of the first point after the key's hash. Lookups are a binary
+    search. Adding, removing or reweighing a node only hashes that node's
+    points, and only keys between its points change nodes.
+    """
+
+    def __init__(self, nodes=None, vnodes=VNODES):
+        self.vnodes = vnodes
+        self._weights = {}
+        self._ring = {}
+        self._keys = []
+        if nodes is not None:
+            self.update(nodes)
+
+    def __contains__(self, name):
+        return name in self._weights
+
+    def __len__(self):
+        return len(self._weights)
+
+    @property
+    def nodes(self):
+        return dict(self._weights)
+
+    def copy(self):
+        rv = HashRing(vnodes=self.vnodes)
+        rv._weights = dict(self._weights)
+        rv._ring = dict(self._ring)
+        rv._keys = list(self._keys)
+        return rv
+
+    def _points(self, name, weight):
+        return [_hash('%s-%d' % (name, w))
+                for w in range(int(round(self.vnodes * weight)))]
+
+    def add(self, name, weight=1):
+        if name in self._weights:
+            if self._weights[name] == weight:
+                return
+            self.remove(name)
+        points = self._points(name, weight)
+        self._weights[name] = weight
+        for p in points:
+            self._ring[p] = name
+        # Both runs are sorted already, which sorted() merges in linear time
+        self._keys = sorted(self._keys + sorted(points))
+
+    def remove(self, name):
+        weight = self._weights.pop(name)
+        gone = set(p for p in self._points(name, weight) if self._ring.get(p) == name)
+        for p in gone:
+            del self._ring[p]
+        self._keys = [k for k in self._keys if k not in gone]
+
+    def update(self, nodes):
+        """Makes the ring hold exactly nodes, a {name: weight} dict or names.
+
+        Returns the names added, removed or reweighed.
+        """
+        if not isinstance(nodes, dict):
+            nodes = dict((name, 1) for name in nodes)
+        changed = set(self._weights) - set(nodes)
+        for name in changed:
+            self.remove(name)
+        for name, weight in sorted(nodes.items()):
+            if self._weights.get(name) != weight:
+                changed.add(name)
+                self.add(name, weight)
+        return changed
+
+    def get_node(self, key):
+        if not self._keys:
+            return None
+        pos = bisect.bisect(self._keys, _hash(key))
+        if pos == len(self._keys):
+            pos = 0
+        return self._ring[self._keys[pos]]
+
+    # acos_client.Hash compat
+    get_server = get_node
+
+
+def plan_rebalance(ring, nodes, keys):
+    """Which keys would change nodes if ring held nodes instead.
+
+    Returns {key: (current node, new node)} for the keys that would move.
+    The ring itself is left as it is.
+    """
+    new = ring.copy()
+    if not new.update(nodes):
+        return {}
+    moves = {}
+    for key in keys:
+        old_node, new_node = ring.get_node(key), new.get_node(key)
+        if old_node != new_node:
+            moves[key] = (old_node, new_node)
+    return moves
@@ -0,0 +1,321 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import atexit
+import hashlib
+import logging
+import threading
+
+import six
+
+from a10_neutron_lbaas import a10_exceptions as ex
+
+LOG = logging.getLogger(__name__)
+
+# Load metrics, and the device config keys that give each one's limit
+TENANTS = 'tenants'
+PARTITIONS = 'partitions'
+VIRTUAL_SERVERS = 'virtual_servers'
+CPU = 'cpu'
+SESSIONS = 'sessions'
+
+LIMITS = (
+    (TENANTS, 'max_tenants'),
+    (PARTITIONS, 'max_partitions'),
+    (VIRTUAL_SERVERS, 'max_virtual_servers'),
+    (CPU, 'max_cpu'),
+    (SESSIONS, 'max_sessions'),
+)
+
+
+def _numbers(resp, match):
+    # Numeric values anywhere in an aXAPI response whose key passes match()
+    if isinstance(resp, dict):
+        for k, v in resp.items():
+            if isinstance(v, (int, float)) and not isinstance(v, bool) and match(k):
+                yield v
+            else:
+                for x in _numbers(v, match):
+                    yield x
+    elif isinstance(resp, list):
+        for v in resp:
+            for x in _numbers(v, match):
+                yield x
+
+
+def _is_v30(device_cfg):
+    return str(device_cfg.get('api_version')) == '3.0'
+
+
+def probe_partitions(client, device_cfg):
+    if not _is_v30(device_cfg):
+        return None
+    z = client.system.partition.all() or {}
+    return len(z.get('partition-all', {}).get('oper', {}).get('partition-list', []))
+
+
+def probe_virtual_servers(client, device_cfg):
+    # Only the partition the client is in; with ADP, count partitions instead
+    if device_cfg.get('v_method', 'LSI').lower() == 'adp':
+        return None
+    z = client.slb.virtual_server.all() or {}
+    return len(z.get('virtual-server-list', z.get('virtual_server_list', [])))
+
+
+def probe_cpu(client, device_cfg):
+    if not _is_v30(device_cfg):
+        return None
+    usage = list(_numbers(client.system.stats('data-cpu'), lambda k: 'usage' in k))
+    return float(sum(usage)) / len(usage) if usage else None
+
+
+def probe_sessions(client, device_cfg):
+    if not _is_v30(device_cfg):
+        return None
+    conns = list(_numbers(client.system.stats('session'), lambda k: k.endswith('curr-conn')))
+    return sum(conns) if conns else None
+
+
+PROBES = {
+    PARTITIONS: probe_partitions,
+    VIRTUAL_SERVERS: probe_virtual_servers,
+    CPU: probe_cpu,
+    SESSIONS: probe_sessions,
+}
+
+
+class DeviceLoadCache(object):
+    """Load of every device, refreshed in the background.
+
+    Every `interval` seconds each device is asked for its partition and
+    virtual server counts, cpu and sessions, and tenant bindings are counted
+    in the database. Placements made since are added to the tenant counts
+    until the next refresh, so that a burst of new tenants does not all go
+    to the device that looked emptiest. Metrics a device cannot provide, or
+    that failed to load, are left out.
+    """
+
+    def __init__(self, driver, get_devices, interval=60, probes=None):
+        self.driver = driver
+        self.get_devices = get_devices
+        self.interval = interval
+        self.probes = dict(PROBES if probes is None else probes)
+        self._lock = threading.Lock()
+        self._loads = {}
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='a10-device-load')
+            self._thread.daemon = True
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def get(self, name):
+        with self._lock:
+            return dict(self._loads.get(name, {}))
+
+    def note_placement(self, name, device_cfg):
+        with self._lock:
+            load = self._loads.setdefault(name, {})
+            load[TENANTS] = load.get(TENANTS, 0) + 1
+            if device_cfg.get('v_method', 'LSI').lower() == 'adp' and PARTITIONS in load:
+                load[PARTITIONS] += 1
+
+    def refresh(self):
+        tenants = {}
+        if self.driver.config.get('use_database'):
+            from a10_neutron_lbaas.db import models
+
+            try:
+                tenants = models.A10TenantBinding.count_by_device()
+            except Exception:
+                LOG.exception("A10 scheduler: could not count tenant bindings")
+
+        for name, device_cfg in list(self.get_devices().items()):
+            load = self._probe(name, device_cfg)
+            load[TENANTS] = tenants.get(name, 0)
+            with self._lock:
+                self._loads[name] = load
+
+    def _probe(self, name, device_cfg):
+        load = {}
+        try:
+            client = self.driver._get_a10_client(device_cfg)
+        except Exception:
+            LOG.exception("A10 scheduler: could not reach %s", name)
+            return load
+
+        try:
+            for metric, probe in self.probes.items():
+                try:
+                    value = probe(client, device_cfg)
+                except Exception as e:
+                    LOG.debug("A10 scheduler: no %s for %s: %s", metric, name, e)
+                    continue
+                if value is not None:
+                    load[metric] = value
+        finally:
+            self.driver._release_a10_client(client)
+        return load
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception:
+                LOG.exception("A10 scheduler: load refresh failed")
+            self._stop.wait(self.interval)
+
+
+# Filters drop the devices a tenant cannot be placed on.
+
+class CapacityFilter(object):
+    """Devices at or over any of their configured max_* limits."""
+
+    def passes(self, device_cfg, load, request):
+        for metric, key in LIMITS:
+            limit = device_cfg.get(key)
+            if limit is not None and load.get(metric, 0) >= limit:
+                return False
+        return True
+
+
+class AffinityFilter(object):
+    """Devices without the tag the tenant is pinned to, if it is pinned."""
+
+    def passes(self, device_cfg, load, request):
+        tag = request.get('affinity')
+        return tag is None or tag in device_cfg.get('tags', [])
+
+
+# Weighers score the devices that are left; more is better.
+
+class FreeCapacityWeigher(object):
+    """The fraction free of the device's most used max_* limit."""
+
+    def weigh(self, device_cfg, load, request):
+        free = [1.0 - float(load.get(metric, 0)) / device_cfg[key]
+                for metric, key in LIMITS if device_cfg.get(key)]
+        return min(free) if free else -load.get(TENANTS, 0)
+
+
+class _FewestWeigher(object):
+    metric = None
+
+    def weigh(self, device_cfg, load, request):
+        return -load.get(self.metric, 0)
+
+
+class TenantCountWeigher(_FewestWeigher):
+    metric = TENANTS
+
+
+class PartitionCountWeigher(_FewestWeigher):
+    metric = PARTITIONS
+
+
+class VirtualServerCountWeigher(_FewestWeigher):
+    metric = VIRTUAL_SERVERS
+
+
+class CpuWeigher(_FewestWeigher):
+    metric = CPU
+
+
+class SessionWeigher(_FewestWeigher):
+    metric = SESSIONS
+
+
+FILTERS = {
+    'capacity': CapacityFilter,
+    'affinity': AffinityFilter,
+}
+
+WEIGHERS = {
+    'free_capacity': FreeCapacityWeigher,
+    'tenants': TenantCountWeigher,
+    'partitions': PartitionCountWeigher,
+    'virtual_servers': VirtualServerCountWeigher,
+    'cpu': CpuWeigher,
+    'sessions': SessionWeigher,
+}
+
+
+def _instance(x, registry):
+    if isinstance(x, six.string_types):
+        if x not in registry:
+            raise ex.InvalidConfig('unknown device scheduling plugin %s' % x)
+        x = registry[x]
+    return x() if isinstance(x, type) else x
+
+
+def _tie_break(tenant_id, name):
+    # Equal devices are ordered differently for every tenant
+    return hashlib.md5(('%s/%s' % (tenant_id, name)).encode('utf-8')).hexdigest()
+
+
+class Scheduler(object):
+    """Places new tenants on the least loaded eligible device.
+
+    Devices are run through the filters, then each weigher's scores are
+    scaled to 0..1 across the devices left, multiplied by the weigher's
+    multiplier and added up. The highest total wins.
+    """
+
+    def __init__(self, loads, filters=None, weighers=None, affinity=None):
+        self.loads = loads
+        self.filters = [_instance(f, FILTERS) for f in (filters or [])]
+        self.weighers = [(_instance(w, WEIGHERS), m)
+                         for w, m in sorted((weighers or {}).items(), key=str)]
+        self.affinity = affinity or {}
+
+    @classmethod
+    def from_config(cls, driver, get_devices):
+        config = driver.config
+        loads = DeviceLoadCache(
+            driver, get_devices, interval=config.get('device_scheduling_refresh_interval'))
+        scheduler = cls(loads,
+                        filters=config.get('device_scheduling_filters'),
+                        weighers=config.get('device_scheduling_weighers'),
+                        affinity=config.get('device_scheduling_affinity'))
+        loads.start()
+        atexit.register(loads.stop)
+        return scheduler
+
+    def select(self, tenant_id, devices):
+        request = {'tenant_id': tenant_id, 'affinity': self.affinity.get(tenant_id)}
+
+        candidates = [(name, cfg, self.loads.get(name)) for name, cfg in devices.items()]
+        for f in self.filters:
+            candidates = [c for c in candidates if f.passes(c[1], c[2], request)]
+        if not candidates:
+            raise ex.NoDevicesAvailableError(
+                'no A10 device can take tenant %s' % tenant_id)
+
+        totals = dict((c[0], 0.0) for c in candidates)
+        for weigher, multiplier in self.weighers:
+            scores = dict((c[0], weigher.weigh(c[1], c[2], request)) for c in candidates)
+            low, high = min(scores.values()), max(scores.values())
+            if high > low:
+                for name, score in scores.items():
+                    totals[name] += multiplier * (score - low) / (high - low)
+
+        best = min(candidates, key=lambda c: (-totals[c[0]], _tie_break(tenant_id, c[0])))
+        self.loads.note_placement(best[0], best[1])
+        LOG.debug("A10 scheduler: tenant %s -> %s (scores %s)", tenant_id, best[0], totals)
+        return best[1]
@@ -12,12 +12,14 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import acos_client
+import logging
 
 from a10_neutron_lbaas import a10_exceptions as ex
-from a10_neutron_lbaas.db import models
 
 from a10_neutron_lbaas.plumbing import base
+from a10_neutron_lbaas.plumbing import hash_ring
+
+LOG = logging.getLogger(__name__)
 
 
 # The default set of plumbing hooks/scheduler, meant for hardware or manual orchestration
@@ -33,13 +35,63 @@ class PlumbingHooks(base.BasePlumbingHooks):
             self.devices = get_devices_func()
         else:
             self.devices = None
+        self._devices_from_config = self.devices is None
         self.appliance_hash = None
+        self._registry_version = None
+        self.scheduler = None
+        self._scheduler_checked = False
 
     def _late_init(self):
         if self.devices is None:
             self.devices = self.driver.config.get_devices()
         if self.appliance_hash is None:
-            self.appliance_hash = acos_client.Hash(list(self.devices))
+            self.appliance_hash = hash_ring.HashRing(hash_ring.device_weights(self.devices))
+        if not self._scheduler_checked:
+            self._scheduler_checked = True
+            self._init_scheduler()
+
+    def _init_scheduler(self):
+        config = getattr(self.driver, 'config', None)
+        if config is None or config.get('device_scheduling_filters') is None:
+            return
+        # Without saved bindings, a tenant would move whenever the loads did
+        if not config.get('use_database'):
+            LOG.warning("A10 device_scheduling_filters need use_database; "
+                        "placing tenants by hash")
+            return
+
+        from a10_neutron_lbaas.plumbing import scheduler
+
+        self.scheduler = scheduler.Scheduler.from_config(self.driver, lambda: self.devices)
+
+    def config_changed(self, device_names):
+        if not self._devices_from_config or self.devices is None:
+            return
+        self.devices = self.driver.config.get_devices()
+        self._sync_ring()
+
+    def _sync_ring(self):
+        # Tenants only move when the set of devices, or their weights, do.
+        # Other threads may be looking tenants up in the ring meanwhile, so
+        # the new one is built aside and swapped in whole.
+        if self.appliance_hash is None:
+            return
+        weights = hash_ring.device_weights(self.devices)
+        if weights != self.appliance_hash.nodes:
+            ring = self.appliance_hash.copy()
+            ring.update(weights)
+            self.appliance_hash = ring
+
+    def plan_rebalance(self, devices, tenant_ids):
+        """The tenants that would be placed elsewhere if devices were used.
+
+        Returns {tenant_id: (current device name, new device name)}. With
+        use_database, bound tenants stay where they are regardless; this is
+        where they would be placed by hash.
+        """
+        self._late_init()
+        return hash_ring.plan_rebalance(
+            self.appliance_hash, hash_ring.device_weights(devices), tenant_ids)
 
     def _select_device_hash(self, tenant_id):
         self._late_init()
@@ -48,30 +100,50 @@ class PlumbingHooks(base.BasePlumbingHooks):
         s = self.appliance_hash.get_server(tenant_id)
         return self.devices[s]
 
+    def _refresh_devices(self, db_session=None, force=False):
+        # Picks up devices registered in the database since; cheap unless
+        # the registry changed
+        if not self._devices_from_config:
+            return
+        version = self.driver.config.device_registry.version(db_session=db_session)
+        if force or version != self._registry_version:
+            self.devices = self.driver.config.get_devices(db_session=db_session)
+            self._registry_version = version
+            self._sync_ring()
+
     def _select_device_db(self, tenant_id, db_session=None):
         self._late_init()
 
         # See if we have a saved tenant
-        a10 = models.A10TenantBinding.find_by_tenant_id(tenant_id, db_session=db_session)
-        if a10 is not None:
-            if a10.device_name in self.devices:
-                return self.devices[a10.device_name]
-            else:
-                raise ex.DeviceConfigMissing(
-                    'A10 device %s mapped to tenant %s is not present in config; '
-                    'add it back to config or migrate loadbalancers' %
-                    (a10.device_name, tenant_id))
-
-        # Nope, so we hash and save
-        d = self._select_device_hash(tenant_id)
-        models.A10TenantBinding.create_and_save(
-            tenant_id=tenant_id, device_name=d['name'],
-            db_session=db_session)
+        device_name = self.tenant_bindings.get(tenant_id, db_session=db_session)
+        if device_name is not None:
+            self._refresh_devices(db_session)
+            return self._bound_device(tenant_id, device_name)
+
+        self._refresh_devices(db_session, force=True)
+
+        # Nope, so we pick one and save
+        if self.scheduler is not None:
+            d = self.scheduler.select(tenant_id, self.devices)
+        else:
+            d = self._select_device_hash(tenant_id)
+        bound = self.tenant_bindings.bind(tenant_id, d['name'], db_session=db_session)
+        if bound != d['name']:
+            # Another worker placed the tenant first; its choice stands
+            return self._bound_device(tenant_id, bound)
 
         return d
 
+    def _bound_device(self, tenant_id, device_name):
+        if device_name not in self.devices:
+            raise ex.DeviceConfigMissing(
+                'A10 device %s mapped to tenant %s is not present in config; '
+                'add it back to config or migrate loadbalancers' %
+                (device_name, tenant_id))
+        return self.devices[device_name]
+
     def select_device(self, tenant_id, **kwargs):
         if self.driver.config.get('use_database'):
-            return self._select_device_db(tenant_id)
+            return self._select_device_db(tenant_id, db_session=kwargs.get('db_session'))
         else:
             return self._select_device_hash(tenant_id)
@@ -17,6 +17,7 @@ import time
 import acos_client
 
 from a10_neutron_lbaas import a10_exceptions as ex
+from a10_neutron_lbaas.db import api as db_api
 from a10_neutron_lbaas.db import models
 from a10_neutron_lbaas.vthunder import instance_initialization
 from a10_neutron_lbaas.vthunder import instance_manager
@@ -46,7 +47,7 @@ class VThunderPerTenantPlumbingHooks(base.BasePlumbingHooks):
         return instance_manager.InstanceManager.from_config(
             self.driver.config, a10_context.openstack_context)
 
-    def _create_instance(self, tenant_id, a10_context, lbaas_obj, db_session):
+    def _create_instance(self, tenant_id, a10_context, lbaas_obj, db_session, bind=None):
         start = time.time()
         cfg = self.driver.config
         vth = cfg.get_vthunder_config()
@@ -83,19 +84,50 @@ class VThunderPerTenantPlumbingHooks(base.BasePlumbingHooks):
             if x in device_config:
                 del device_config[x]
 
-        models.A10DeviceInstance.create_and_save(
-            db_session=db_session,
-            **device_config)
+        # Saved on its own, rather than with the rest of the operation: the
+        # nova instance exists now whether or not the operation succeeds.
+        # Whatever bind() saves to point at it goes in the same transaction,
+        # so that a failed operation cannot leave the instance orphaned.
+        # bind() returns the device it bound to, which is another worker's
+        # if that worker bound first.
+        bound = device_config['name']
+        with db_api.magic_session() as db:
+            if bind is not None:
+                bound = bind(device_config, db)
+            if bound == device_config['name']:
+                models.A10DeviceInstance.create_and_flush(db_session=db, **device_config)
+
+        if bound != device_config['name']:
+            return self._use_bound_instance(imgr, instance, bound)
 
         device_config.update({
             '_perform_initialization': True
         })
         return device_config
 
+    def _use_bound_instance(self, imgr, instance, device_name):
+        LOG.info("A10 vThunder %s: another worker bound %s first, deleting ours",
+                 instance['nova_instance_id'], device_name)
+        try:
+            imgr.delete_instance(instance['nova_instance_id'])
+        except Exception:
+            LOG.exception("A10 vThunder %s: unable to delete unused instance",
+                          instance['nova_instance_id'])
+
+        device_config = self.driver.config.get_device(device_name)
+        if device_config is None:
+            msg = 'A10 instance %s is not present in db' % device_name
+            LOG.error(msg)
+            raise ex.InstanceMissing(msg)
+        return device_config
+
     def _wait_for_instance(self, device_config):
         start = time.time()
         client = self.get_a10_client(device_config)
-        client.wait_for_connect()
+        try:
+            client.wait_for_connect()
+        finally:
+            self.release_a10_client(client)
         end = time.time()
 
         # XXX(dougwig) - this is a <=4.1.0 after CM bug is fixed
@@ -117,9 +149,9 @@ class VThunderPerTenantPlumbingHooks(base.BasePlumbingHooks):
             'add it back to config or migrate loadbalancers' % tenant_id
         )
 
-        tb = models.A10TenantBinding.find_by_tenant_id(tenant_id, db_session=db_session)
-        if tb is not None:
-            d = self.driver.config.get_device(tb.device_name, db_session=db_session)
+        device_name = self.tenant_bindings.get(tenant_id, db_session=db_session)
+        if device_name is not None:
+            d = self.driver.config.get_device(device_name, db_session=db_session)
             if d is None:
                 LOG.error(missing_instance)
                 raise ex.InstanceMissing(missing_instance)
@@ -133,15 +165,14 @@ class VThunderPerTenantPlumbingHooks(base.BasePlumbingHooks):
             LOG.error(missing_instance)
             raise ex.InstanceMissing(missing_instance)
 
-        device_config = self._create_instance(tenant_id, a10_context, lbaas_obj, db_session)
-        self._wait_for_instance(device_config)
+        # Make sure that we remember where it is, along with the instance.
 
-        # Now make sure that we remember where it is.
+        def bind(device_config, db):
+            return self.tenant_bindings.bind(tenant_id, device_config['name'], db_session=db)
 
-        models.A10TenantBinding.create_and_save(
-            tenant_id=tenant_id,
-            device_name=device_config['name'],
-            db_session=db_session)
+        device_config = self._create_instance(tenant_id, a10_context, lbaas_obj, db_session,
+                                              bind=bind)
+        self._wait_for_instance(device_config)
 
         LOG.debug("select_device, returning new instance %s", device_config)
         return device_config
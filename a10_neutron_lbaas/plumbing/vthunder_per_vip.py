@@ -57,16 +57,20 @@ class VThunderPerVIPPlumbingHooks(vthunder_per_tenant.VThunderPerTenantPlumbingH
             LOG.error(missing_instance)
             raise ex.InstanceMissing(missing_instance)
 
-        device_config = self._create_instance(tenant_id, a10_context, lbaas_obj, db_session)
+        # Make sure that we remember where it is, along with the instance.
+
+        def bind(device_config, db):
+            slb, created = models.A10SLB.create_or_find(
+                'loadbalancer_id',
+                tenant_id=tenant_id,
+                device_name=device_config['name'],
+                loadbalancer_id=root_id,
+                db_session=db)
+            return slb.device_name
+
+        device_config = self._create_instance(tenant_id, a10_context, lbaas_obj, db_session,
+                                              bind=bind)
         self._wait_for_instance(device_config)
 
-        # Now make sure that we remember where it is.
-
-        models.A10SLB.create_and_save(
-            tenant_id=tenant_id,
-            device_name=device_config['name'],
-            loadbalancer_id=root_id,
-            db_session=db_session)
-
         LOG.debug("select_device, returning new instance %s", device_config)
         return device_config
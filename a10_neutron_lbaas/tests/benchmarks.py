@@ -0,0 +1,145 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+
+"""Timings of the driver's hot paths, run by hand rather than by the suite.
+
+    python -m a10_neutron_lbaas.tests.benchmarks [name ...]
+
+Wall clock numbers depend on the machine and whatever else it is doing, so
+they are only printed; the unit tests check the behaviour behind them.
+"""
+
+from __future__ import print_function
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import timeit
+
+import sqlalchemy
+
+import a10_neutron_lbaas
+from a10_neutron_lbaas.db import api as db_api
+from a10_neutron_lbaas.db import models
+from a10_neutron_lbaas import name_expressions
+from a10_neutron_lbaas.tests.unit import test_a10_openstack_lb
+
+
+def _per_call(func, number):
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e6
+
+
+def engine():
+    """Per query cost of a new engine against the cached one."""
+    url = 'sqlite://'
+
+    def query(session):
+        try:
+            session.execute("select 1").scalar()
+        finally:
+            session.close()
+
+    def new_engine():
+        e = sqlalchemy.create_engine(url)
+        query(sqlalchemy.orm.sessionmaker(bind=e)())
+        e.dispose()
+
+    try:
+        print("per query: new engine %.1fus, cached engine %.1fus" % (
+            _per_call(new_engine, 200),
+            _per_call(lambda: query(db_api.get_session(url)), 200)))
+    finally:
+        db_api.dispose_engines()
+
+
+def _create_walking_columns(cls, **kwargs):
+    # create() as it was before the per-class defaults were precomputed
+    instance = cls(**kwargs)
+    for key, column in sqlalchemy.inspect(cls).columns.items():
+        if key not in kwargs and column.default is not None:
+            arg = column.default.arg
+            column_default = arg if callable(arg) else lambda: arg
+            setattr(instance, key, column_default(instance))
+    return instance
+
+
+def model():
+    """create() and as_dict() against the bare SQLAlchemy constructor.
+
+    Also times create() walking the mapper's columns on every call, as it
+    used to, for a before and after.
+    """
+    kwargs = dict(tenant_id='t1', device_name='ax1', loadbalancer_id='lb1')
+    slb = models.A10SLB.create(**kwargs)
+    print("A10SLB(): %.1fus, create() walking columns: %.1fus, create(): %.1fus, "
+          "as_dict(): %.1fus" % (
+              _per_call(lambda: models.A10SLB(**kwargs), 2000),
+              _per_call(lambda: _create_walking_columns(models.A10SLB, **kwargs), 2000),
+              _per_call(lambda: models.A10SLB.create(**kwargs), 2000),
+              _per_call(slb.as_dict, 2000)))
+
+
+def name_matcher():
+    """Matching two names against 1k expressions."""
+    table = dict(("e%d" % i, {"regex": "^tenant%04d-" % i, "json": {"i": i}})
+                 for i in range(1000))
+    matcher = name_expressions.NameMatcher(table)
+    names = ["tenant0999-web", "unmatched-listener"]
+    print("1k expressions, 2 names: %.1fus" % _per_call(
+        lambda: [matcher.match(n) for n in names], 5))
+
+
+def startup():
+    """Importing the driver and initializing it, in a new process."""
+    config_dir = tempfile.mkdtemp()
+    try:
+        with open(os.path.join(config_dir, 'config.py'), 'w') as f:
+            f.write(test_a10_openstack_lb.STARTUP_CONFIG)
+        path = [os.path.dirname(os.path.dirname(a10_neutron_lbaas.__file__))]
+        path += [p for p in os.environ.get('PYTHONPATH', '').split(os.pathsep) if p]
+        env = dict(os.environ, A10_CONFIG_DIR=config_dir, PYTHONPATH=os.pathsep.join(path))
+        out = subprocess.check_output([sys.executable, '-c', _STARTUP], env=env)
+    finally:
+        shutil.rmtree(config_dir)
+    r = json.loads(out.decode('utf-8').strip().splitlines()[-1])
+    print("import a10_openstack_lb %.1fms, _late_init %.1fms" % (
+        r['import'] * 1000, r['late_init'] * 1000))
+
+
+_STARTUP = """
+import json, time
+import mock
+t0 = time.time()
+import a10_neutron_lbaas.a10_openstack_lb as a10_os
+t1 = time.time()
+a10_os.A10OpenstackLBV2(mock.MagicMock(), provider='startup')
+t2 = time.time()
+print(json.dumps({"import": t1 - t0, "late_init": t2 - t1}))
+"""
+
+BENCHMARKS = [engine, model, name_matcher, startup]
+
+
+def main(argv):
+    for b in BENCHMARKS:
+        if not argv or b.__name__ in argv:
+            b()
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -159,3 +159,25 @@ class TestMigrations(test_base.UnitTestBase):
         self.upgrade('heads')
         self.downgrade('base')
         self.upgrade('heads')
+
+    def test_lookup_indexes_drop_duplicates(self):
+        self.upgrade('5f0a3c7b9d21')
+        insert = ("INSERT INTO a10_tenant_bindings (id, tenant_id, device_name, created_at, "
+                  "updated_at) VALUES ('%s', 't1', '%s', '%s', '%s')")
+        for id, device, created in (('b', 'ax2', '2020-01-02'), ('a', 'ax1', '2020-01-01')):
+            self.connection.execute(insert % (id, device, created, created))
+
+        self.upgrade('7d1e2b4a6c83')
+
+        rows = self.connection.execute(
+            "SELECT device_name FROM a10_tenant_bindings WHERE tenant_id = 't1'").fetchall()
+        self.assertEqual([('ax1',)], [tuple(r) for r in rows])
+        self.assertRaises(sqlalchemy.exc.IntegrityError, self.connection.execute,
+                          insert % ('c', 'ax3', '2020-01-03', '2020-01-03'))
+
+    def test_generations_seeded(self):
+        self.upgrade('5f0a3c7b9d21')
+        rows = self.connection.execute(
+            "SELECT name, generation FROM a10_generations ORDER BY name").fetchall()
+        self.assertEqual([('device_instances', 0), ('tenant_bindings', 0)],
+                         [tuple(r) for r in rows])
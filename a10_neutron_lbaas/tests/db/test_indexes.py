@@ -0,0 +1,127 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import datetime
+import os
+import re
+
+from alembic import config as alembic_config
+from alembic import migration
+from alembic import operations
+from alembic import script as alembic_script
+from nose.plugins.attrib import attr
+import sqlalchemy
+
+import a10_neutron_lbaas.tests.test_case as test_case
+
+from a10_neutron_lbaas.db import api as db_api
+from a10_neutron_lbaas.db import migration as a10_migration
+from a10_neutron_lbaas.db import models
+from a10_neutron_lbaas.db.models import a10_certificates
+
+
+@attr(db=True)
+class TestLookupQueryPlans(test_case.TestCase):
+    """The driver's hot lookups must not fall back to full table scans.
+
+    This checks the models; the migration that adds the same indexes to
+    existing databases is covered below and in tests/db/migration.
+    """
+
+    def setUp(self):
+        super(TestLookupQueryPlans, self).setUp()
+        self.engine = sqlalchemy.create_engine('sqlite://')
+        self.addCleanup(self.engine.dispose)
+        db_api.get_base().metadata.create_all(self.engine, tables=[
+            models.A10TenantBinding.__table__,
+            models.A10SLB.__table__,
+            models.A10DeviceInstance.__table__,
+            a10_certificates.Certificate.__table__,
+            a10_certificates.CertificateListenerBinding.__table__])
+        self.session = sqlalchemy.orm.sessionmaker(bind=self.engine)()
+        self.addCleanup(self.session.close)
+
+    def _plan(self, query):
+        stmt = query.statement.compile(self.engine, compile_kwargs={'literal_binds': True})
+        rows = self.engine.execute('EXPLAIN QUERY PLAN %s' % stmt).fetchall()
+        return ' '.join(r[-1] for r in rows)
+
+    def assertIndexed(self, query, index):
+        plan = self._plan(query)
+        self.assertIn(index, plan)
+        self.assertIsNone(re.search(r'SCAN (TABLE )?a10_', plan), plan)
+
+    def test_tenant_binding_by_tenant(self):
+        self.assertIndexed(
+            self.session.query(models.A10TenantBinding).filter_by(tenant_id='t1'),
+            'sqlite_autoindex_a10_tenant_bindings_')
+
+    def test_slb_by_loadbalancer(self):
+        self.assertIndexed(
+            self.session.query(models.A10SLB).filter_by(loadbalancer_id='lb1'),
+            'sqlite_autoindex_a10_slbs_')
+
+    def test_device_instance_by_name(self):
+        self.assertIndexed(
+            self.session.query(models.A10DeviceInstance).filter_by(name='ax1'),
+            'ix_a10_device_instances_name')
+
+    def test_device_instance_by_updated_at(self):
+        self.assertIndexed(
+            self.session.query(models.A10DeviceInstance).filter(
+                models.A10DeviceInstance.updated_at >= datetime.datetime(2026, 1, 1)),
+            'ix_a10_device_instances_updated_at')
+
+    def test_certificate_binding_by_listener(self):
+        self.assertIndexed(
+            self.session.query(a10_certificates.CertificateListenerBinding).filter_by(
+                listener_id='l1'),
+            'ix_a10_certificatelistenerbindings_listener_id')
+
+
+@attr(db=True)
+class TestLookupIndexesMigration(test_case.TestCase):
+
+    def setUp(self):
+        super(TestLookupIndexesMigration, self).setUp()
+        config = alembic_config.Config(
+            os.path.join(os.path.dirname(a10_migration.__file__), 'alembic.ini'))
+        scripts = alembic_script.ScriptDirectory.from_config(config)
+        self.revision = scripts.get_revision('7d1e2b4a6c83').module
+
+        self.engine = sqlalchemy.create_engine('sqlite://')
+        self.addCleanup(self.engine.dispose)
+        self.conn = self.engine.connect()
+        self.addCleanup(self.conn.close)
+        self.conn.execute('CREATE TABLE a10_tenant_bindings '
+                          '(id VARCHAR(36), tenant_id VARCHAR(36), created_at DATETIME)')
+
+    def _insert(self, id, tenant_id, created_at):
+        self.conn.execute('INSERT INTO a10_tenant_bindings VALUES (?, ?, ?)',
+                          (id, tenant_id, created_at))
+
+    def test_duplicates_deleted_oldest_kept(self):
+        self._insert('b', 't1', datetime.datetime(2020, 1, 2))
+        self._insert('a', 't1', datetime.datetime(2020, 1, 1))
+        self._insert('c', 't1', datetime.datetime(2020, 1, 3))
+        self._insert('d', 't2', datetime.datetime(2020, 1, 1))
+        self._insert('e', 't3', None)
+        self._insert('f', 't3', datetime.datetime(2019, 1, 1))
+
+        ctx = migration.MigrationContext.configure(self.conn)
+        with operations.Operations.context(ctx):
+            self.revision._delete_duplicates('a10_tenant_bindings', 'tenant_id')
+
+        rows = self.conn.execute('SELECT tenant_id, id FROM a10_tenant_bindings').fetchall()
+        self.assertEqual([('t1', 'a'), ('t2', 'd'), ('t3', 'e')], sorted(rows))
@@ -0,0 +1,100 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import mock
+from nose.plugins.attrib import attr
+import sqlalchemy
+
+import a10_neutron_lbaas.tests.test_case as test_case
+
+from a10_neutron_lbaas.v2 import neutron_ops
+
+try:
+    from neutron.db.models import l3 as l3_models
+    from neutron_lbaas.db.loadbalancer import models as lb_models
+except ImportError:
+    l3_models = None
+
+# More members than fit in one IN () list
+MEMBERS = neutron_ops._CHUNK * 2 + 1
+
+
+def _address(i):
+    return '10.%d.%d.%d' % (i // 65536, i // 256 % 256, i % 256)
+
+
+@attr(db=True)
+class TestMemberBatches(test_case.TestCase):
+
+    def setUp(self):
+        super(TestMemberBatches, self).setUp()
+        if l3_models is None:
+            self.skipTest("neutron and neutron_lbaas are not installed")
+
+        self.engine = sqlalchemy.create_engine('sqlite://')
+        self.addCleanup(self.engine.dispose)
+        members = lb_models.MemberV2.__table__
+        floating_ips = l3_models.FloatingIP.__table__
+        members.metadata.create_all(self.engine, tables=[members, floating_ips])
+
+        # Each address is a member of t1; every third is also one of t2,
+        # and every fifth one is a member of t1 twice over.
+        rows = []
+        for i in range(MEMBERS):
+            tenants = ['t1'] + (['t2'] if i % 3 == 0 else []) + (['t1'] if i % 5 == 0 else [])
+            for n, tenant_id in enumerate(tenants):
+                rows.append(dict(id='m%d-%d' % (i, n), project_id=tenant_id, pool_id='p1',
+                                 address=_address(i), protocol_port=80 + n,
+                                 admin_state_up=True, provisioning_status='ACTIVE',
+                                 operating_status='ONLINE'))
+        self.engine.execute(members.insert(), rows)
+
+        # Every seventh address has a floating ip
+        self.engine.execute(floating_ips.insert(), [
+            dict(id='f%d' % i, floating_ip_address='172.16.%d.%d' % (i // 256, i % 256),
+                 floating_network_id='n1', floating_port_id='fp%d' % i,
+                 fixed_ip_address=_address(i), standard_attr_id=i)
+            for i in range(0, MEMBERS, 7)])
+
+        session = sqlalchemy.orm.sessionmaker(bind=self.engine)()
+        self.addCleanup(session.close)
+        self.context = mock.Mock(session=session)
+        self.ops = neutron_ops.NeutronOpsV2(mock.Mock())
+        self.members = [mock.Mock(tenant_id='t1', address=_address(i)) for i in range(MEMBERS)]
+
+    def test_member_get_ips(self):
+        ips = self.ops.member_get_ips(self.context, self.members, use_float=True)
+
+        self.assertEqual(MEMBERS, len(ips))
+        for i in range(MEMBERS):
+            expected = _address(i)
+            if i % 7 == 0:
+                expected = '172.16.%d.%d' % (i // 256, i % 256)
+            self.assertEqual(expected, ips[_address(i)])
+
+    def test_member_counts(self):
+        # t2 only asks about some of its addresses, in the last chunk
+        asked = self.members + [mock.Mock(tenant_id='t2', address=_address(i))
+                                for i in range(MEMBERS - 30, MEMBERS)]
+        counts = self.ops.member_counts(self.context, asked)
+
+        # Members nobody has are left out, where member_count says 0
+        expected = dict(((m.tenant_id, m.address), self.ops.member_count(self.context, m))
+                        for m in asked)
+        self.assertEqual(dict((k, v) for k, v in expected.items() if v), counts)
+        self.assertEqual(2, counts[('t1', _address(MEMBERS - 1))])
+        self.assertEqual(1, counts[('t1', _address(MEMBERS - 2))])
+        self.assertEqual(1, counts[('t2', _address(MEMBERS - 2))])
+        self.assertNotIn(('t2', _address(MEMBERS - 3)), counts)
+        self.assertNotIn(('t2', _address(0)), counts)
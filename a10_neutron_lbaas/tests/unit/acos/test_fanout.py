@@ -0,0 +1,82 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+
+import acos_client.errors as acos_errors
+import mock
+
+import a10_neutron_lbaas.tests.test_case as test_case
+
+from a10_neutron_lbaas.acos import fanout
+from a10_neutron_lbaas.acos import session_pool
+
+DEVICE = {'name': 'ax1', 'host': '10.0.0.1', 'port': 443, 'protocol': 'https',
+          'username': 'admin', 'password': 'a10', 'api_version': '3.0'}
+
+
+class TestFanOut(test_case.TestCase):
+
+    def setUp(self):
+        super(TestFanOut, self).setUp()
+        self.clients = []
+        self.pool = session_pool.SessionPool(client_factory=self._client)
+        self.c = mock.Mock(device_cfg=DEVICE, partition_name='p1')
+        self.c.client = self.pool.acquire(DEVICE, partition='p1')
+        self.c._session_pool.return_value = self.pool
+
+    def _client(self, device_info):
+        client = mock.MagicMock()
+        client.session.session_id = 'sess-%d' % len(self.clients)
+        self.clients.append(client)
+        return client
+
+    def test_results_in_order(self):
+        r = fanout.fan_out(self.c, lambda client, i: i * 2, range(10), workers=4)
+        self.assertEqual([i * 2 for i in range(10)], r)
+
+    def test_calls_overlap(self):
+        # Every call waits for the others; only completes if run in parallel
+        barrier = threading.Barrier(3) if hasattr(threading, 'Barrier') else None
+        if barrier is None:
+            self.skipTest("threading.Barrier not available")
+
+        def fn(client, item):
+            barrier.wait(5)
+            return client
+
+        used = fanout.fan_out(self.c, fn, range(3), workers=3)
+        self.assertEqual(3, len(set(id(u) for u in used)))
+
+    def test_borrowed_sessions_use_partition_and_return(self):
+        fanout.fan_out(self.c, lambda client, i: i, range(4), workers=3)
+
+        for client in self.clients[1:]:
+            client.system.partition.active.assert_called_with('p1')
+        self.assertEqual(len(self.clients) - 1, self.pool.idle_count())
+
+    def test_no_pool_sequential(self):
+        self.c._session_pool.return_value = None
+        used = fanout.fan_out(self.c, lambda client, i: client, range(3), workers=3)
+        self.assertEqual([self.c.client] * 3, used)
+        self.assertEqual(1, len(self.clients))
+
+    def test_error_raised(self):
+        def fn(client, i):
+            if i == 2:
+                raise acos_errors.InvalidSessionID()
+            return i
+
+        self.assertRaises(acos_errors.InvalidSessionID,
+                          fanout.fan_out, self.c, fn, range(6), workers=3)
@@ -0,0 +1,84 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import mock
+
+import a10_neutron_lbaas.tests.test_case as test_case
+
+from a10_neutron_lbaas.acos import ha_sync
+
+PEER1 = {'ip': '1.1.1.1', 'username': 'admin', 'password': 'a10'}
+PEER2 = {'ip': '2.2.2.2', 'username': 'admin', 'password': 'a10'}
+
+
+def _device(peers):
+    return {'name': 'ax1', 'ha_sync_list': peers}
+
+
+class TestHASyncExecutor(test_case.TestCase):
+
+    def setUp(self):
+        self.driver = mock.Mock()
+        self.client = self.driver._get_a10_client.return_value
+        self.e = ha_sync.HASyncExecutor(self.driver, workers=2)
+        # Queue work without letting worker threads pick it up
+        self.e._start_workers = mock.Mock()
+
+    def test_merges_pending(self):
+        for x in range(5):
+            self.e.schedule(_device([PEER1]))
+        self.assertEqual(1, len(self.e._ready))
+        self.e.stop()
+        self.client.ha.sync.assert_called_once_with('1.1.1.1', 'admin', 'a10')
+        self.assertEqual(5, self.e.stats()[('ax1', '1.1.1.1')]['requested'])
+        self.assertEqual(1, self.e.stats()[('ax1', '1.1.1.1')]['synced'])
+
+    def test_per_peer(self):
+        self.e.schedule(_device([PEER1, PEER2]))
+        self.e.stop()
+        self.assertEqual(2, self.client.ha.sync.call_count)
+        self.assertEqual(2, self.driver._release_a10_client.call_count)
+
+    def test_request_during_sync_requeues(self):
+        def sync(*args):
+            # A change lands while this peer is syncing
+            self.e.schedule(_device([PEER1]))
+        self.client.ha.sync.side_effect = sync
+
+        self.e.schedule(_device([PEER1]))
+        key = self.e._ready.popleft()
+        self.e._sync(key)
+
+        self.assertEqual(1, self.client.ha.sync.call_count)
+        self.assertEqual([key], list(self.e._ready))
+
+    def test_lag(self):
+        with mock.patch('time.time', return_value=100.0):
+            self.e.schedule(_device([PEER1]))
+        with mock.patch('time.time', return_value=103.0):
+            self.assertEqual(3.0, self.e.lag()[('ax1', '1.1.1.1')])
+        self.e.stop()
+        self.assertEqual(0.0, self.e.lag()[('ax1', '1.1.1.1')])
+
+    def test_failure_counted(self):
+        self.client.ha.sync.side_effect = Exception()
+        self.e.schedule(_device([PEER1]))
+        self.e.stop()
+        self.assertEqual(1, self.e.stats()[('ax1', '1.1.1.1')]['failed'])
+
+    def test_stop_drains_with_workers(self):
+        e = ha_sync.HASyncExecutor(self.driver, workers=1)
+        e.schedule(_device([PEER1]))
+        e.stop()
+        self.client.ha.sync.assert_called_once_with('1.1.1.1', 'admin', 'a10')
@@ -0,0 +1,216 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import acos_client.errors as acos_errors
+import mock
+
+import a10_neutron_lbaas.tests.test_case as test_case
+
+from a10_neutron_lbaas.acos import session_pool
+
+
+def _device(name='ax1', host='10.10.100.20'):
+    return {
+        'name': name,
+        'host': host,
+        'port': 443,
+        'protocol': 'https',
+        'username': 'admin',
+        'password': 'a10',
+        'api_version': '3.0',
+    }
+
+
+def _client(*args, **kwargs):
+    client = mock.MagicMock()
+    client.current_partition = 'shared'
+    return client
+
+
+class TestSessionPool(test_case.TestCase):
+
+    def setUp(self):
+        self.factory = mock.Mock(side_effect=_client)
+        self.pool = session_pool.SessionPool(max_idle=2, idle_timeout=60,
+                                             client_factory=self.factory)
+
+    def test_reuses_released_session(self):
+        c1 = self.pool.acquire(_device())
+        self.pool.release(c1)
+        c2 = self.pool.acquire(_device())
+        self.assertIs(c1, c2)
+        self.assertEqual(1, self.factory.call_count)
+        c1.session.close.assert_not_called()
+
+    def test_sessions_are_per_device(self):
+        c1 = self.pool.acquire(_device('ax1'))
+        self.pool.release(c1)
+        c2 = self.pool.acquire(_device('ax2', host='10.10.100.21'))
+        self.assertIsNot(c1, c2)
+
+    def test_bounded_idle(self):
+        clients = [self.pool.acquire(_device()) for x in range(3)]
+        for c in clients:
+            self.pool.release(c)
+        self.assertEqual(2, self.pool.idle_count('ax1'))
+        clients[2].session.close.assert_called_once_with()
+
+    def test_discard_closes(self):
+        c1 = self.pool.acquire(_device())
+        self.pool.release(c1, discard=True)
+        c1.session.close.assert_called_once_with()
+        self.assertEqual(0, self.pool.idle_count())
+
+    def test_idle_eviction(self):
+        with mock.patch('time.time', return_value=1000.0):
+            c1 = self.pool.acquire(_device())
+            self.pool.release(c1)
+        with mock.patch('time.time', return_value=1061.0):
+            c2 = self.pool.acquire(_device())
+        self.assertIsNot(c1, c2)
+        c1.session.close.assert_called_once_with()
+
+    def _parked(self, partition, session_id='s1'):
+        c = self.pool.acquire(_device(), partition=partition)
+        c.session.session_id = session_id
+        self.pool.activate_partition(c, partition)
+        self.pool.release(c)
+        c.system.partition.active.reset_mock()
+        return c
+
+    def test_activate_partition_skips_when_active(self):
+        c = self._parked('tenant1')
+        c2 = self.pool.acquire(_device(), partition='tenant1')
+        self.assertIs(c, c2)
+        self.assertFalse(self.pool.activate_partition(c2, 'tenant1'))
+        c.system.partition.active.assert_not_called()
+
+    def test_activate_partition_switches(self):
+        c = self._parked('tenant1')
+        self.pool.acquire(_device(), partition='tenant2')
+        self.assertTrue(self.pool.activate_partition(c, 'tenant2'))
+        c.system.partition.active.assert_called_once_with('tenant2')
+
+    def test_acquire_prefers_session_in_partition(self):
+        c1 = self.pool.acquire(_device(), partition='tenant1')
+        c2 = self.pool.acquire(_device(), partition='tenant2')
+        c1.session.session_id = 's1'
+        c2.session.session_id = 's2'
+        self.pool.activate_partition(c1, 'tenant1')
+        self.pool.activate_partition(c2, 'tenant2')
+        self.pool.release(c1)
+        self.pool.release(c2)
+        self.assertIs(c1, self.pool.acquire(_device(), partition='tenant1'))
+
+    def test_acquire_without_hint_returns_shared(self):
+        c = self._parked('tenant1')
+        self.assertIs(c, self.pool.acquire(_device()))
+        c.system.partition.active.assert_called_once_with('shared')
+
+    def test_reauthenticated_session_is_switched(self):
+        c = self._parked('tenant1')
+        c.session.session_id = 's2'
+        self.pool.acquire(_device(), partition='tenant1')
+        self.assertTrue(self.pool.activate_partition(c, 'tenant1'))
+        c.system.partition.active.assert_called_once_with('tenant1')
+
+    def test_known_partitions(self):
+        c = self.pool.acquire(_device())
+        c.system.partition.all.return_value = {
+            'partition-all': {'oper': {'partition-list': [{'partition-name': 'p1'}]}}}
+        self.assertTrue(self.pool.partition_exists(_device(), c, 'p1'))
+        self.assertFalse(self.pool.partition_exists(_device(), c, 'p2'))
+        self.pool.partition_created(_device(), 'p2')
+        self.assertTrue(self.pool.partition_exists(_device(), c, 'p2'))
+        self.pool.partition_deleted(_device(), 'p1')
+        self.assertFalse(self.pool.partition_exists(_device(), c, 'p1'))
+        self.assertEqual(1, c.system.partition.all.call_count)
+
+    def test_known_partitions_v21_unknown(self):
+        device = _device()
+        device['api_version'] = '2.1'
+        c = self.pool.acquire(device)
+        self.assertIsNone(self.pool.partition_exists(device, c, 'p1'))
+        c.system.partition.all.assert_not_called()
+
+    def test_release_unknown_client_closes(self):
+        c = _client()
+        self.pool.release(c)
+        c.session.close.assert_called_once_with()
+
+    def test_invalidate(self):
+        c1 = self.pool.acquire(_device())
+        c2 = self.pool.acquire(_device())
+        self.pool.release(c1)
+        self.pool.invalidate('ax1')
+        c1.session.close.assert_called_once_with()
+        self.pool.release(c2)
+        c2.session.close.assert_called_once_with()
+        self.assertEqual(0, self.pool.idle_count())
+
+
+class TestReauth(test_case.TestCase):
+
+    def setUp(self):
+        super(TestReauth, self).setUp()
+        self.calls = []
+        self.drop = [False]
+        self.client = session_pool.new_client(_device())
+        self.client.http = mock.Mock()
+        self.client.http.post.return_value = {'authresponse': {'signature': 'new'}}
+        self.client.http.request.side_effect = self._request
+        self.client.session.http = self.client.http
+
+    def _request(self, method, url, *args, **kwargs):
+        self.calls.append(url)
+        if self.drop[0]:
+            # The device forgot the session; acos_client logs in again
+            self.drop[0] = False
+            raise acos_errors.InvalidSessionID()
+        return {}
+
+    def _get_dropped(self):
+        self.drop[0] = True
+        with mock.patch('time.sleep'):
+            self.client.slb.virtual_server.get('vs1')
+
+    def test_partition_reactivated_after_reauth(self):
+        self.client.session.session_id = 'old'
+        self.client.current_partition = 'p1'
+        self._get_dropped()
+
+        self.assertEqual(['/axapi/v3/slb/virtual-server/vs1',
+                          '/axapi/v3/active-partition/p1',
+                          '/axapi/v3/slb/virtual-server/vs1'], self.calls)
+        self.assertEqual('p1', self.client.current_partition)
+        self.assertEqual('new', self.client.session.session_id)
+
+    def test_pool_sees_reactivated_partition(self):
+        pool = session_pool.SessionPool(client_factory=lambda device: self.client)
+        self.client.session.session_id = 'old'
+        pool.acquire(_device(), partition='p1')
+        pool.activate_partition(self.client, 'p1')
+        self._get_dropped()
+        pool.release(self.client)
+        del self.calls[:]
+
+        # The new session is in p1, so shared work must switch back
+        self.assertIs(self.client, pool.acquire(_device()))
+        self.assertEqual(['/axapi/v3/active-partition/shared'], self.calls)
+        pool.release(self.client)
+        del self.calls[:]
+
+        self.assertIs(self.client, pool.acquire(_device(), partition='shared'))
+        self.assertFalse(pool.activate_partition(self.client, 'shared'))
+        self.assertEqual([], self.calls)
@@ -0,0 +1,118 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import mock
+
+import a10_neutron_lbaas.tests.test_case as test_case
+
+from a10_neutron_lbaas.acos import write_memory
+
+
+def _device(name='ax1', ha_sync_list=[]):
+    return {'name': name, 'ha_sync_list': ha_sync_list}
+
+
+class TestWriteMemoryScheduler(test_case.TestCase):
+
+    def setUp(self):
+        self.driver = mock.Mock()
+        self.client = self.driver._get_a10_client.return_value
+        # A long window keeps the worker from flushing behind our backs
+        self.s = write_memory.WriteMemoryScheduler(self.driver, window=300, max_delay=600)
+
+    def tearDown(self):
+        self.s.stop()
+
+    def test_coalesces_burst(self):
+        for x in range(3):
+            self.s.schedule(_device(), 'p1')
+        self.s.flush()
+        self.client.system.action.activate_and_write.assert_called_once_with('p1')
+        self.driver._release_a10_client.assert_called_once_with(self.client, discard=False)
+        stats = self.s.stats()['ax1']
+        self.assertEqual(3, stats['requested'])
+        self.assertEqual(1, stats['written'])
+        self.assertEqual(2, stats['coalesced'])
+
+    def test_keyed_by_partition(self):
+        self.s.schedule(_device(), 'p1')
+        self.s.schedule(_device(), 'p2')
+        self.s.flush()
+        self.assertEqual(2, self.client.system.action.activate_and_write.call_count)
+
+    def test_ha_sync_after_write(self):
+        ha = [{'ip': '1.1.1.1', 'username': 'admin', 'password': 'a10'}]
+        device = _device(ha_sync_list=ha)
+        self.s.schedule(device, 'p1')
+        self.s.flush()
+        self.driver._ha_sync.assert_called_once_with(self.client, device)
+
+    def test_stop_flushes(self):
+        self.s.schedule(_device(), 'p1')
+        self.s.stop()
+        self.client.system.action.activate_and_write.assert_called_once_with('p1')
+
+    def test_write_after_stop_is_synchronous(self):
+        self.s.stop()
+        self.s.schedule(_device(), 'p1')
+        self.client.system.action.activate_and_write.assert_called_once_with('p1')
+
+    def test_max_delay_bounds_window(self):
+        p = write_memory._PendingWrite(_device(), 'p1', 100.0)
+        p.last = 650.0
+        self.assertEqual(700.0, p.due(300, 600))
+        p.last = 150.0
+        self.assertEqual(450.0, p.due(300, 600))
+
+    def test_failed_write_counted(self):
+        self.client.system.action.activate_and_write.side_effect = Exception()
+        self.s.schedule(_device(), 'p1')
+        self.s.flush()
+        self.assertEqual(1, self.s.stats()['ax1']['failed'])
+        self.driver._release_a10_client.assert_called_once_with(self.client, discard=False)
+
+    def test_failed_write_retried_with_backoff(self):
+        self.client.system.action.activate_and_write.side_effect = Exception()
+        p = write_memory._PendingWrite(_device(), 'p1', 100.0)
+        with mock.patch('time.time', return_value=1000.0):
+            self.assertFalse(self.s._write(p))
+            self.s._retry(p)
+            self.assertIs(p, self.s._pending[('ax1', 'p1')])
+            self.assertEqual(1005.0, p.due(300, 600))
+
+            self.s._pending.clear()
+            self.s._retry(p)
+            self.assertEqual(1010.0, p.retry_at)
+
+    def test_retry_merges_with_newer_write(self):
+        p = write_memory._PendingWrite(_device(), 'p1', 100.0)
+        self.s.schedule(_device(), 'p1')
+        self.s._retry(p)
+        newer = self.s._pending[('ax1', 'p1')]
+        self.assertIsNot(p, newer)
+        self.assertEqual(2, newer.count)
+        self.assertEqual(1, newer.failures)
+
+    def test_deleted_partition_dropped(self):
+        self.s.schedule(_device(), 'p1')
+        self.s.partition_deleted('ax1', 'p1')
+        self.s.flush()
+        self.client.system.action.activate_and_write.assert_not_called()
+
+    def test_gone_partition_not_retried(self):
+        self.client.system.action.activate_and_write.side_effect = Exception()
+        self.driver.session_pool.partition_exists.return_value = False
+        p = write_memory._PendingWrite(_device(), 'p1', 100.0)
+        self.assertTrue(self.s._write(p))
+        self.assertEqual(0, self.s.stats().get('ax1', {}).get('failed', 0))
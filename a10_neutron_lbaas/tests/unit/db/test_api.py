@@ -0,0 +1,189 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import os
+import shutil
+import tempfile
+
+import mock
+import sqlalchemy
+
+import a10_neutron_lbaas.tests.test_case as test_case
+
+from a10_neutron_lbaas.db import api as db_api
+from a10_neutron_lbaas.db import models
+
+URL = 'sqlite://'
+
+
+class TestEngineCache(test_case.TestCase):
+
+    def setUp(self):
+        super(TestEngineCache, self).setUp()
+        db_api.dispose_engines()
+        self.addCleanup(db_api.dispose_engines)
+
+    def test_engine_per_url(self):
+        self.assertIs(db_api.get_engine(URL), db_api.get_engine(URL))
+        self.assertIsNot(db_api.get_engine(URL), db_api.get_engine('sqlite:///:memory:'))
+
+    def test_sessionmaker_cached(self):
+        with mock.patch.object(sqlalchemy.orm, 'sessionmaker',
+                               wraps=sqlalchemy.orm.sessionmaker) as m:
+            db_api.get_session(URL).close()
+            db_api.get_session(URL).close()
+        self.assertEqual(1, m.call_count)
+
+    def test_session_kwargs(self):
+        session = db_api.get_session(URL, expire_on_commit=False)
+        self.assertFalse(session.expire_on_commit)
+        session.close()
+
+    def test_pool_args(self):
+        with mock.patch.object(db_api, 'A10_CFG') as cfg:
+            cfg.get.side_effect = {
+                'database_pool_size': 7,
+                'database_max_overflow': 3,
+                'database_pool_recycle': 60,
+                'database_pool_pre_ping': True}.get
+            args = db_api._engine_args('mysql+pymysql://u:p@localhost/neutron')
+        self.assertEqual({'pool_size': 7, 'max_overflow': 3, 'pool_recycle': 60,
+                          'pool_pre_ping': True}, args)
+
+    def test_sqlite_pool_args(self):
+        args = db_api._engine_args(URL)
+        self.assertNotIn('pool_size', args)
+        self.assertNotIn('max_overflow', args)
+
+    def test_dispose(self):
+        engine = db_api.get_engine(URL)
+        db_api.dispose_engines()
+        self.assertIsNot(engine, db_api.get_engine(URL))
+
+    def test_forked_connection_replaced(self):
+        engine = db_api.get_engine('sqlite:///:memory:')
+        conn = engine.connect()
+        record = conn.connection._connection_record
+        first = record.connection
+        conn.close()
+
+        # Pretend that connection was made in our parent process
+        record.info['pid'] = os.getpid() + 1
+        conn = engine.connect()
+        self.assertIsNot(first, conn.connection.connection)
+        self.assertEqual(1, conn.execute("select 1").scalar())
+        conn.close()
+
+
+class TestReplicaRouting(test_case.TestCase):
+
+    def setUp(self):
+        super(TestReplicaRouting, self).setUp()
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        self.primary = 'sqlite:///' + os.path.join(tmp, 'primary.db')
+        self.replica = 'sqlite:///' + os.path.join(tmp, 'replica.db')
+
+        self.cfg = {'use_database': True,
+                    'database_connection': self.primary,
+                    'database_replica_connection': self.replica}
+        cfg = mock.Mock()
+        cfg.get.side_effect = lambda k: self.cfg.get(k)
+        patcher = mock.patch.object(db_api, 'A10_CFG', cfg)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(db_api.dispose_engines)
+
+        for url in (self.primary, self.replica):
+            db_api.get_base().metadata.create_all(
+                db_api.get_engine(url), tables=[models.A10TenantBinding.__table__])
+
+        # A row that has not made it to the replica yet
+        models.A10TenantBinding.create_and_save(tenant_id='t1', device_name='ax1')
+
+    def _find(self):
+        return models.A10TenantBinding.find_by_tenant_id('t1')
+
+    def test_writes_go_to_primary(self):
+        with db_api.magic_session(url=self.primary) as db:
+            self.assertEqual(1, db.query(models.A10TenantBinding).count())
+        with db_api.magic_session(url=self.replica) as db:
+            self.assertEqual(0, db.query(models.A10TenantBinding).count())
+
+    def test_reads_go_to_replica(self):
+        self.assertIsNone(self._find())
+
+    def test_reads_in_writes_go_to_primary(self):
+        db_api.begin_writes()
+        try:
+            self.assertEqual('ax1', self._find().device_name)
+        finally:
+            db_api.end_writes()
+        self.assertIsNone(self._find())
+
+    def test_replica_session_not_written(self):
+        with db_api.magic_session(readonly=True) as db:
+            self.assertTrue(db.info['replica'])
+            models.A10TenantBinding.create_and_save(
+                tenant_id='t2', device_name='ax2', db_session=db)
+            self.assertIsNone(models.A10TenantBinding.find_by_tenant_id('t2', db_session=db))
+        with db_api.magic_session(url=self.primary) as db:
+            self.assertEqual(2, db.query(models.A10TenantBinding).count())
+
+    def test_no_replica(self):
+        self.cfg['database_replica_connection'] = None
+        self.assertEqual('ax1', self._find().device_name)
+
+    def test_writes_nest(self):
+        db_api.begin_writes()
+        db_api.begin_writes()
+        db_api.end_writes()
+        self.assertTrue(db_api.in_writes())
+        db_api.end_writes()
+        self.assertFalse(db_api.in_writes())
+
+
+class TestAfterCommit(test_case.TestCase):
+
+    def setUp(self):
+        super(TestAfterCommit, self).setUp()
+        db_api.dispose_engines()
+        self.addCleanup(db_api.dispose_engines)
+        self.session = db_api.get_session(URL)
+        self.addCleanup(self.session.close)
+        self.calls = []
+
+    def _add(self):
+        self.session.execute('select 1')
+        db_api.after_commit(self.session, lambda: self.calls.append(1))
+
+    def test_commit(self):
+        self._add()
+        self.assertEqual([], self.calls)
+        self.session.commit()
+        self.assertEqual([1], self.calls)
+        self.session.commit()
+        self.assertEqual([1], self.calls)
+
+    def test_rollback(self):
+        self._add()
+        self.session.rollback()
+        self.session.commit()
+        self.assertEqual([], self.calls)
+
+    def test_close(self):
+        self._add()
+        self.session.close()
+        self.session.commit()
+        self.assertEqual([], self.calls)
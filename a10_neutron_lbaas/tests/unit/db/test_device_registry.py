@@ -0,0 +1,174 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import datetime
+import os
+import shutil
+import tempfile
+
+import mock
+
+import a10_neutron_lbaas.tests.test_case as test_case
+
+from a10_neutron_lbaas.db import api as db_api
+from a10_neutron_lbaas.db import device_registry
+from a10_neutron_lbaas.db import models
+
+
+class _InlineThread(object):
+
+    def __init__(self, target=None, name=None):
+        self.target = target
+        self.daemon = False
+
+    def start(self):
+        self.target()
+
+
+class TestDeviceRegistry(test_case.TestCase):
+
+    def setUp(self):
+        super(TestDeviceRegistry, self).setUp()
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        url = 'sqlite:///' + os.path.join(tmp, 'a10.db')
+
+        cfg = mock.Mock()
+        cfg.get.side_effect = {'use_database': True, 'database_connection': url}.get
+        patcher = mock.patch.object(db_api, 'A10_CFG', cfg)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(db_api.dispose_engines)
+
+        engine = db_api.get_engine()
+        db_api.get_base().metadata.create_all(engine, tables=[
+            models.A10DeviceInstance.__table__, models.A10Generation.__table__])
+
+        patcher = mock.patch.object(device_registry.threading, 'Thread', _InlineThread)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.now = [1000.0]
+        patcher = mock.patch.object(device_registry.time, 'time',
+                                    side_effect=lambda: self.now[0])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.registry = device_registry.DeviceRegistry(refresh_interval=10)
+
+    def _create(self, name, tenant_id='t1', **kwargs):
+        return models.A10DeviceInstance.create_and_save(
+            name=name, tenant_id=tenant_id, username='admin', password='a10',
+            api_version='3.0', protocol='https', port=443, autosnat=False,
+            v_method='LSI', shared_partition='shared', use_float=False,
+            ipinip=False, write_memory=True, nova_instance_id='nova-' + name,
+            host='10.0.0.1', **kwargs)
+
+    def _update(self, instance, updated_at, **kwargs):
+        with db_api.magic_session() as db:
+            db.query(models.A10DeviceInstance).get(instance.id).update(
+                updated_at=updated_at, **kwargs)
+
+    def _expire(self):
+        self.now[0] += 11
+
+    def test_get(self):
+        self._create('ax1')
+        self.assertEqual('ax1', self.registry.get('ax1')['name'])
+        self.assertIsNone(self.registry.get('ax2'))
+
+    def test_miss_added_without_refresh(self):
+        self.registry.refresh()
+        self._create('ax1')
+        with mock.patch.object(self.registry, 'refresh') as refresh:
+            self.assertEqual('ax1', self.registry.get('ax1')['name'])
+            self.assertEqual(['ax1'], list(self.registry.all()))
+        refresh.assert_not_called()
+
+    def test_served_from_index_until_stale(self):
+        self._create('ax1')
+        self.registry.all()
+        self._create('ax2')
+        self.assertEqual(['ax1'], list(self.registry.all()))
+        self._expire()
+        self.assertEqual(['ax1', 'ax2'], sorted(self.registry.all()))
+
+    def test_incremental_refresh(self):
+        long_ago = datetime.datetime.now() - datetime.timedelta(hours=1)
+        self._create('ax1', created_at=long_ago, updated_at=long_ago)
+        old = self._create('ax2')
+        self.registry.refresh()
+
+        self._update(old, old.updated_at + datetime.timedelta(seconds=1), host='10.0.0.2')
+
+        with mock.patch.object(models.A10DeviceInstance, 'as_dict',
+                               autospec=True,
+                               side_effect=lambda self: {'name': self.name,
+                                                         'host': self.host,
+                                                         'tenant_id': self.tenant_id}) as as_dict:
+            self.registry.refresh()
+        self.assertEqual(['ax2'], [c[0][0].name for c in as_dict.call_args_list])
+        self.assertEqual('10.0.0.2', self.registry.get('ax2')['host'])
+
+    def test_late_commit_within_margin(self):
+        ax1 = self._create('ax1')
+        ax2 = self._create('ax2')
+        self._update(ax2, ax1.updated_at + datetime.timedelta(seconds=30))
+        self.registry.refresh()
+
+        # Stamped before ax2's update but committed after it
+        self._update(ax1, ax1.updated_at + datetime.timedelta(seconds=5), host='10.0.0.2')
+        self.registry.refresh()
+        self.assertEqual('10.0.0.2', self.registry.get('ax1')['host'])
+
+    def test_delete_seen_through_generation(self):
+        self._create('ax1')
+        ax2 = self._create('ax2', tenant_id='t2')
+        self.registry.refresh()
+
+        with db_api.magic_session() as db:
+            db.query(models.A10DeviceInstance).filter_by(id=ax2.id).delete()
+        self.registry.refresh()
+        self.assertIn('ax2', self.registry.all())
+
+        models.A10Generation.bump(device_registry.GENERATION)
+        self._expire()
+        self.assertEqual(['ax1'], list(self.registry.all()))
+        self.assertEqual([], self.registry.for_tenant('t2'))
+
+    def test_version(self):
+        self._create('ax1')
+        v1 = self.registry.version()
+        self.registry.refresh()
+        self.assertEqual(v1, self.registry.version())
+
+        self._create('ax2')
+        self._expire()
+        self.registry.version()
+        self.assertNotEqual(v1, self.registry.version())
+
+    def test_for_tenant(self):
+        self._create('ax1')
+        self._create('ax2', tenant_id='t2')
+        self._create('ax3')
+        self.assertEqual(['ax1', 'ax3'],
+                         [d['name'] for d in self.registry.for_tenant('t1')])
+
+    def test_background_failure_keeps_index(self):
+        self._create('ax1')
+        self.registry.all()
+        self._expire()
+        with mock.patch.object(self.registry, 'refresh', side_effect=Exception):
+            self.assertEqual(['ax1'], list(self.registry.all()))
+        self.assertFalse(self.registry._refreshing)
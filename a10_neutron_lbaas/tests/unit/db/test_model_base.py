@@ -0,0 +1,214 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import datetime
+import os
+import shutil
+import tempfile
+
+import mock
+from sqlalchemy.inspection import inspect
+
+import a10_neutron_lbaas.tests.test_case as test_case
+
+from a10_neutron_lbaas.db import api as db_api
+from a10_neutron_lbaas.db import models
+
+
+def _slb():
+    return models.A10SLB.create(tenant_id='t1', device_name='ax1',
+                                loadbalancer_id='lb1')
+
+
+class TestA10Base(test_case.TestCase):
+
+    def test_create_defaults(self):
+        slb = _slb()
+        self.assertEqual(36, len(slb.id))
+        self.assertIsInstance(slb.created_at, datetime.datetime)
+        self.assertIsInstance(slb.updated_at, datetime.datetime)
+
+    def test_create_scalar_default(self):
+        self.assertEqual(0, models.A10Generation.create(name='x').generation)
+
+    def test_create_keeps_given_values(self):
+        slb = models.A10SLB.create(id='fixed', tenant_id='t1', device_name='ax1',
+                                   loadbalancer_id='lb1')
+        self.assertEqual('fixed', slb.id)
+
+    def test_as_dict(self):
+        slb = _slb()
+        d = slb.as_dict()
+        self.assertEqual('ax1', d['device_name'])
+        self.assertEqual(slb.id, d['id'])
+        self.assertNotIn('_sa_instance_state', d)
+
+    def test_as_dict_columns_only(self):
+        slb = _slb()
+        slb.__dict__['not_a_column'] = 1
+        d = slb.as_dict()
+        self.assertNotIn('not_a_column', d)
+        self.assertLessEqual(set(d), set(inspect(models.A10SLB).columns.keys()))
+
+    def test_column_info_per_class(self):
+        self.assertNotEqual(models.A10SLB._column_info().keys,
+                            models.A10Generation._column_info().keys)
+
+    def test_mapper_walked_once(self):
+        slb = _slb()
+        with mock.patch('a10_neutron_lbaas.db.model_base.inspect') as inspect_:
+            _slb()
+            slb.as_dict()
+        inspect_.assert_not_called()
+
+
+class TestBulk(test_case.TestCase):
+
+    def setUp(self):
+        super(TestBulk, self).setUp()
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+
+        cfg = mock.Mock()
+        cfg.get.side_effect = {
+            'use_database': True,
+            'database_connection': 'sqlite:///' + os.path.join(tmp, 'a10.db')}.get
+        patcher = mock.patch.object(db_api, 'A10_CFG', cfg)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(db_api.dispose_engines)
+
+        db_api.get_base().metadata.create_all(db_api.get_engine(), tables=[
+            models.A10SLB.__table__, models.A10Generation.__table__])
+
+    def _slbs(self):
+        with db_api.magic_session() as db:
+            return dict((x.loadbalancer_id, x) for x in db.query(models.A10SLB))
+
+    def test_create_and_save_commits(self):
+        with db_api.magic_session() as db:
+            models.A10SLB.create_and_save(
+                tenant_id='t1', device_name='ax1', loadbalancer_id='lb1', db_session=db)
+            self.assertEqual(['lb1'], list(self._slbs()))
+
+    def test_create_and_flush_commits_with_caller(self):
+        with db_api.magic_session() as db:
+            models.A10SLB.create_and_flush(
+                tenant_id='t1', device_name='ax1', loadbalancer_id='lb1', db_session=db)
+            self.assertEqual(1, db.query(models.A10SLB).count())
+            self.assertEqual({}, self._slbs())
+        self.assertEqual(['lb1'], list(self._slbs()))
+
+    def test_create_and_flush_rolled_back_with_caller(self):
+        with db_api.magic_session() as db:
+            models.A10SLB.create_and_flush(
+                tenant_id='t1', device_name='ax1', loadbalancer_id='lb1', db_session=db)
+            db.rollback()
+        self.assertEqual({}, self._slbs())
+
+    def test_create_or_find(self):
+        slb, created = models.A10SLB.create_or_find(
+            'loadbalancer_id', tenant_id='t1', device_name='ax1', loadbalancer_id='lb1')
+        self.assertTrue(created)
+        self.assertEqual('ax1', self._slbs()['lb1'].device_name)
+
+    def test_create_or_find_lost_race(self):
+        with db_api.magic_session() as db:
+            # Inserted and committed by another worker in the meantime
+            models.A10SLB.create_and_save(tenant_id='t1', device_name='ax1',
+                                          loadbalancer_id='lb1')
+            slb, created = models.A10SLB.create_or_find(
+                'loadbalancer_id', tenant_id='t1', device_name='ax2', loadbalancer_id='lb1',
+                db_session=db)
+            self.assertFalse(created)
+            self.assertEqual('ax1', slb.device_name)
+
+            # The caller's transaction carries on
+            models.A10SLB.create_and_flush(tenant_id='t1', device_name='ax2',
+                                           loadbalancer_id='lb2', db_session=db)
+
+        slbs = self._slbs()
+        self.assertEqual(['lb1', 'lb2'], sorted(slbs))
+        self.assertEqual('ax1', slbs['lb1'].device_name)
+
+    def test_bulk_create(self):
+        rows = models.A10SLB.bulk_create(
+            [dict(tenant_id='t1', device_name='ax1', loadbalancer_id='lb%d' % i)
+             for i in range(7)], batch_size=3)
+        slbs = self._slbs()
+        self.assertEqual(7, len(slbs))
+        self.assertEqual(set(r['id'] for r in rows), set(x.id for x in slbs.values()))
+        self.assertIsNotNone(slbs['lb0'].created_at)
+
+    def test_bulk_create_scalar_default(self):
+        models.A10Generation.bulk_create([dict(name='a')])
+        self.assertEqual(0, models.A10Generation.current('a'))
+
+    def test_bulk_create_one_transaction(self):
+        rows = [dict(tenant_id='t1', device_name='ax1', loadbalancer_id='lb1'),
+                dict(tenant_id='t1', loadbalancer_id='lb2')]
+        self.assertRaises(Exception, models.A10SLB.bulk_create, rows, batch_size=1)
+        self.assertEqual({}, self._slbs())
+
+    def test_bulk_create_caller_session(self):
+        with db_api.magic_session() as db:
+            models.A10SLB.bulk_create(
+                [dict(tenant_id='t1', device_name='ax1', loadbalancer_id='lb1')],
+                db_session=db)
+            self.assertEqual(1, db.query(models.A10SLB).count())
+            db.rollback()
+        self.assertEqual({}, self._slbs())
+
+    def test_bulk_upsert(self):
+        old = models.A10SLB.bulk_create(
+            [dict(tenant_id='t1', device_name='ax1', loadbalancer_id='lb1')])[0]
+        created_at = self._slbs()['lb1'].created_at
+
+        models.A10SLB.bulk_upsert([
+            dict(id=old['id'], device_name='ax2'),
+            dict(tenant_id='t2', device_name='ax3', loadbalancer_id='lb2')])
+
+        slbs = self._slbs()
+        self.assertEqual('ax2', slbs['lb1'].device_name)
+        self.assertEqual('t1', slbs['lb1'].tenant_id)
+        self.assertEqual(created_at, slbs['lb1'].created_at)
+        self.assertGreater(slbs['lb1'].updated_at, old['updated_at'])
+        self.assertEqual('ax3', slbs['lb2'].device_name)
+
+    def test_bulk_upsert_natural_key(self):
+        models.A10Generation.bulk_upsert([dict(name='a', generation=1)])
+        models.A10Generation.bulk_upsert([dict(name='a', generation=2),
+                                          dict(name='b', generation=5)])
+        self.assertEqual(2, models.A10Generation.current('a'))
+        self.assertEqual(5, models.A10Generation.current('b'))
+
+    def test_bump(self):
+        models.A10Generation.bump('a')
+        models.A10Generation.bump('a')
+        self.assertEqual(2, models.A10Generation.current('a'))
+
+    def test_bump_lost_insert_race(self):
+        # Another worker inserts the row between our update and insert
+        models.A10Generation.bulk_create([dict(name='a', generation=1)])
+        increment = models.A10Generation._increment
+        results = iter([lambda db, name: False, increment, increment])
+
+        with mock.patch.object(models.A10Generation, '_increment',
+                               side_effect=lambda db, name: next(results)(db, name)):
+            with db_api.magic_session() as db:
+                models.A10Generation.bump('a', db_session=db)
+                models.A10Generation.bump('b', db_session=db)
+
+        self.assertEqual(2, models.A10Generation.current('a'))
+        self.assertEqual(1, models.A10Generation.current('b'))
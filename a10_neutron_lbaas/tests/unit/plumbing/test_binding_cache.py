@@ -0,0 +1,192 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import mock
+
+import a10_neutron_lbaas.tests.test_case as test_case
+
+from a10_neutron_lbaas.plumbing import binding_cache
+from a10_neutron_lbaas.plumbing import simple
+
+
+class TestTenantBindingCache(test_case.TestCase):
+
+    def setUp(self):
+        super(TestTenantBindingCache, self).setUp()
+        self.bindings = {}
+        self.generation = [0]
+
+        patcher = mock.patch.object(binding_cache, 'models')
+        self.models = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.find = self.models.A10TenantBinding.find_by_tenant_id
+        self.find.side_effect = self._find
+        self.models.A10TenantBinding.create_or_find.side_effect = self._create_or_find
+        self.models.A10Generation.current.side_effect = lambda name, **kw: self.generation[0]
+        self.models.A10Generation.bump.side_effect = self._bump
+
+        self.now = [1000.0]
+        patcher = mock.patch('time.time', side_effect=lambda: self.now[0])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.cache = binding_cache.TenantBindingCache(size=3, ttl=300, check_interval=5)
+
+    def _find(self, tenant_id, db_session=None):
+        if tenant_id in self.bindings:
+            return mock.Mock(device_name=self.bindings[tenant_id])
+
+    def _create_or_find(self, key, tenant_id=None, device_name=None, db_session=None):
+        if tenant_id in self.bindings:
+            return mock.Mock(device_name=self.bindings[tenant_id]), False
+        return mock.Mock(device_name=device_name), True
+
+    def _bump(self, name, db_session=None):
+        self.generation[0] += 1
+
+    def test_hit_costs_no_queries(self):
+        self.bindings['t1'] = 'ax1'
+        self.assertEqual('ax1', self.cache.get('t1'))
+        self.models.reset_mock()
+
+        self.now[0] += 1
+        self.assertEqual('ax1', self.cache.get('t1'))
+        self.assertEqual(0, len(self.models.mock_calls))
+
+    def test_negative_cached_briefly(self):
+        self.assertIsNone(self.cache.get('t1'))
+        self.bindings['t1'] = 'ax1'
+        self.now[0] += 1
+        self.assertIsNone(self.cache.get('t1'))
+        self.now[0] += 5
+        self.assertEqual('ax1', self.cache.get('t1'))
+
+    def test_ttl(self):
+        self.bindings['t1'] = 'ax1'
+        self.cache.get('t1')
+        self.now[0] += 301
+        self.cache.get('t1')
+        self.assertEqual(2, self.find.call_count)
+
+    def test_lru(self):
+        for t in ('t1', 't2', 't3'):
+            self.bindings[t] = 'ax1'
+            self.cache.get(t)
+        self.cache.get('t1')
+        self.bindings['t4'] = 'ax1'
+        self.cache.get('t4')
+        self.find.reset_mock()
+
+        self.cache.get('t1')
+        self.find.assert_not_called()
+        self.cache.get('t2')
+        self.find.assert_called_once_with('t2', db_session=None)
+
+    def test_bind(self):
+        self.assertIsNone(self.cache.get('t1'))
+        self.assertEqual('ax2', self.cache.bind('t1', 'ax2'))
+
+        self.models.A10TenantBinding.create_or_find.assert_called_once_with(
+            'tenant_id', tenant_id='t1', device_name='ax2', db_session=None)
+        self.assertEqual(1, self.generation[0])
+        self.find.reset_mock()
+        self.now[0] += 10
+        self.assertEqual('ax2', self.cache.get('t1'))
+        self.find.assert_not_called()
+
+    def test_bind_lost_race(self):
+        self.assertIsNone(self.cache.get('t1'))
+        # Another worker binds t1 before our insert
+        self.bindings['t1'] = 'ax1'
+
+        self.assertEqual('ax1', self.cache.bind('t1', 'ax2'))
+        self.assertEqual(0, self.generation[0])
+        self.find.reset_mock()
+        self.assertEqual('ax1', self.cache.get('t1'))
+        self.find.assert_not_called()
+
+    def test_bind_cached_on_commit(self):
+        session = mock.Mock()
+        with mock.patch.object(binding_cache.db_api, 'after_commit') as after_commit:
+            self.cache.bind('t1', 'ax2', db_session=session)
+            self.bindings['t1'] = 'ax2'
+            self.now[0] += 1
+            self.find.reset_mock()
+
+            # Not cached or bumped until the caller commits; a rollback
+            # leaves nothing
+            self.assertEqual('ax2', self.cache.get('t1'))
+            self.assertEqual(1, self.find.call_count)
+            self.assertEqual(0, self.generation[0])
+            self.cache._entries.clear()
+
+            after_commit.assert_called_once_with(session, mock.ANY)
+            after_commit.call_args[0][1]()
+        # Bumped in a transaction of its own
+        self.models.A10Generation.bump.assert_called_once_with(
+            binding_cache.GENERATION, db_session=None)
+        self.assertEqual(1, self.generation[0])
+        self.bindings.pop('t1')
+        self.assertEqual('ax2', self.cache.get('t1'))
+        self.assertEqual(1, self.find.call_count)
+
+    def test_other_worker_changed_bindings(self):
+        self.bindings['t1'] = 'ax1'
+        self.cache.get('t1')
+
+        # Somebody else moves the tenant
+        self.bindings['t1'] = 'ax2'
+        other = binding_cache.TenantBindingCache()
+        other.invalidate('t1')
+
+        self.now[0] += 1
+        self.assertEqual('ax1', self.cache.get('t1'))
+        self.now[0] += 5
+        self.assertEqual('ax2', self.cache.get('t1'))
+
+    def test_disabled(self):
+        cache = binding_cache.TenantBindingCache(size=0)
+        self.bindings['t1'] = 'ax1'
+        cache.get('t1')
+        cache.get('t1')
+        self.assertEqual(2, self.find.call_count)
+
+
+class TestSelectDeviceCached(test_case.TestCase):
+
+    def test_select_device_db(self):
+        devices = {'ax1': {'name': 'ax1'}, 'ax2': {'name': 'ax2'}}
+        hooks = simple.PlumbingHooks(None, devices=devices)
+        with mock.patch.object(binding_cache.TenantBindingCache, 'get', return_value='ax2'):
+            self.assertEqual(devices['ax2'], hooks._select_device_db('t1'))
+
+    def test_select_device_db_binds(self):
+        devices = {'ax1': {'name': 'ax1'}}
+        hooks = simple.PlumbingHooks(None, devices=devices)
+        with mock.patch.object(binding_cache.TenantBindingCache, 'get', return_value=None):
+            with mock.patch.object(binding_cache.TenantBindingCache, 'bind',
+                                   return_value='ax1') as bind:
+                self.assertEqual(devices['ax1'], hooks._select_device_db('t1'))
+        bind.assert_called_once_with('t1', 'ax1', db_session=None)
+
+    def test_select_device_db_lost_race(self):
+        devices = {'ax1': {'name': 'ax1'}, 'ax2': {'name': 'ax2'}}
+        hooks = simple.PlumbingHooks(None, devices=devices)
+        chosen = hooks._select_device_hash('t1')['name']
+        other = 'ax2' if chosen == 'ax1' else 'ax1'
+        with mock.patch.object(binding_cache.TenantBindingCache, 'get', return_value=None):
+            with mock.patch.object(binding_cache.TenantBindingCache, 'bind',
+                                   return_value=other):
+                self.assertEqual(devices[other], hooks._select_device_db('t1'))
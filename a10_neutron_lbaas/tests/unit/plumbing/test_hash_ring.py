@@ -0,0 +1,146 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import collections
+
+import acos_client
+import mock
+
+import a10_neutron_lbaas.tests.test_case as test_case
+
+from a10_neutron_lbaas.plumbing import hash_ring
+from a10_neutron_lbaas.plumbing import simple
+
+NODES = ['ax%d' % i for i in range(1, 5)]
+KEYS = ['tenant-%d' % i for i in range(2000)]
+
+
+def _placement(ring):
+    return dict((k, ring.get_node(k)) for k in KEYS)
+
+
+class TestHashRing(test_case.TestCase):
+
+    def test_same_as_acos_client(self):
+        ring = hash_ring.HashRing(NODES)
+        old = acos_client.Hash(list(NODES))
+        for k in KEYS[:500]:
+            self.assertEqual(old.get_server(k), ring.get_node(k))
+
+    def test_empty(self):
+        self.assertIsNone(hash_ring.HashRing().get_node('t1'))
+
+    def test_weights(self):
+        ring = hash_ring.HashRing({'ax1': 1, 'ax2': 3})
+        counts = collections.Counter(_placement(ring).values())
+        self.assertTrue(2.0 < float(counts['ax2']) / counts['ax1'] < 4.5)
+
+    def test_add_only_moves_to_new_node(self):
+        ring = hash_ring.HashRing(NODES)
+        before = _placement(ring)
+        ring.add('ax5')
+        after = _placement(ring)
+        moved = [k for k in KEYS if before[k] != after[k]]
+        self.assertTrue(moved)
+        self.assertTrue(len(moved) < len(KEYS) / 3)
+        self.assertEqual(set(['ax5']), set(after[k] for k in moved))
+
+    def test_remove_only_moves_from_old_node(self):
+        ring = hash_ring.HashRing(NODES)
+        before = _placement(ring)
+        ring.remove('ax2')
+        after = _placement(ring)
+        moved = set(k for k in KEYS if before[k] != after[k])
+        self.assertEqual(set(k for k in KEYS if before[k] == 'ax2'), moved)
+
+    def test_incremental_matches_fresh(self):
+        ring = hash_ring.HashRing(NODES)
+        changed = ring.update({'ax1': 1, 'ax3': 2, 'ax4': 1, 'ax9': 1})
+        self.assertEqual(set(['ax2', 'ax3', 'ax9']), changed)
+        fresh = hash_ring.HashRing({'ax1': 1, 'ax3': 2, 'ax4': 1, 'ax9': 1})
+        self.assertEqual(fresh._keys, ring._keys)
+        self.assertEqual(_placement(fresh), _placement(ring))
+        self.assertEqual(set(), ring.update(fresh.nodes))
+
+    def test_plan_rebalance(self):
+        ring = hash_ring.HashRing(NODES)
+        before = _placement(ring)
+        plan = hash_ring.plan_rebalance(ring, NODES + ['ax5'], KEYS)
+
+        self.assertEqual(before, _placement(ring))
+        self.assertTrue(plan)
+        for k, (old, new) in plan.items():
+            self.assertEqual(before[k], old)
+            self.assertEqual('ax5', new)
+
+        ring.add('ax5')
+        self.assertEqual(set(plan), set(k for k in KEYS if before[k] != ring.get_node(k)))
+
+    def test_plan_rebalance_unchanged(self):
+        ring = hash_ring.HashRing(NODES)
+        self.assertEqual({}, hash_ring.plan_rebalance(ring, NODES, KEYS))
+
+
+class TestPlumbingHooksRing(test_case.TestCase):
+
+    def setUp(self):
+        super(TestPlumbingHooksRing, self).setUp()
+        self.devices = dict((n, {'name': n}) for n in NODES)
+        self.driver = mock.Mock()
+        self.driver.config.get.side_effect = {'use_database': True}.get
+        self.driver.config.get_devices.side_effect = lambda **kw: dict(self.devices)
+        self.hooks = simple.PlumbingHooks(self.driver)
+        self.hooks._tenant_bindings = mock.Mock()
+        self.hooks.tenant_bindings.get.return_value = None
+        self.hooks.tenant_bindings.bind.side_effect = lambda t, name, **kw: name
+        self.driver.config.device_registry.version.return_value = 1
+
+    def test_db_devices_added_later(self):
+        self.hooks.select_device('t1')
+        ring = self.hooks.appliance_hash
+        self.devices['vth1'] = {'name': 'vth1', 'weight': 2}
+
+        self.hooks.select_device('t2')
+        self.assertEqual(2, self.hooks.appliance_hash.nodes['vth1'])
+        # Swapped in whole; lookups still on the old ring are unaffected
+        self.assertIsNot(ring, self.hooks.appliance_hash)
+        self.assertNotIn('vth1', ring.nodes)
+
+    def test_unchanged_devices_keep_ring(self):
+        self.hooks.select_device('t1')
+        ring = self.hooks.appliance_hash
+        self.driver.config.device_registry.version.return_value = 2
+
+        self.hooks.select_device('t2')
+        self.assertIs(ring, self.hooks.appliance_hash)
+
+    def test_bound_tenant_skips_device_refresh(self):
+        self.hooks.select_device('t1')
+        self.hooks.tenant_bindings.get.return_value = 'ax1'
+        self.driver.config.get_devices.reset_mock()
+
+        self.assertEqual('ax1', self.hooks.select_device('t1')['name'])
+        self.driver.config.get_devices.assert_not_called()
+
+        # Until the registry changes
+        self.devices['ax1'] = {'name': 'ax1', 'host': '10.0.0.9'}
+        self.driver.config.device_registry.version.return_value = 2
+        self.assertEqual('10.0.0.9', self.hooks.select_device('t1')['host'])
+        self.driver.config.get_devices.assert_called_once_with(db_session=None)
+
+    def test_plan_rebalance(self):
+        devices = dict(self.devices, ax5={'name': 'ax5'})
+        plan = self.hooks.plan_rebalance(devices, KEYS)
+        self.assertTrue(plan)
+        self.assertEqual(set(['ax5']), set(new for old, new in plan.values()))
@@ -0,0 +1,213 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import mock
+import sqlalchemy
+import sqlalchemy.orm
+
+import a10_neutron_lbaas.tests.test_case as test_case
+
+from a10_neutron_lbaas import a10_exceptions as ex
+from a10_neutron_lbaas.db import api as db_api
+from a10_neutron_lbaas.db import models
+from a10_neutron_lbaas.plumbing import scheduler
+from a10_neutron_lbaas.plumbing import simple
+
+
+def _devices(**limits):
+    return dict((name, dict(limits, name=name, api_version='3.0'))
+                for name in ('ax1', 'ax2', 'ax3'))
+
+
+class FakeLoads(object):
+
+    def __init__(self, loads):
+        self.loads = loads
+        self.placed = []
+
+    def get(self, name):
+        return dict(self.loads.get(name, {}))
+
+    def note_placement(self, name, device_cfg):
+        self.placed.append(name)
+
+
+class TestScheduler(test_case.TestCase):
+
+    def _select(self, loads, devices=None, tenant_id='t1', **kw):
+        kw.setdefault('filters', ['capacity', 'affinity'])
+        kw.setdefault('weighers', {'free_capacity': 1.0})
+        s = scheduler.Scheduler(FakeLoads(loads), **kw)
+        return s.select(tenant_id, devices or _devices(max_tenants=10))['name']
+
+    def test_least_loaded(self):
+        loads = {'ax1': {'tenants': 5}, 'ax2': {'tenants': 2}, 'ax3': {'tenants': 7}}
+        self.assertEqual('ax2', self._select(loads))
+
+    def test_most_used_limit_counts(self):
+        devices = _devices(max_tenants=10, max_virtual_servers=100)
+        loads = {'ax1': {'tenants': 1, 'virtual_servers': 95},
+                 'ax2': {'tenants': 4, 'virtual_servers': 10},
+                 'ax3': {'tenants': 6, 'virtual_servers': 0}}
+        self.assertEqual('ax2', self._select(loads, devices))
+
+    def test_full_devices_filtered(self):
+        loads = {'ax1': {'tenants': 10}, 'ax2': {'tenants': 12}, 'ax3': {'tenants': 9}}
+        self.assertEqual('ax3', self._select(loads))
+        loads['ax3']['tenants'] = 10
+        self.assertRaises(ex.NoDevicesAvailableError, self._select, loads)
+
+    def test_affinity(self):
+        devices = _devices()
+        devices['ax3']['tags'] = ['gold']
+        loads = {'ax1': {'tenants': 0}, 'ax2': {'tenants': 0}, 'ax3': {'tenants': 50}}
+        self.assertEqual('ax3', self._select(loads, devices, affinity={'t1': 'gold'}))
+        self.assertNotEqual('ax3', self._select(loads, devices, affinity={'t2': 'gold'}))
+
+    def test_weighers_combine(self):
+        loads = {'ax1': {'cpu': 10, 'sessions': 900},
+                 'ax2': {'cpu': 50, 'sessions': 100},
+                 'ax3': {'cpu': 90, 'sessions': 0}}
+        self.assertEqual('ax1', self._select(loads, weighers={'cpu': 2.0, 'sessions': 1.0}))
+        self.assertEqual('ax2', self._select(loads, weighers={'cpu': 1.0, 'sessions': 1.0}))
+
+    def test_ties_spread_by_tenant(self):
+        picked = set(self._select({}, tenant_id='tenant-%d' % i) for i in range(30))
+        self.assertEqual(set(['ax1', 'ax2', 'ax3']), picked)
+        self.assertEqual(self._select({}, tenant_id='x'), self._select({}, tenant_id='x'))
+
+    def test_custom_plugins(self):
+        class OnlyAx2(object):
+            def passes(self, device_cfg, load, request):
+                return device_cfg['name'] == 'ax2'
+
+        self.assertEqual('ax2', self._select({}, filters=[OnlyAx2]))
+        self.assertRaises(ex.InvalidConfig, self._select, {}, filters=['nope'])
+
+    def test_placement_noted(self):
+        s = scheduler.Scheduler(FakeLoads({}), weighers={'tenants': 1.0})
+        name = s.select('t1', _devices())['name']
+        self.assertEqual([name], s.loads.placed)
+
+
+class TestDeviceLoadCache(test_case.TestCase):
+
+    def setUp(self):
+        super(TestDeviceLoadCache, self).setUp()
+        self.client = mock.MagicMock()
+        self.client.system.partition.all.return_value = {
+            'partition-all': {'oper': {'partition-list': [{}, {}]}}}
+        self.client.slb.virtual_server.all.return_value = {
+            'virtual-server-list': [{}, {}, {}]}
+        self.client.system.stats.side_effect = lambda name: {
+            'data-cpu': {'data-cpu': {'stats': {'cpu-usage': [
+                {'cpu-id': 1, '60-sec-usage': 20}, {'cpu-id': 2, '60-sec-usage': 40}]}}},
+            'session': {'session': {'stats': {'total-curr-conn': 1234}}},
+        }[name]
+
+        self.driver = mock.Mock()
+        self.driver._get_a10_client.return_value = self.client
+        self.driver.config.get.side_effect = {'use_database': True}.get
+        self.devices = _devices()
+        self.devices['ax3']['api_version'] = '2.1'
+        self.loads = scheduler.DeviceLoadCache(self.driver, lambda: self.devices)
+
+        patcher = mock.patch('a10_neutron_lbaas.db.models.A10TenantBinding.count_by_device',
+                             return_value={'ax1': 4})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_refresh(self):
+        self.loads.refresh()
+        self.assertEqual({'tenants': 4, 'partitions': 2, 'virtual_servers': 3,
+                          'cpu': 30.0, 'sessions': 1234}, self.loads.get('ax1'))
+        # aXAPI 2.1 devices only have virtual servers
+        self.assertEqual({'tenants': 0, 'virtual_servers': 3}, self.loads.get('ax3'))
+        self.assertEqual(3, self.driver._release_a10_client.call_count)
+
+    def test_failing_probe_left_out(self):
+        self.client.system.stats.side_effect = Exception("nope")
+        self.loads.refresh()
+        self.assertNotIn('cpu', self.loads.get('ax1'))
+        self.assertEqual(2, self.loads.get('ax1')['partitions'])
+
+    def test_unreachable_device(self):
+        self.driver._get_a10_client.side_effect = Exception("down")
+        self.loads.refresh()
+        self.assertEqual({'tenants': 4}, self.loads.get('ax1'))
+
+    def test_note_placement(self):
+        self.loads.refresh()
+        self.loads.note_placement('ax1', self.devices['ax1'])
+        self.assertEqual(5, self.loads.get('ax1')['tenants'])
+
+
+class TestCountByDevice(test_case.TestCase):
+
+    def test_count_by_device(self):
+        engine = sqlalchemy.create_engine('sqlite://')
+        self.addCleanup(engine.dispose)
+        db_api.get_base().metadata.create_all(engine, tables=[models.A10TenantBinding.__table__])
+        session = sqlalchemy.orm.sessionmaker(bind=engine)()
+        self.addCleanup(session.close)
+
+        for i, name in enumerate(['ax1', 'ax1', 'ax2']):
+            session.add(models.A10TenantBinding(id='b%d' % i, tenant_id='t%d' % i,
+                                                device_name=name))
+        session.flush()
+        self.assertEqual({'ax1': 2, 'ax2': 1},
+                         models.A10TenantBinding.count_by_device(db_session=session))
+
+
+class TestSchedulingHooks(test_case.TestCase):
+
+    def setUp(self):
+        super(TestSchedulingHooks, self).setUp()
+        self.config = {'use_database': True, 'device_scheduling_filters': ['capacity'],
+                       'device_scheduling_weighers': {'tenants': 1.0},
+                       'device_scheduling_refresh_interval': 60}
+        self.driver = mock.Mock()
+        self.driver.config.get.side_effect = lambda k: self.config.get(k)
+        self.driver.config.get_devices.return_value = _devices()
+
+        patcher = mock.patch.object(scheduler.DeviceLoadCache, 'start')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.hooks = simple.PlumbingHooks(self.driver)
+        self.hooks._tenant_bindings = mock.Mock()
+        self.hooks.tenant_bindings.get.return_value = None
+        self.hooks.tenant_bindings.bind.side_effect = lambda t, name, **kw: name
+
+    def test_new_tenant_scheduled(self):
+        with mock.patch.object(scheduler.DeviceLoadCache, 'get',
+                               side_effect=lambda n: {'tenants': 0 if n == 'ax3' else 9}):
+            d = self.hooks.select_device('t1')
+        self.assertEqual('ax3', d['name'])
+        self.hooks.tenant_bindings.bind.assert_called_once_with('t1', 'ax3', db_session=None)
+
+    def test_bound_tenant_stays(self):
+        self.hooks.tenant_bindings.get.return_value = 'ax1'
+        self.assertEqual('ax1', self.hooks.select_device('t1')['name'])
+        self.assertIsNotNone(self.hooks.scheduler)
+
+    def test_needs_database(self):
+        self.config['use_database'] = False
+        self.hooks.select_device('t1')
+        self.assertIsNone(self.hooks.scheduler)
+
+    def test_off_by_default(self):
+        del self.config['device_scheduling_filters']
+        self.hooks.select_device('t1')
+        self.assertIsNone(self.hooks.scheduler)
@@ -12,7 +12,16 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import os
+import shutil
+import tempfile
+
+import mock
+
+from a10_neutron_lbaas import a10_config
+from a10_neutron_lbaas.tests import test_case
 from a10_neutron_lbaas.tests.unit import test_base
+from a10_neutron_lbaas.tests.unit import unit_config
 
 
 class TestA10Config(test_base.UnitTestBase):
@@ -52,6 +61,17 @@ class TestA10Config(test_base.UnitTestBase):
                 actual = v['ip_in_ip']
                 self.assertEqual(expected, actual)
 
+    def test_name_matcher_precompiled(self):
+        expressions = self.a.config.get_vport_expressions()
+        matcher = self.a.config.get_name_matcher(expressions)
+        self.assertIs(matcher, self.a.config.get_name_matcher(expressions))
+        self.assertIs(expressions, matcher.expressions)
+
+    def test_name_matcher_other_table(self):
+        expressions = {"web": {"regex": "web$", "json": {"port": 80}}}
+        matcher = self.a.config.get_name_matcher(expressions)
+        self.assertEqual({"port": 80}, matcher.match("myweb"))
+
     # TODO(dougwig) -- test new a10_config members
     # def test_image_defaults(self):
     #     self.assertIsNotNone(self.a.config.image_defaults)
@@ -96,3 +116,69 @@ class TestA10ConfigProvider(test_base.UnitTestBase):
         v = self.a.config.get_vthunder_config()
         self.assertEqual(v['api_version'], '9.9')
         self.assertEqual(v['nova_flavor'], 'acos.min')
+
+
+class TestA10ConfigShared(test_case.TestCase):
+
+    def setUp(self):
+        super(TestA10ConfigShared, self).setUp()
+        self.config_dir = os.path.dirname(unit_config.__file__)
+        patcher = mock.patch.dict(a10_config._SHARED, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_config_run_once(self):
+        with mock.patch.object(a10_config.runpy, 'run_path',
+                               wraps=a10_config.runpy.run_path) as run_path:
+            a = a10_config.A10Config.shared(config_dir=self.config_dir)
+            b = a10_config.A10Config.shared(config_dir=self.config_dir)
+        self.assertIs(a, b)
+        self.assertEqual(1, run_path.call_count)
+
+    def test_per_provider(self):
+        a = a10_config.A10Config.shared(config_dir=self.config_dir)
+        b = a10_config.A10Config.shared(config_dir=self.config_dir, provider='prov1')
+        self.assertIsNot(a, b)
+        self.assertEqual('the-doctor', b.get('who_should_win'))
+
+    def test_env_dir(self):
+        cleanup = unit_config.helper.use_config_dir(self.config_dir)
+        self.addCleanup(cleanup)
+        self.assertIs(a10_config.A10Config.shared(),
+                      a10_config.A10Config.shared(config_dir=self.config_dir))
+
+
+class TestNeutronConf(test_case.TestCase):
+
+    def setUp(self):
+        super(TestNeutronConf, self).setUp()
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.path = os.path.join(self.dir, 'neutron.conf')
+        self._write('sqlite://')
+        patcher = mock.patch.dict(a10_config._NEUTRON_CONF, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.dict(os.environ, {'NEUTRON_CONF_DIR': self.dir})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.config = unit_config.helper.empty_config()
+
+    def _write(self, url, tick=0):
+        with open(self.path, 'w') as f:
+            f.write("[database]\nconnection = %s\n" % url)
+        st = os.stat(self.path)
+        os.utime(self.path, (st.st_atime, st.st_mtime + tick))
+
+    def test_parsed_once(self):
+        a10_config._NEUTRON_CONF.clear()
+        with mock.patch.object(a10_config.ini, 'ConfigParser',
+                               wraps=a10_config.ini.ConfigParser) as parser:
+            self.assertEqual('sqlite://', self.config._get_neutron_db_string())
+            self.assertEqual('sqlite://', self.config._get_neutron_db_string())
+        self.assertEqual(1, parser.call_count)
+
+    def test_reparsed_when_changed(self):
+        self.config._get_neutron_db_string()
+        self._write('mysql://neutron', tick=1)
+        self.assertEqual('mysql://neutron', self.config._get_neutron_db_string())
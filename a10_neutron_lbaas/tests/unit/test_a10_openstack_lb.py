@@ -12,14 +12,61 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
 import mock
 
 import a10_neutron_lbaas.tests.test_case as test_case
+from a10_neutron_lbaas.tests.unit import test_base
 
+import a10_neutron_lbaas
 import a10_neutron_lbaas.a10_openstack_lb as a10_openstack_lb
 import a10_neutron_lbaas.plumbing_hooks as plumbing_hooks
 
 
+# Only needed by some deployments, or only once requests arrive; starting the
+# driver must not load them.
+LAZY_MODULES = [
+    'a10_neutron_lbaas.v1.handler_vip',
+    'a10_neutron_lbaas.v2.handler_lb',
+    'a10_neutron_lbaas.v2.handler_listener',
+    'a10_neutron_lbaas.neutron_ext.db.certificate_db',
+    'a10_neutron_lbaas.vthunder.instance_manager',
+    'a10_neutron_lbaas.vthunder.keystone',
+    'a10_openstack_lib',
+    'glanceclient',
+    'keystoneclient',
+    'neutronclient',
+    'novaclient',
+]
+
+STARTUP_CONFIG = """
+keystone_auth_url = 'http://localhost:5000/v3'
+devices = {
+    "ax1": {"host": "10.0.0.1", "username": "admin", "password": "a10"},
+    "ax2": {"host": "10.0.0.2", "username": "admin", "password": "a10",
+            "api_version": "3.0"},
+}
+vport_expressions = {"web": {"regex": "web$", "json": {"port": 80}}}
+"""
+
+# Run in a fresh interpreter, so that nothing is already imported
+_STARTUP = """
+import json, sys
+import mock
+import a10_neutron_lbaas.a10_openstack_lb as a10_os
+a10_os.A10OpenstackLBV2(mock.MagicMock(), provider='startup')
+print(json.dumps([m for m in %r if m in sys.modules]))
+"""
+
+
 class SetupA10OpenstackLBBase(object):
 
     @property
@@ -81,3 +128,70 @@ class TestA10OpenstackV2(SetupA10OpenstackLBV2, TestA10Openstack):
 
 class TestA10OpenstackV2PlumbingHooks(SetupA10OpenstackLBV2, SetupPlumbingHooks, TestA10Openstack):
     pass
+
+
+class TestStartup(test_case.TestCase):
+    """Modules loaded by importing the driver and initializing it."""
+
+    def setUp(self):
+        super(TestStartup, self).setUp()
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        with open(os.path.join(self.dir, 'config.py'), 'w') as f:
+            f.write(STARTUP_CONFIG)
+
+    def test_startup(self):
+        path = [os.path.dirname(os.path.dirname(a10_neutron_lbaas.__file__))]
+        path += [p for p in os.environ.get('PYTHONPATH', '').split(os.pathsep) if p]
+        env = dict(os.environ, A10_CONFIG_DIR=self.dir, PYTHONPATH=os.pathsep.join(path))
+        out = subprocess.check_output([sys.executable, '-c', _STARTUP % (LAZY_MODULES,)],
+                                      env=env)
+        loaded = json.loads(out.decode('utf-8').strip().splitlines()[-1])
+        self.assertEqual([], loaded)
+
+
+class TestHandlerCache(test_base.UnitTestBase):
+
+    def test_built_once(self):
+        for name in ('lb', 'listener', 'pool', 'member', 'hm', 'l7policy', 'l7rule'):
+            self.assertIs(getattr(self.a, name), getattr(self.a, name))
+        self.assertIs(self.a.lb, self.a.loadbalancer)
+
+    def test_rebuilt_when_dependency_replaced(self):
+        listener = self.a.listener
+        self.a.barbican_client = mock.Mock()
+        self.assertIsNot(listener, self.a.listener)
+        self.assertIs(self.a.barbican_client, self.a.listener.barbican_client)
+
+        pool = self.a.pool
+        self.a.openstack_driver = mock.MagicMock()
+        self.assertIs(self.a.openstack_driver.pool, self.a.pool.openstack_manager)
+        self.assertIsNot(pool, self.a.pool)
+
+    def test_project_hierarchy_built_on_first_use(self):
+        from a10_neutron_lbaas.vthunder import keystone
+
+        # Not at startup, so that a config reloaded with use_parent_project
+        # on gets one too
+        self.assertIsNone(self.a._project_hierarchy)
+        hierarchy = self.a.project_hierarchy
+        self.assertIsInstance(hierarchy, keystone.ProjectHierarchy)
+        self.assertIs(hierarchy, self.a.project_hierarchy)
+
+    def test_threads_share_one(self):
+        built = []
+
+        def build():
+            time.sleep(0.01)
+            built.append(object())
+            return built[-1]
+
+        got = []
+        threads = [threading.Thread(target=lambda: got.append(self.a._handler('x', build)))
+                   for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(1, len(built))
+        self.assertEqual([built[0]] * 8, got)
@@ -0,0 +1,143 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import os
+import shutil
+import tempfile
+
+import mock
+
+import a10_neutron_lbaas.tests.test_case as test_case
+
+from a10_neutron_lbaas import a10_config
+from a10_neutron_lbaas import a10_exceptions as a10_ex
+from a10_neutron_lbaas import a10_openstack_lb
+from a10_neutron_lbaas import config_watcher
+from a10_neutron_lbaas.plumbing import simple
+
+CONFIG = """
+keystone_auth_url = 'http://localhost:5000/v3'
+devices = %r
+vport_expressions = {"web": {"regex": "web$", "json": {"port": %d}}}
+"""
+
+
+def _device(host):
+    return {"host": host, "username": "admin", "password": "a10"}
+
+
+class TestConfigReload(test_case.TestCase):
+
+    def setUp(self):
+        super(TestConfigReload, self).setUp()
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.path = os.path.join(self.dir, 'config.py')
+        self._write({"ax1": _device("10.0.0.1"), "ax2": _device("10.0.0.2")})
+        self.config = a10_config.A10Config(config_dir=self.dir)
+
+        self.driver = mock.Mock(config=self.config)
+        self.watcher = config_watcher.ConfigWatcher(self.driver, interval=1)
+
+    def _write(self, devices, port=80):
+        with open(self.path, 'w') as f:
+            f.write(CONFIG % (devices, port))
+        # Make sure the change shows even within the mtime resolution
+        st = os.stat(self.path)
+        os.utime(self.path, (st.st_atime, st.st_mtime + getattr(self, '_tick', 1)))
+        self._tick = getattr(self, '_tick', 1) + 1
+
+    def test_reload(self):
+        matcher = self.config.get_name_matcher(self.config.get_vport_expressions())
+        self._write({"ax1": _device("10.0.0.1"), "ax2": _device("10.0.0.9"),
+                     "ax3": _device("10.0.0.3")}, port=8080)
+
+        self.assertEqual(set(['ax2', 'ax3']), self.config.reload())
+        self.assertEqual('10.0.0.9', self.config.get_device('ax2')['host'])
+        self.assertEqual(['ax1', 'ax2', 'ax3'], sorted(self.config.get_devices()))
+        self.assertEqual(self.dir, self.config._config_dir)
+
+        new = self.config.get_name_matcher(self.config.get_vport_expressions())
+        self.assertIsNot(matcher, new)
+        self.assertEqual({"port": 8080}, new.match("myweb"))
+
+    def test_reload_removed(self):
+        self._write({"ax1": _device("10.0.0.1")})
+        self.assertEqual(set(['ax2']), self.config.reload())
+        self.assertIsNone(self.config.get_device('ax2'))
+
+    def test_invalid_keeps_config(self):
+        self._write({"ax1": {"host": "10.0.0.1"}})
+        self.assertRaises(a10_ex.InvalidDeviceConfig, self.config.reload)
+        self.assertEqual(['ax1', 'ax2'], sorted(self.config.get_devices()))
+
+    def test_watcher_unchanged(self):
+        self.assertIsNone(self.watcher.check())
+        self.driver._config_changed.assert_not_called()
+
+    def test_watcher_changed(self):
+        self._write({"ax1": _device("10.0.0.5"), "ax2": _device("10.0.0.2")})
+        self.assertEqual(set(['ax1']), self.watcher.check())
+        self.driver._config_changed.assert_called_once_with(set(['ax1']))
+        self.assertIsNone(self.watcher.check())
+
+    def test_watcher_syntax_error(self):
+        with open(self.path, 'a') as f:
+            f.write("devices = {\n")
+        self.assertIsNone(self.watcher.check())
+        self.driver._config_changed.assert_not_called()
+        self.assertEqual(['ax1', 'ax2'], sorted(self.config.get_devices()))
+
+    def test_watcher_missing_file(self):
+        os.unlink(self.path)
+        self.assertIsNone(self.watcher.check())
+        self.assertEqual(['ax1', 'ax2'], sorted(self.config.get_devices()))
+
+
+class TestConfigChanged(test_case.TestCase):
+
+    def setUp(self):
+        super(TestConfigChanged, self).setUp()
+        self.devices = {"ax1": _device("10.0.0.1"), "ax2": _device("10.0.0.2")}
+        for k, v in self.devices.items():
+            v['name'] = k
+        self.driver = mock.Mock()
+        self.driver.config.get.return_value = None
+        self.driver.config.get_devices.side_effect = lambda: dict(self.devices)
+        self.hooks = simple.PlumbingHooks(self.driver)
+        self.hooks.select_device('t1')
+        self.ring = self.hooks.appliance_hash
+
+    def test_changed_device_keeps_ring(self):
+        self.devices["ax1"] = dict(self.devices["ax1"], host="10.0.0.9")
+        self.hooks.config_changed(set(['ax1']))
+        self.assertIs(self.ring, self.hooks.appliance_hash)
+        self.assertEqual("10.0.0.9", self.hooks.devices["ax1"]["host"])
+
+    def test_added_device_joins_ring(self):
+        self.devices["ax3"] = dict(_device("10.0.0.3"), name="ax3")
+        self.hooks.config_changed(set(['ax3']))
+        self.assertIn("ax3", self.hooks.appliance_hash)
+        self.assertNotIn("ax3", self.ring)
+
+    def test_explicit_devices_left_alone(self):
+        hooks = simple.PlumbingHooks(self.driver, devices=dict(self.devices))
+        hooks.config_changed(set(['ax1']))
+        self.driver.config.get_devices.assert_called_once_with()
+
+    def test_driver_invalidates_changed_only(self):
+        driver = mock.Mock()
+        a10_openstack_lb.A10OpenstackLBBase._config_changed(driver, set(['ax1']))
+        driver.session_pool.invalidate.assert_called_once_with('ax1')
+        driver.hooks.config_changed.assert_called_once_with(set(['ax1']))
@@ -0,0 +1,92 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import collections
+import re
+
+import mock
+
+import a10_neutron_lbaas.tests.test_case as test_case
+
+from a10_neutron_lbaas import name_expressions
+
+
+def _table(*regexes):
+    return collections.OrderedDict(
+        ("e%d" % i, {"regex": r, "json": {"i": i}}) for i, r in enumerate(regexes))
+
+
+def _search_each(expressions, os_name):
+    # What handlers did before: compile and search every expression in turn
+    for k, v in expressions.items():
+        if re.compile(v["regex"]).search(os_name):
+            return v["json"]
+
+
+class TestNameMatcher(test_case.TestCase):
+
+    def _match(self, table, os_name):
+        m = name_expressions.NameMatcher(table).match(os_name)
+        self.assertEqual(_search_each(table, os_name), m)
+        return m
+
+    def test_empty(self):
+        self.assertIsNone(name_expressions.NameMatcher({}).match("web"))
+        self.assertIsNone(name_expressions.NameMatcher(None).match("web"))
+
+    def test_no_name(self):
+        self.assertIsNone(name_expressions.NameMatcher(_table("")).match(""))
+
+    def test_first_in_table_order_wins(self):
+        # "^sec" matches further left, but "web$" comes first in the table
+        self.assertEqual({"i": 0}, self._match(_table("web$", "^sec"), "secweb"))
+        self.assertEqual({"i": 1}, self._match(_table("^www", "^sec"), "secweb"))
+
+    def test_anchors_and_classes(self):
+        table = _table("^secure", "web$", "[w]{3}", r"\bapi\b")
+        for name in ("securelistener", "blahweb", "listenerwwwlis", "my api", "nomatch"):
+            self._match(table, name)
+
+    def test_expression_groups(self):
+        table = _table("^(ftp|sftp)", "(a)(b)?c", "x(?:y|z)")
+        for name in ("sftp1", "ac", "abc", "xz", "none"):
+            self._match(table, name)
+
+    def test_backreferences(self):
+        table = _table(r"(\w)\1", "^(?P<p>ab)(?P=p)", "(?i)^WEB", "zz")
+        for name in ("aa", "abab", "web", "zz", "ab"):
+            self._match(table, name)
+
+    def test_empty_json_still_stops(self):
+        table = collections.OrderedDict([
+            ("a", {"regex": "^w", "json": {}}),
+            ("b", {"regex": "web", "json": {"i": 1}})])
+        self.assertEqual({}, self._match(table, "web"))
+
+    def test_many_groups(self):
+        table = _table(*["^n%d(x)(y)?$" % i for i in range(300)])
+        matcher = name_expressions.NameMatcher(table)
+        self.assertGreater(len(matcher._segments), 1)
+        for i in (0, 31, 32, 33, 299):
+            self.assertEqual({"i": i}, matcher.match("n%dx" % i))
+        self.assertIsNone(matcher.match("n300x"))
+
+    def test_compiled_once(self):
+        table = _table(*["^tenant%04d-" % i for i in range(1000)])
+        matcher = name_expressions.NameMatcher(table)
+        self.assertLess(len(matcher._segments), 20)
+        with mock.patch.object(name_expressions.re, 'compile') as compile_:
+            self.assertEqual({"i": 999}, matcher.match("tenant0999-web"))
+            self.assertIsNone(matcher.match("unmatched-listener"))
+        compile_.assert_not_called()
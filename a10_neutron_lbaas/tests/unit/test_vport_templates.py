@@ -0,0 +1,100 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import a10_neutron_lbaas.tests.test_case as test_case
+
+from a10_neutron_lbaas import vport_templates
+
+DEFAULTS = {
+    "ha-conn-mirror": 1,
+    "template-http": "http1",
+    "no-dest-nat": 1,
+    "conn-limit": 100,
+}
+
+
+def _device(**kw):
+    d = {"name": "ax1", "api_version": "3.0", "vport_defaults": {"conn-limit": 200}}
+    d.update(kw)
+    return d
+
+
+class TestVportTemplate(test_case.TestCase):
+
+    def setUp(self):
+        super(TestVportTemplate, self).setUp()
+        self.templates = vport_templates.VportTemplates()
+        self.device = _device()
+
+    def _build(self, protocol, match=None, device=None):
+        return self.templates.get(device or self.device, protocol, DEFAULTS).build(match)
+
+    def test_tcp(self):
+        protocol, d = self._build("tcp")
+        self.assertEqual("tcp", protocol)
+        self.assertEqual({"ha-conn-mirror": 1, "no-dest-nat": 1, "conn-limit": 200}, d)
+
+    def test_http(self):
+        protocol, d = self._build("http")
+        self.assertEqual({"template-http": "http1", "conn-limit": 200}, d)
+
+    def test_v21_protocol_numbers(self):
+        protocol, d = self._build(2)
+        self.assertEqual(2, protocol)
+        self.assertIn("ha-conn-mirror", d)
+        self.assertNotIn("template-http", d)
+
+    def test_match_overlays_and_is_conditioned(self):
+        protocol, d = self._build("https", {"conn-limit": 5, "ha-conn-mirror": 1})
+        self.assertEqual({"template-http": "http1", "conn-limit": 5}, d)
+
+    def test_protocol_override(self):
+        protocol, d = self._build("udp", {"protocol": "tcp"})
+        self.assertEqual("tcp", protocol)
+        self.assertNotIn("protocol", d)
+
+    def test_build_returns_copies(self):
+        self._build("tcp")[1]["conn-limit"] = 1
+        self.assertEqual(200, self._build("tcp")[1]["conn-limit"])
+
+    def test_cached(self):
+        t = self.templates.get(self.device, "tcp", DEFAULTS)
+        self.assertIs(t, self.templates.get(self.device, "tcp", DEFAULTS))
+        self.assertIsNot(t, self.templates.get(self.device, "udp", DEFAULTS))
+
+    def test_rebuilt_when_config_replaced(self):
+        t = self.templates.get(self.device, "tcp", DEFAULTS)
+        self.device["vport_defaults"] = {"conn-limit": 300}
+        self.device["templates"] = {"virtual-port": {"template-tcp": "t1"}}
+        new = self.templates.get(self.device, "tcp", DEFAULTS)
+        self.assertIsNot(t, new)
+        self.assertEqual(300, new.build()[1]["conn-limit"])
+        self.assertEqual({"template-tcp": "t1"}, new.virtual_port_templates)
+
+    def test_custom_conditions(self):
+        templates = vport_templates.VportTemplates({
+            "template-http": {"field": "protocol", "op": "=", "value": "HTTPS"},
+            "conn-limit": {"field": "protocol", "op": "!=", "value": "udp"},
+        })
+        self.assertNotIn("template-http", templates.get(self.device, "http", DEFAULTS).build()[1])
+        self.assertIn("template-http", templates.get(self.device, "https", DEFAULTS).build()[1])
+        self.assertNotIn("conn-limit", templates.get(self.device, "udp", DEFAULTS).build()[1])
+
+    def test_prime(self):
+        v21 = _device(name="ax2", api_version="2.1")
+        self.templates.prime({"ax1": self.device, "ax2": v21}, DEFAULTS)
+        self.assertEqual(
+            set([("ax1", "tcp"), ("ax1", "udp"), ("ax1", "http"), ("ax1", "https"),
+                 ("ax2", 2), ("ax2", 3), ("ax2", 11), ("ax2", 12)]),
+            set(self.templates._templates))
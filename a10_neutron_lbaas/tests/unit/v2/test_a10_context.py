@@ -16,6 +16,7 @@ import mock
 import sys
 import types
 
+from a10_neutron_lbaas.db import api as db_api
 from a10_neutron_lbaas.tests.unit.v2 import fake_objs
 from a10_neutron_lbaas.tests.unit.v2 import test_base
 from a10_neutron_lbaas.v2 import v2_context as a10
@@ -83,6 +84,14 @@ class TestA10Context(test_base.UnitTestBase):
         except FakeException:
             self.empty_close_mocks()
 
+    def test_enter_failure_releases_client(self):
+        with mock.patch.object(a10.a10_context.A10Context, 'select_appliance_partition',
+                               side_effect=FakeException()):
+            with mock.patch.object(self.a, '_release_a10_client') as release:
+                self.assertRaises(FakeException, a10.A10Context(
+                    self.handler, self.ctx, self.m, device_name='ax-write').__enter__)
+        release.assert_called_once_with(self.a.last_client, discard=False)
+
     def test_write(self):
         with a10.A10WriteContext(self.handler, self.ctx, self.m, device_name='ax-write') as c:
             c
@@ -103,6 +112,61 @@ class TestA10Context(test_base.UnitTestBase):
         except FakeException:
             self.empty_close_mocks()
 
+    def test_write_reads_primary(self):
+        with a10.A10Context(self.handler, self.ctx, self.m, device_name='ax-write'):
+            self.assertFalse(db_api.in_writes())
+        with a10.A10WriteContext(self.handler, self.ctx, self.m, device_name='ax-write'):
+            self.assertTrue(db_api.in_writes())
+        self.assertFalse(db_api.in_writes())
+
+    def test_write_e_reads_primary(self):
+        try:
+            with a10.A10WriteContext(self.handler, self.ctx, self.m, device_name='ax-write'):
+                raise FakeException()
+        except FakeException:
+            pass
+        self.assertFalse(db_api.in_writes())
+
+    def _use_database(self):
+        get = self.a.config.get
+        patcher = mock.patch.object(
+            self.a.config, 'get', side_effect=lambda k: k == 'use_database' or get(k))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(db_api, 'get_session')
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+    def test_one_db_session(self):
+        get_session = self._use_database()
+        with mock.patch.object(self.a, '_select_a10_device',
+                               return_value=self.a.config.get_device('ax-write')) as select:
+            with a10.A10WriteContext(self.handler, self.ctx, self.m) as c:
+                db = c.db_session
+        get_session.assert_called_once_with(readonly=True, expire_on_commit=False)
+        self.assertIs(db, get_session.return_value)
+        self.assertIs(db, select.call_args[1]['db_session'])
+        db.commit.assert_called_once_with()
+        db.rollback.assert_not_called()
+        db.close.assert_called_once_with()
+        self.assertIsNone(c.db_session)
+
+    def test_db_session_rolled_back(self):
+        get_session = self._use_database()
+        try:
+            with a10.A10WriteContext(self.handler, self.ctx, self.m, device_name='ax-write'):
+                raise FakeException()
+        except FakeException:
+            pass
+        db = get_session.return_value
+        db.rollback.assert_called_once_with()
+        db.commit.assert_not_called()
+        db.close.assert_called_once_with()
+
+    def test_no_db_session(self):
+        with a10.A10WriteContext(self.handler, self.ctx, self.m, device_name='ax-write') as c:
+            self.assertIsNone(c.db_session)
+
     def test_write_status(self):
         with a10.A10WriteStatusContext(self.handler, self.ctx, self.m) as c:
             c
@@ -188,3 +252,62 @@ class TestA10ContextHA(TestA10Context):
             c
         self.a.last_client.ha.sync.assert_called_with('1.1.1.1', 'admin', 'a10')
         self.a.last_client.session.close.assert_called_with()
+
+    def test_write_coalesced(self):
+        self.a.write_memory_scheduler = mock.Mock()
+        with a10.A10WriteContext(self.handler, self.ctx, self.m, device_name='ax4') as c:
+            c
+        self.a.write_memory_scheduler.schedule.assert_called_once_with(
+            c.device_cfg, c.partition_name)
+        self.a.last_client.system.action.activate_and_write.assert_not_called()
+        self.a.last_client.ha.sync.assert_not_called()
+
+    def test_ha_async(self):
+        self.a.ha_sync_executor = mock.Mock()
+        with a10.A10WriteContext(self.handler, self.ctx, self.m, device_name='ax4') as c:
+            c
+        self.a.ha_sync_executor.schedule.assert_called_once_with(c.device_cfg)
+        self.a.last_client.ha.sync.assert_not_called()
+
+
+class TestA10ContextPooledADP(test_base.UnitTestBase):
+
+    def setUp(self):
+        super(TestA10ContextPooledADP, self).setUp()
+        self.handler = self.a.pool
+        self.ctx = mock.Mock()
+        self.m = fake_objs.FakeLoadBalancer()
+        self.name = self.m.tenant_id[0:13]
+        device = self.a.config.get_device('axadp-noalt')
+        self.addCleanup(device.__setitem__, 'v_method', device['v_method'])
+        device['v_method'] = 'adp'
+        patcher = mock.patch.object(self.a.config._config, 'use_parent_project', False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        pool = self.a.session_pool
+        pool.tracks = mock.Mock(return_value=True)
+        pool.activate_partition = mock.Mock()
+        pool.partition_exists = mock.Mock(return_value=True)
+        pool.partition_created = mock.Mock()
+        pool.release = mock.Mock()
+
+    def _context(self):
+        return a10.A10Context(self.handler, self.ctx, self.m, device_name='axadp-noalt')
+
+    def test_partition_tracked(self):
+        with self._context() as c:
+            c
+        self.a.session_pool.activate_partition.assert_called_once_with(
+            self.a.last_client, self.name)
+        self.a.last_client.system.partition.active.assert_not_called()
+        self.a.session_pool.release.assert_called_once_with(
+            self.a.last_client, discard=False)
+
+    def test_known_missing_partition_skips_probe(self):
+        self.a.session_pool.partition_exists.return_value = False
+        with self._context() as c:
+            c
+        self.a.last_client.system.partition.create.assert_called_once_with(self.name)
+        self.a.session_pool.partition_created.assert_called_once_with(c.device_cfg, self.name)
+        self.a.session_pool.activate_partition.assert_called_once_with(
+            self.a.last_client, self.name)
@@ -215,6 +215,7 @@ class TestLB(test_base.HandlerTestBase):
         test_lb = fake_objs.FakeLoadBalancer()
         test_lb.stats_v30()
         c = mock.MagicMock()
+        c._session_pool.return_value = None
         c.client.slb.virtual_server.get = mock.Mock(return_value=test_lb.virt_server)
         c.client.slb.service_group.stats = mock.Mock(return_value=test_lb.service_group)
         c.client.slb.service_group.get = mock.Mock(return_value=test_lb.members)
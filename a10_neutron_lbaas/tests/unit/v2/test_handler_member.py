@@ -16,6 +16,7 @@ import logging
 import mock
 
 import a10_neutron_lbaas.a10_exceptions as a10_ex
+import a10_neutron_lbaas.v2.handler_member as handler_member
 
 from a10_neutron_lbaas.tests.unit.v2 import fake_objs
 from a10_neutron_lbaas.tests.unit.v2 import test_base
@@ -162,6 +163,95 @@ class TestMembers(test_base.HandlerTestBase):
         self.a.last_client.slb.service_group.member.delete.assert_called_with(
             m.pool_id, name, m.protocol_port)
 
+    def _members(self, n, address='2.2.2.2'):
+        return [fake_objs.FakeMember(id='fake-member-id-%03d' % i, address=address,
+                                     pool=mock.MagicMock())
+                for i in range(n)]
+
+    def test_create_many_one_context(self):
+        members = self._members(3)
+        self.a.member.create_many(None, members)
+
+        s = self.a.last_client.slb.service_group.member.create
+        self.assertEqual(3, s.call_count)
+        self.a.last_client.system.action.activate_and_write.assert_called_once_with(
+            mock.ANY)
+        mgr = self.a.openstack_driver.member
+        mgr.successful_completion.assert_has_calls(
+            [mock.call(None, m, delete=False) for m in members])
+        mgr.failed_completion.assert_not_called()
+
+    def test_create_many_partial_failure(self):
+        members = self._members(3)
+
+        def fail_second(c, context, member):
+            if member is members[1]:
+                raise Exception("boom")
+
+        with mock.patch.object(handler_member.MemberHandler, '_create',
+                               side_effect=fail_second):
+            self.a.member.create_many(None, members)
+
+        mgr = self.a.openstack_driver.member
+        mgr.successful_completion.assert_has_calls(
+            [mock.call(None, members[0], delete=False),
+             mock.call(None, members[2], delete=False)])
+        mgr.failed_completion.assert_called_once_with(None, members[1])
+
+    def test_create_many_device_failure(self):
+        members = self._members(2)
+        self.a._select_a10_device = mock.Mock(side_effect=Exception("no device"))
+        self.a.member.create_many(None, members)
+
+        mgr = self.a.openstack_driver.member
+        mgr.successful_completion.assert_not_called()
+        mgr.failed_completion.assert_has_calls([mock.call(None, m) for m in members])
+
+    def test_update_many(self):
+        members = self._members(2)
+        self.a.member.update_many(None, members)
+
+        self.assertEqual(2, self.a.last_client.slb.service_group.member.update.call_count)
+        self.a.last_client.system.action.activate_and_write.assert_called_once_with(
+            mock.ANY)
+
+    def test_delete_many_last_member_deletes_server(self):
+        members = self._members(2)
+        name = self.a.member._get_name(members[0], '2.2.2.2')
+        neutron = self.a.member.neutron
+        neutron.member_get_ips = mock.Mock(return_value={'2.2.2.2': '2.2.2.2'})
+        neutron.member_counts = mock.Mock(
+            return_value={(members[0].tenant_id, '2.2.2.2'): 2})
+
+        self.a.member.delete_many(None, members)
+
+        self.a.last_client.slb.service_group.member.delete.assert_called_once_with(
+            members[0].pool_id, name, members[0].protocol_port)
+        self.a.last_client.slb.server.delete.assert_called_once_with(name)
+        self.a.openstack_driver.member.successful_completion.assert_has_calls(
+            [mock.call(None, m, delete=True) for m in members])
+        neutron.member_counts.assert_called_once_with(None, members)
+
+    def test_delete_many_server_shared_across_loadbalancers(self):
+        # One member on each of two load balancers, and a third member that
+        # stays; the server must outlive both deletes
+        members = self._members(2)
+        members[1].root_loadbalancer = fake_objs.FakeLoadBalancer()
+        members[1].root_loadbalancer.id = 'fake-lb-id-002'
+        name = self.a.member._get_name(members[0], '2.2.2.2')
+        key = (members[0].tenant_id, '2.2.2.2')
+        neutron = self.a.member.neutron
+        neutron.member_get_ips = mock.Mock(return_value={'2.2.2.2': '2.2.2.2'})
+        # Read per load balancer, after the first one's member is deleted
+        neutron.member_counts = mock.Mock(side_effect=[{key: 3}, {key: 2}])
+
+        self.a.member.delete_many(None, members)
+
+        self.assertEqual(2, neutron.member_counts.call_count)
+        self.a.last_client.slb.server.delete.assert_not_called()
+        self.a.last_client.slb.service_group.member.delete.assert_called_with(
+            members[1].pool_id, name, members[1].protocol_port)
+
     def _test_create_expressions(self, os_name, pattern, expressions=None):
         self.a.config.get_member_expressions = self._get_expressions_mock
         expressions = expressions or self.a.config.get_member_expressions()
@@ -173,7 +173,7 @@ class TestPools(test_base.HandlerTestBase):
                                                   pers, lst,
                                                   members=m,
                                                   hm=hm)
-                        self.a.pool.neutron.member_count.return_value = 1
+                        self.a.pool.neutron.member_counts.return_value = {}
                         self.a.pool.delete(None, pool)
 
                         self.print_mocks()
@@ -190,6 +190,30 @@ class TestPools(test_base.HandlerTestBase):
                                 cookie_persistence.delete.
                                 assert_called_with(pool.id))
 
+    def test_delete_members_batched_lookups(self):
+        members = [fake_objs.FakeMember(id='m1', address='2.2.2.2'),
+                   fake_objs.FakeMember(id='m2', address='2.2.2.2'),
+                   fake_objs.FakeMember(id='m3', address='3.3.3.3')]
+        pool = fake_objs.FakePool('TCP', 'ROUND_ROBIN', None, False, members=members)
+        neutron = self.a.pool.neutron
+        neutron.member_get_ips.return_value = {'2.2.2.2': '2.2.2.2', '3.3.3.3': '3.3.3.3'}
+        neutron.member_counts.return_value = {('get-off-my-lawn', '2.2.2.2'): 2,
+                                              ('get-off-my-lawn', '3.3.3.3'): 1}
+
+        self.a.pool.delete(None, pool)
+
+        neutron.member_get_ips.assert_called_once_with(None, members, mock.ANY)
+        neutron.member_counts.assert_called_once_with(None, members)
+        neutron.member_get_ip.assert_not_called()
+        neutron.member_count.assert_not_called()
+
+        name = self.a.member._get_name
+        self.a.last_client.slb.service_group.member.delete.assert_called_once_with(
+            'fake-pool', name(members[0], '2.2.2.2'), 80)
+        self.a.last_client.slb.server.delete.assert_has_calls(
+            [mock.call(name(members[1], '2.2.2.2')),
+             mock.call(name(members[2], '3.3.3.3'))])
+
     def _test_stats(self):
         pool = fake_objs.FakePool('TCP', 'ROUND_ROBIN', None, False)
         actual = self.a.pool.stats(None, pool)
@@ -17,6 +17,7 @@ import mock
 
 from a10_neutron_lbaas.tests.unit.v2 import fake_objs
 from a10_neutron_lbaas.tests.unit.v2 import test_base
+from a10_neutron_lbaas.vthunder import keystone as keystone_helpers
 
 
 class TestA10PartitionKey(test_base.UnitTestBase):
@@ -37,8 +38,10 @@ class TestA10PartitionKey(test_base.UnitTestBase):
         fake_keystone = mock.MagicMock()
         fake_keystone.client.projects.get = mock.MagicMock(
             return_value=fake_objs.FakeKeystoneClient("brick"))
-        a10.a10_context.keystone_helpers.KeystoneFromContext = mock.MagicMock(
-            return_value=fake_keystone)
+        patcher = mock.patch.object(keystone_helpers, 'KeystoneFromContext',
+                                    return_value=fake_keystone)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
         with a10.A10WriteContext(self.handler, self.ctx, self.m, device_name='axadp-noalt') as c:
             self.assertEqual(c.partition_key, "brick")
@@ -47,8 +50,10 @@ class TestA10PartitionKey(test_base.UnitTestBase):
         fake_keystone = mock.MagicMock()
         fake_keystone.client.projects.get = mock.MagicMock(
             return_value=fake_objs.FakeKeystoneClient())
-        a10.a10_context.keystone_helpers.KeystoneFromContext = mock.MagicMock(
-            return_value=fake_keystone)
+        patcher = mock.patch.object(keystone_helpers, 'KeystoneFromContext',
+                                    return_value=fake_keystone)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
         with a10.A10WriteContext(self.handler, self.ctx, self.m, device_name='axadp-noalt') as c:
             self.assertEqual(c.partition_key, "get-off-my-lawn")
@@ -0,0 +1,216 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import copy
+import json
+import os
+import shutil
+import tempfile
+
+import mock
+
+import a10_neutron_lbaas.tests.test_case as test_case
+
+from a10_neutron_lbaas.tests.unit.v2 import fake_objs
+from a10_neutron_lbaas.tests.unit.v2 import test_base
+from a10_neutron_lbaas.v2 import stats_poller
+
+
+def _device(**kwargs):
+    d = {'name': 'ax1', 'api_version': '3.0', 'v_method': 'LSI'}
+    d.update(kwargs)
+    return d
+
+
+class TestStatsPoller(test_case.TestCase):
+
+    def setUp(self):
+        super(TestStatsPoller, self).setUp()
+        self.fake = fake_objs.FakeLoadBalancer()
+        self.fake.stats_v30()
+
+        self.client = mock.MagicMock()
+        self.client.slb.virtual_server.all.return_value = {
+            'virtual-server-list': [dict(name='lb1', **self.fake.virt_server['virtual-server'])]}
+        self.client.slb.virtual_server._get.return_value = {
+            'virtual-server-list': [dict(name='lb1', **self.fake.port_list)]}
+        group = dict(name='3LD3RB33R135', **self.fake.service_group['service-group'])
+        group.update(self.fake.members)
+        self.client.slb.service_group.all_stats.return_value = {
+            'service-group-list': [group]}
+        self.client.slb.virtual_server.stats.side_effect = (
+            lambda name: copy.deepcopy(self.fake.port_list))
+        self.client.slb.service_group.stats.side_effect = (
+            lambda name: copy.deepcopy(self.fake.service_group))
+        self.client.slb.service_group.get.side_effect = (
+            lambda name: copy.deepcopy(self.fake.members))
+
+        self.driver = mock.Mock(session_pool=None)
+        self.driver.config.get_devices.return_value = {'ax1': _device()}
+        self.driver._get_a10_client.return_value = self.client
+        self.poller = stats_poller.StatsPoller(self.driver, interval=30)
+
+    def test_poll_loadbalancer(self):
+        self.poller.poll()
+        self.assertEqual(self.fake.ret_stats_v30, self.poller.loadbalancer_stats('lb1'))
+        self.driver._release_a10_client.assert_called_once_with(self.client)
+
+        self.client.slb.virtual_server._get.assert_called_once_with('/slb/virtual-server/stats')
+        self.client.slb.virtual_server.stats.assert_not_called()
+        self.client.slb.service_group.stats.assert_not_called()
+        self.client.slb.service_group.get.assert_not_called()
+
+    def test_poll_missing_from_collection(self):
+        self.client.slb.virtual_server._get.return_value = {'virtual-server-list': []}
+        self.client.slb.service_group.all_stats.return_value = {}
+        self.poller.poll()
+
+        self.assertEqual(self.fake.ret_stats_v30, self.poller.loadbalancer_stats('lb1'))
+        self.client.slb.virtual_server.stats.assert_called_once_with('lb1')
+        self.client.slb.service_group.stats.assert_called_once_with('3LD3RB33R135')
+
+    def test_poll_pool(self):
+        self.poller.poll()
+        self.assertEqual({'stats': {}, 'members': {}},
+                         self.poller.pool_stats('3LD3RB33R135'))
+
+    def test_unknown(self):
+        self.poller.poll()
+        self.assertIsNone(self.poller.loadbalancer_stats('nope'))
+
+    def test_stale(self):
+        with mock.patch('time.time', return_value=1000.0):
+            self.poller.poll()
+        with mock.patch('time.time', return_value=1061.0):
+            self.assertIsNone(self.poller.loadbalancer_stats('lb1'))
+        with mock.patch('time.time', return_value=1059.0):
+            self.assertIsNotNone(self.poller.loadbalancer_stats('lb1'))
+
+    def test_returns_copies(self):
+        self.poller.poll()
+        self.poller.loadbalancer_stats('lb1')['bytes_in'] = 0
+        self.assertEqual(1337, self.poller.loadbalancer_stats('lb1')['bytes_in'])
+
+    def test_skips_v21(self):
+        self.driver.config.get_devices.return_value = {'ax1': _device(api_version='2.1')}
+        self.poller.poll()
+        self.driver._get_a10_client.assert_not_called()
+
+    def test_adp_partitions(self):
+        self.driver.config.get_devices.return_value = {'ax1': _device(v_method='ADP')}
+        self.client.system.partition.all.return_value = {
+            'partition-all': {'oper': {'partition-list': [
+                {'partition-name': 'p1'}, {'partition-name': 'p2'}]}}}
+        self.poller.poll()
+
+        self.client.system.partition.active.assert_has_calls(
+            [mock.call('p1'), mock.call('p2')])
+        self.assertEqual(2, self.client.slb.virtual_server.all.call_count)
+
+    def test_failed_sweep_keeps_snapshot(self):
+        self.poller.poll()
+        self.client.slb.virtual_server.all.side_effect = Exception("down")
+        self.poller.poll()
+        self.assertIsNotNone(self.poller.loadbalancer_stats('lb1'))
+
+    def test_one_leader_per_state_dir(self):
+        state_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, state_dir)
+        leader = stats_poller.StatsPoller(self.driver, interval=30, state_dir=state_dir)
+        other = stats_poller.StatsPoller(self.driver, interval=30, state_dir=state_dir)
+        self.addCleanup(lambda: leader._lock_file and leader._lock_file.close())
+
+        leader.sweep()
+        other.sweep()
+        self.assertTrue(leader.leader)
+        self.assertFalse(other.leader)
+        self.assertEqual(1, self.driver._get_a10_client.call_count)
+        self.assertEqual(self.fake.ret_stats_v30, other.loadbalancer_stats('lb1'))
+
+        # The next worker to try takes over once the leader is gone
+        leader._lock_file.close()
+        leader._lock_file = None
+        other.sweep()
+        self.addCleanup(other._lock_file.close)
+        self.assertTrue(other.leader)
+        self.assertEqual(2, self.driver._get_a10_client.call_count)
+
+    def test_forked_worker_follows(self):
+        state_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, state_dir)
+        poller = stats_poller.StatsPoller(self.driver, interval=3600, state_dir=state_dir)
+        # Started, as far as a forked worker can tell; sweeps are run by hand
+        poller._thread = mock.Mock()
+        poller.sweep()
+        self.addCleanup(poller._lock_file.close)
+
+        go_r, go_w = os.pipe()
+        out_r, out_w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os.read(go_r, 1)
+                result = {'stats': poller.loadbalancer_stats('lb1'),
+                          'leader': poller.leader,
+                          'led': poller._lead(),
+                          'thread': poller._thread.is_alive()}
+                os.write(out_w, json.dumps(result).encode('utf-8'))
+            finally:
+                os._exit(0)
+        os.close(go_r)
+        os.close(out_w)
+
+        # A sweep by the parent after the fork reaches the worker
+        self.fake.port_list['port-list'][0]['stats']['total_fwd_bytes'] = 7
+        self.client.slb.virtual_server._get.return_value = {
+            'virtual-server-list': [dict(name='lb1', **self.fake.port_list)]}
+        poller.sweep()
+        os.write(go_w, b'x')
+        os.waitpid(pid, 0)
+        result = json.loads(os.read(out_r, 65536).decode('utf-8') or 'null')
+        os.close(go_w)
+        os.close(out_r)
+        self.assertIsNotNone(result)
+
+        self.assertEqual(7, result['stats']['bytes_in'])
+        self.assertFalse(result['leader'])
+        self.assertFalse(result['led'])
+        self.assertTrue(result['thread'])
+
+
+class TestStatsFromPoller(test_base.UnitTestBase):
+
+    def test_lb_stats_cached(self):
+        self.a.stats_poller = mock.Mock()
+        self.a.stats_poller.loadbalancer_stats.return_value = {'bytes_in': 1}
+        lb = fake_objs.FakeLoadBalancer()
+
+        self.assertEqual({'bytes_in': 1}, self.a.lb.stats(None, lb))
+        self.a.stats_poller.loadbalancer_stats.assert_called_once_with(lb.id)
+        self.a.last_client.slb.virtual_server.stats.assert_not_called()
+
+    def test_lb_stats_miss(self):
+        self.a.stats_poller = mock.Mock()
+        self.a.stats_poller.loadbalancer_stats.return_value = None
+        self.a.lb.stats(None, fake_objs.FakeLoadBalancer())
+        s = str(self.a.last_client.mock_calls)
+        self.assertIn('call.slb.virtual_server.stats', s)
+
+    def test_pool_stats_cached(self):
+        self.a.stats_poller = mock.Mock()
+        self.a.stats_poller.pool_stats.return_value = {'stats': {'x': 1}, 'members': {}}
+        pool = fake_objs.FakePool('TCP', 'ROUND_ROBIN', None, False)
+
+        self.assertEqual({'stats': {'x': 1}, 'members': {}}, self.a.pool.stats(None, pool))
+        self.a.last_client.slb.service_group.stats.assert_not_called()
@@ -0,0 +1,108 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import time
+
+import mock
+
+import a10_neutron_lbaas.tests.test_case as test_case
+
+from a10_neutron_lbaas.vthunder import keystone
+
+
+def _project(id, parent_id='default'):
+    return mock.Mock(id=id, parent_id=parent_id, domain_id='default')
+
+
+class TestProjectHierarchy(test_case.TestCase):
+
+    def setUp(self):
+        super(TestProjectHierarchy, self).setUp()
+        self.ks = mock.MagicMock()
+        patcher = mock.patch.object(keystone, 'KeystoneFromContext',
+                                    return_value=self.ks)
+        self.ks_from_context = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.projects = self.ks.client.projects
+        self.h = keystone.ProjectHierarchy(mock.Mock(), ttl=300)
+
+    def test_parent_of_cached(self):
+        self.projects.get.return_value = _project('child', 'parent')
+        self.assertEqual('parent', self.h.parent_of(None, 'child'))
+        self.assertEqual('parent', self.h.parent_of(None, 'child'))
+        self.projects.get.assert_called_once_with('child')
+        self.ks_from_context.assert_called_once()
+
+    def test_parent_of_top_level(self):
+        self.projects.get.return_value = _project('top')
+        self.assertIsNone(self.h.parent_of(None, 'top'))
+        self.assertIsNone(self.h.parent_of(None, 'top'))
+        self.projects.get.assert_called_once_with('top')
+
+    def test_parent_of_expires(self):
+        self.projects.get.return_value = _project('child', 'parent')
+        with mock.patch('time.time', return_value=1000.0):
+            self.h.parent_of(None, 'child')
+        with mock.patch('time.time', return_value=1301.0):
+            self.h.parent_of(None, 'child')
+        self.assertEqual(2, self.projects.get.call_count)
+
+    def test_children_of_lists_one_parent(self):
+        self.projects.list.return_value = [_project('a', 'p'), _project('b', 'p'),
+                                           _project('c', 'other')]
+        self.assertEqual(['a', 'b'], sorted(self.h.children_of(None, 'p')))
+        self.assertEqual(['a', 'b'], sorted(self.h.children_of(None, 'p')))
+        self.projects.list.assert_called_once_with(parent='p')
+
+    def test_children_fill_parent_index(self):
+        self.projects.list.return_value = [_project('a', 'p')]
+        self.h.children_of(None, 'p')
+        self.assertEqual('p', self.h.parent_of(None, 'a'))
+        self.projects.get.assert_not_called()
+
+    def test_new_child_joins_cached_children(self):
+        self.projects.list.return_value = [_project('a', 'p')]
+        self.h.children_of(None, 'p')
+        self.projects.get.return_value = _project('b', 'p')
+        self.h.parent_of(None, 'b')
+        self.assertEqual(['a', 'b'], sorted(self.h.children_of(None, 'p')))
+        self.projects.list.assert_called_once_with(parent='p')
+
+    def test_children_of_fresh(self):
+        self.projects.list.return_value = [_project('a', 'p')]
+        self.h.children_of(None, 'p')
+        self.projects.list.return_value = [_project('a', 'p'), _project('b', 'p')]
+        self.assertEqual(['a', 'b'], sorted(self.h.children_of(None, 'p', fresh=True)))
+        self.assertEqual(['a', 'b'], sorted(self.h.children_of(None, 'p')))
+        self.assertEqual(2, self.projects.list.call_count)
+
+    def test_reparented_leaves_old_parent(self):
+        self.projects.list.return_value = [_project('a', 'p'), _project('b', 'p')]
+        self.h.children_of(None, 'p')
+        self.projects.list.return_value = [_project('a', 'q')]
+        self.h.children_of(None, 'q')
+        self.assertEqual(['b'], self.h.children_of(None, 'p'))
+
+        with mock.patch('time.time', return_value=time.time() + 301):
+            self.projects.get.return_value = _project('b', 'q')
+            self.h.parent_of(None, 'b')
+        self.assertEqual([], self.h.children_of(None, 'p'))
+        self.assertEqual(['a', 'b'], sorted(self.h.children_of(None, 'q')))
+
+    def test_invalidate(self):
+        self.projects.get.return_value = _project('child', 'parent')
+        self.h.parent_of(None, 'child')
+        self.h.invalidate('child')
+        self.h.parent_of(None, 'child')
+        self.assertEqual(2, self.projects.get.call_count)
@@ -15,9 +15,6 @@
 import a10_neutron_lbaas.handler_base as base
 from a10_neutron_lbaas.v2 import neutron_ops
 
-import re
-from six import iteritems
-
 
 class HandlerBaseV2(base.HandlerBase):
     def __init__(self, a10_driver, openstack_manager, neutron=None):
@@ -32,23 +29,13 @@ class HandlerBaseV2(base.HandlerBase):
     Pass in an element, it's openstack name, and a dictionary of matches.
     """
     def _get_name_matches(self, elem, os_name, redict):
-        # for each key in the vport_defaults dictionary
         if not os_name or len(os_name) < 1:
             return
 
-        for k, v in list(iteritems(redict)):
-            # check to see if the regex value matches.
-            v = redict[k]
-
-            regex_str = v["regex"]
-            json_merge = v["json"]
-            regex = re.compile(regex_str)
-            matched = regex.search(os_name)
-
-            if matched:
-                # If so, take those dictionary values and apply them to the object
-                elem.update(json_merge)
-                break
+        # The first expression whose regex matches supplies the values to apply
+        json_merge = self.a10_driver.config.get_name_matcher(redict).match(os_name)
+        if json_merge is not None:
+            elem.update(json_merge)
 
     def _get_config_defaults(self, c, os_name):
         rv = {}
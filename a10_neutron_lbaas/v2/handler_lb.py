@@ -16,12 +16,77 @@ import logging
 
 import acos_client.errors as acos_errors
 
+from a10_neutron_lbaas.acos import fanout
 from a10_neutron_lbaas.v2 import handler_base_v2
 from a10_neutron_lbaas.v2 import v2_context as a10
 
 LOG = logging.getLogger(__name__)
 
 
+def _fetch_virtual_server(client, item):
+    name, what = item
+    if what == 'stats':
+        return client.slb.virtual_server.stats(name)
+    return client.slb.virtual_server.get(name)
+
+
+def _fetch_service_group(client, item):
+    name, what = item
+    if what == 'stats':
+        return client.slb.service_group.stats(name)
+    return client.slb.service_group.get(name + "/member/stats")
+
+
+def empty_stats():
+    return {
+        "bytes_in": 0,
+        "bytes_out": 0,
+        "active_connections": 0,
+        "total_connections": 0,
+        "extended_stats": {}
+    }
+
+
+def merge_stats_v30(resp, virt_serv, groups):
+    """Build v3 load balancer stats from the virtual server's port stats,
+    its definition, and (service group stats, member stats) for each port
+    that has a service group, in port order.
+    """
+    stats = {}
+    for ports in resp['port-list']:
+        for k, v in ports['stats'].items():
+            if stats.get(k):
+                stats[k] += v
+            else:
+                stats[k] = v
+
+    resp["loadbalancer_stat"] = stats
+    resp["loadbalancer_stat"]["listener_stat"] = resp["port-list"]
+    del resp["port-list"]
+
+    for pool, members in groups:
+        resp["loadbalancer_stat"]["pool_stat_list"] = pool["service-group"]["stats"]
+        if members:
+            stats = {}
+            for mems in members['member-list']:
+                for k, v in mems['stats'].items():
+                    if stats.get(k):
+                        stats[k] += v
+                    else:
+                        stats[k] = v
+            resp["loadbalancer_stat"]["pool_stat_list"].update(stats)
+            resp["loadbalancer_stat"]["pool_stat_list"]["member_list"] = members.get(
+                'member-list')
+
+    return {
+        "bytes_in": resp["loadbalancer_stat"]["total_fwd_bytes"],
+        "bytes_out": resp["loadbalancer_stat"]["total_rev_bytes"],
+        "active_connections": resp["loadbalancer_stat"]["curr_conn"],
+        "total_connections": resp["loadbalancer_stat"]["total_conn"],
+        "extended_stats": resp
+    }
+
+
 class LoadbalancerHandler(handler_base_v2.HandlerBaseV2):
 
     def _set(self, set_method, c, context, lb):
@@ -76,44 +141,23 @@ class LoadbalancerHandler(handler_base_v2.HandlerBaseV2):
             "total_connections": resp["loadbalancer_stat"]["tot_conns"],
             "extended_stats": resp}
 
-    def _stats_v30(self, c, resp, name):
-        stats = {}
-        for ports in resp['port-list']:
-            for k, v in ports['stats'].items():
-                if stats.get(k):
-                    stats[k] += v
-                else:
-                    stats[k] = v
-
-        resp["loadbalancer_stat"] = stats
-        resp["loadbalancer_stat"]["listener_stat"] = resp["port-list"]
-        del resp["port-list"]
-
-        virt_serv = c.client.slb.virtual_server.get(name)
-        for port in virt_serv['virtual-server']['port-list']:
-            if port.get("service-group"):
-                pool = c.client.slb.service_group.stats(port["service-group"])
-                resp["loadbalancer_stat"]["pool_stat_list"] = pool["service-group"]["stats"]
-                members = c.client.slb.service_group.get(port["service-group"] + "/member/stats")
-                if members:
-                    stats = {}
-                    for mems in members['member-list']:
-                        for k, v in mems['stats'].items():
-                            if stats.get(k):
-                                stats[k] += v
-                            else:
-                                stats[k] = v
-                    resp["loadbalancer_stat"]["pool_stat_list"].update(stats)
-                    resp["loadbalancer_stat"]["pool_stat_list"]["member_list"] = members.get(
-                        'member-list')
+    def _fan_out(self, c, fn, items):
+        return fanout.fan_out(c, fn, items,
+                              workers=self.a10_driver.config.get('stats_workers'))
 
-        return {
-            "bytes_in": resp["loadbalancer_stat"]["total_fwd_bytes"],
-            "bytes_out": resp["loadbalancer_stat"]["total_rev_bytes"],
-            "active_connections": resp["loadbalancer_stat"]["curr_conn"],
-            "total_connections": resp["loadbalancer_stat"]["total_conn"],
-            "extended_stats": resp
-        }
+    def _stats_v30(self, c, resp, name, virt_serv=None):
+        if virt_serv is None:
+            virt_serv = c.client.slb.virtual_server.get(name)
+
+        # Fetch every service group's stats and member stats at once, then
+        # merge them in port order.
+        groups = [port["service-group"] for port in virt_serv['virtual-server']['port-list']
+                  if port.get("service-group")]
+        fetched = self._fan_out(c, _fetch_service_group,
+                                [(sg, what) for sg in groups for what in ('stats', 'members')])
+
+        return merge_stats_v30(resp, virt_serv,
+                               [(fetched[2 * i], fetched[2 * i + 1]) for i in range(len(groups))])
 
     def create(self, context, lb):
         LOG.debug('IN CREATE_TEST_V2')
@@ -139,21 +183,27 @@ class LoadbalancerHandler(handler_base_v2.HandlerBaseV2):
             self.hooks.after_vip_delete(c, context, lb)
 
     def stats(self, context, lb):
+        name = self.meta(lb, 'id', lb.id)
+
+        poller = self.a10_driver.stats_poller
+        if poller is not None:
+            cached = poller.loadbalancer_stats(name)
+            if cached is not None:
+                return cached
+
         with a10.A10Context(self, context, lb) as c:
-            name = self.meta(lb, 'id', lb.id)
-            resp = c.client.slb.virtual_server.stats(name)
+            virt_serv = None
+            if c.device_cfg.get('api_version') == "3.0":
+                resp, virt_serv = self._fan_out(c, _fetch_virtual_server,
+                                                [(name, 'stats'), (name, 'get')])
+            else:
+                resp = c.client.slb.virtual_server.stats(name)
 
             if not resp:
-                return {
-                    "bytes_in": 0,
-                    "bytes_out": 0,
-                    "active_connections": 0,
-                    "total_connections": 0,
-                    "extended_stats": {}
-                }
+                return empty_stats()
 
             if c.device_cfg.get('api_version') == "3.0":
-                return self._stats_v30(c, resp, name)
+                return self._stats_v30(c, resp, name, virt_serv)
             else:
                 return self._stats_v21(c, resp)
 
@@ -13,13 +13,12 @@
 #    under the License.
 
 import logging
+import threading
 
 import acos_client.errors as acos_errors
 
 from a10_neutron_lbaas.acos import openstack_mappings
 from a10_neutron_lbaas import constants
-from a10_neutron_lbaas.neutron_ext.db.certificate_db \
-    import A10CertificateDbMixin as A10CertificateDb
 from a10_neutron_lbaas.v2 import handler_base_v2
 from a10_neutron_lbaas.v2 import handler_persist
 from a10_neutron_lbaas.v2 import v2_context as a10
@@ -36,17 +35,26 @@ class ListenerHandler(handler_base_v2.HandlerBaseV2):
         super(ListenerHandler, self).__init__(a10_driver, openstack_manager, neutron)
         self._barbican_client = barbican_client
         self._cert_db = cert_db
+        # The handler is shared between threads; build these only once
+        self._lock = threading.Lock()
 
     @property
     def cert_db(self):
         if self._cert_db is None:
-            self._cert_db = A10CertificateDb()
+            # Pulls in neutron and a10_openstack_lib; only needed with certificates
+            from a10_neutron_lbaas.neutron_ext.db import certificate_db
+
+            with self._lock:
+                if self._cert_db is None:
+                    self._cert_db = certificate_db.A10CertificateDbMixin()
         return self._cert_db
 
     @property
     def barbican_client(self):
         if self._barbican_client is None:
-            self._barbican_client = certwrapper.CertManagerWrapper(handler=self)
+            with self._lock:
+                if self._barbican_client is None:
+                    self._barbican_client = certwrapper.CertManagerWrapper(handler=self)
         return self._barbican_client
 
     def _set(self, set_method, c, context, listener):
@@ -150,45 +158,14 @@ class ListenerHandler(handler_base_v2.HandlerBaseV2):
         # This doesn't do anything anymore.
         vport_meta = self.meta(listener.loadbalancer, 'vip_port', {})
 
-        # TODO(mdurrant): This breaks if we introduce non-template args
-        # template_args.update(**self._get_vport_defaults(c, os_name))
-
-        vport_defaults = self._get_vport_defaults(c, os_name)
-
-        # ADD A CONDITION TO VPORT DEFAULTS TO FIX THIS
-        # EXAMPLE:
-        # "condition": {"field": "protocol", "op": "=", "value": "http"}}
-        if "ha-conn-mirror" in vport_defaults and protocol.lower() not in ("tcp", "udp"):
-            del vport_defaults["ha-conn-mirror"]
-
-        if "ha-conn-mirror" in template_args and protocol.lower() not in ("tcp", "udp"):
-            del template_args["ha-conn-mirror"]
-
-        if "template-http" in vport_defaults and protocol.lower() not in ("http", "https"):
-            del vport_defaults["template-http"]
-
-        if "template-http" in template_args and protocol.lower() not in ("http", "https"):
-            del template_args["template-http"]
-
-        if "no-dest-nat" in vport_defaults and protocol.lower() in ("http", "https"):
-            del vport_defaults["no-dest-nat"]
-
-        if "no-dest-nat" in template_args and protocol.lower() in ("http", "https"):
-            del template_args["no-dest-nat"]
+        # Defaults that don't apply to this protocol were dropped when the
+        # template was built; see vport_templates.VPORT_DEFAULT_CONDITIONS
+        template = self.a10_driver.config.get_vport_template(c.device_cfg, protocol)
+        protocol, vport_defaults = template.build(self._get_vport_name_match(c, os_name))
 
         if hasattr(listener, 'aflex'):
             template_args["aflex-scripts"] = listener.aflex
 
-        if "protocol" in vport_defaults:
-            protocol = vport_defaults["protocol"]
-            del vport_defaults["protocol"]
-
-        conf_templates = c.device_cfg.get('templates')
-        if conf_templates:
-            virtual_port_templates = conf_templates.get("virtual-port", None)
-        else:
-            virtual_port_templates = None
-
         try:
 
             set_method(
@@ -207,7 +184,7 @@ class ListenerHandler(handler_base_v2.HandlerBaseV2):
                 no_dest_nat=c.device_cfg.get('no-dest-nat'),
                 conn_limit=c.device_cfg.get('conn-limit'),
                 # Device-level defaults
-                virtual_port_templates=virtual_port_templates,
+                virtual_port_templates=template.virtual_port_templates,
                 vport_defaults=vport_defaults,
                 axapi_body=vport_meta,
                 **template_args)
@@ -361,20 +338,10 @@ class ListenerHandler(handler_base_v2.HandlerBaseV2):
                 LOG.exception(ex)
         return binding
 
-    def _get_global_vport_defaults(self, c):
-        return c.a10_driver.config.get_vport_defaults()
-
-    def _get_device_vport_defaults(self, c):
-        return c.device_cfg.get("vport_defaults")
-
-    def _get_vport_defaults(self, c, vport_name):
-        rv = {}
-        # Device-specific defaults have precedence over global
-        rv.update(self._get_global_vport_defaults(c))
-        rv.update(self._get_device_vport_defaults(c))
-        if vport_name and len(vport_name) > 0:
-            self._get_name_matches(rv, vport_name, self._get_expressions(c))
-        return rv
+    def _get_vport_name_match(self, c, vport_name):
+        if vport_name:
+            return self.a10_driver.config.get_name_matcher(self._get_expressions(c)).match(
+                vport_name)
 
     def _get_expressions(self, c):
         rv = {}
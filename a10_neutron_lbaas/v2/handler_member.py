@@ -14,6 +14,7 @@
 
 
 import binascii
+import collections
 import logging
 import re
 
@@ -97,38 +98,56 @@ class MemberHandler(handler_base_v2.HandlerBaseV2):
             self._create(c, context, member)
             self.hooks.after_member_create(c, context, member)
 
-    def update(self, context, old_member, member):
-        with a10.A10WriteStatusContext(self, context, member) as c:
-            server_ip = self.neutron.member_get_ip(context, member,
-                                                   c.device_cfg['use_float'])
-            server_name = self._meta_name(member, server_ip)
+    def _update(self, c, context, member):
+        server_ip = self.neutron.member_get_ip(context, member,
+                                               c.device_cfg['use_float'])
+        server_name = self._meta_name(member, server_ip)
 
-            status = c.client.slb.UP
-            if not member.admin_state_up:
-                status = c.client.slb.DOWN
+        status = c.client.slb.UP
+        if not member.admin_state_up:
+            status = c.client.slb.DOWN
 
-            try:
-                member_args = {'member': self.meta(member, 'member', {})}
-                c.client.slb.service_group.member.update(
-                    self._pool_name(context, pool=member.pool),
-                    server_name,
-                    member.protocol_port,
-                    status,
-                    axapi_args=member_args)
-            except acos_errors.NotFound:
-                # Adding db relation after the fact
-                self._create(c, context, member)
+        try:
+            member_args = {'member': self.meta(member, 'member', {})}
+            c.client.slb.service_group.member.update(
+                self._pool_name(context, pool=member.pool),
+                server_name,
+                member.protocol_port,
+                status,
+                axapi_args=member_args)
+        except acos_errors.NotFound:
+            # Adding db relation after the fact
+            self._create(c, context, member)
 
+    def update(self, context, old_member, member):
+        with a10.A10WriteStatusContext(self, context, member) as c:
+            self._update(c, context, member)
             self.hooks.after_member_update(c, context, member)
 
-    def _delete(self, c, context, member):
-        server_ip = self.neutron.member_get_ip(
-            context, member, c.device_cfg['use_float'])
+    def _lookups(self, c, context, members):
+        # Server addresses and reference counts for many members, resolved
+        # with one query each instead of a few per member.
+        ips = self.neutron.member_get_ips(context, members, c.device_cfg['use_float'])
+        counts = self.neutron.member_counts(context, members)
+        return ips, counts
+
+    def _delete(self, c, context, member, deleted=0, lookups=None):
+        # `deleted` is the number of members sharing this server that were
+        # already removed from the device, but are still in the neutron db.
+        if lookups is None:
+            server_ip = self.neutron.member_get_ip(
+                context, member, c.device_cfg['use_float'])
+        else:
+            server_ip = lookups[0][member.address]
         server_name = self._meta_name(member, server_ip)
 
         try:
             c.client.slb.server.port.delete(server_name, member.protocol_port, 'TCP')
-            if self.neutron.member_count(context, member) > 1:
+            if lookups is None:
+                count = self.neutron.member_count(context, member)
+            else:
+                count = lookups[1].get((member.tenant_id, member.address), 0)
+            if count - deleted > 1:
                 c.client.slb.service_group.member.delete(
                     self._pool_name(context, pool_id=member.pool_id, pool=member.pool),
                     server_name,
@@ -144,6 +163,82 @@ class MemberHandler(handler_base_v2.HandlerBaseV2):
         with a10.A10DeleteContext(self, context, member) as c:
             self._delete(c, context, member)
 
+    def _delete_members(self, c, context, members):
+        lookups = self._lookups(c, context, members)
+        deleted = collections.Counter()
+        for member in members:
+            key = (member.tenant_id, member.address)
+            self._delete(c, context, member, deleted=deleted[key], lookups=lookups)
+            deleted[key] += 1
+
+    def _batch(self, context, members, context_class, op, delete=False, prepare=None):
+        # One context, and so one device lookup, session, partition switch
+        # and write memory, per load balancer rather than per member. Status
+        # is still reported member by member once the batch is on the device.
+        groups = collections.OrderedDict()
+        for member in members:
+            groups.setdefault(member.root_loadbalancer.id, []).append(member)
+
+        for group in groups.values():
+            done = []
+            failed = []
+            try:
+                with context_class(self, context, group[0]) as c:
+                    if prepare is not None:
+                        prepare(c, group)
+                    for member in group:
+                        try:
+                            op(c, member)
+                        except Exception:
+                            LOG.exception("A10 member batch: %s failed", member.id)
+                            failed.append(member)
+                        else:
+                            done.append(member)
+            except Exception:
+                LOG.exception("A10 member batch: load balancer %s failed",
+                              group[0].root_loadbalancer.id)
+                failed = group
+                done = []
+
+            for member in done:
+                self.openstack_manager.successful_completion(context, member,
+                                                             delete=delete)
+            for member in failed:
+                self.openstack_manager.failed_completion(context, member)
+
+    def create_many(self, context, members):
+        def op(c, member):
+            self._create(c, context, member)
+            self.hooks.after_member_create(c, context, member)
+
+        self._batch(context, members, a10.A10WriteContext, op)
+
+    def update_many(self, context, members):
+        def op(c, member):
+            self._update(c, context, member)
+            self.hooks.after_member_update(c, context, member)
+
+        self._batch(context, members, a10.A10WriteContext, op)
+
+    def delete_many(self, context, members):
+        # Per group: the member counts in the lookups are read after the
+        # earlier groups' members are gone from the neutron db already
+        lookups = {}
+        deleted = {}
+
+        def prepare(c, group):
+            lookups[id(c)] = self._lookups(c, context, group)
+            deleted[id(c)] = collections.Counter()
+
+        def op(c, member):
+            key = (member.tenant_id, member.address)
+            counter = deleted[id(c)]
+            self._delete(c, context, member, deleted=counter[key], lookups=lookups[id(c)])
+            counter[key] += 1
+
+        self._batch(context, members, a10.A10BatchDeleteContext, op, delete=True,
+                    prepare=prepare)
+
     def stats(self, context, member):
         retval = {
             "servers_up": 0,
@@ -24,6 +24,10 @@ import acos_client.errors as acos_errors
 LOG = logging.getLogger(__name__)
 
 
+def pool_stats(stats):
+    return {"stats": stats.get("stats", {}), "members": stats.get("members", {})}
+
+
 class PoolHandler(handler_base_v2.HandlerBaseV2):
 
     def _set(self, set_method, c, context, pool, old_pool=None):
@@ -76,10 +80,9 @@ class PoolHandler(handler_base_v2.HandlerBaseV2):
 
     def delete(self, context, pool):
         with a10.A10DeleteContext(self, context, pool) as c:
-            debug_fmt = "handler_pool.delete(): removing member {0} from pool {1}"
-            for member in pool.members:
-                LOG.debug(debug_fmt.format(member, member.pool_id))
-                self.a10_driver.member._delete(c, context, member)
+            LOG.debug("handler_pool.delete(): removing %d members from pool %s",
+                      len(pool.members), pool.id)
+            self.a10_driver.member._delete_members(c, context, pool.members)
 
             LOG.debug("handler_pool.delete(): Checking pool health monitor...")
             if pool.healthmonitor:
@@ -126,13 +129,17 @@ class PoolHandler(handler_base_v2.HandlerBaseV2):
         return
 
     def stats(self, context, pool):
+        poller = self.a10_driver.stats_poller
+        if poller is not None and pool.id is not None:
+            cached = poller.pool_stats(pool.id)
+            if cached is not None:
+                return cached
+
         result = {"stats": {}, "members": {}}
         with a10.A10Context(self, context, pool) as c:
             name = pool.id
             if name is not None:
-                stats = c.client.slb.service_group.stats(name)
-                result["stats"] = stats.get("stats", {})
-                result["members"] = stats.get("members", {})
+                result = pool_stats(c.client.slb.service_group.stats(name))
 
         return result
 
@@ -10,10 +10,16 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import sqlalchemy
+
 try:
-    from neutron.db import l3_db
+    # FloatingIP moved out of l3_db in Ocata
+    from neutron.db.models import l3 as l3_db
 except ImportError:
-    pass
+    try:
+        from neutron.db import l3_db
+    except ImportError:
+        pass
 try:
     from neutron_lbaas.db.loadbalancer import models as lb_db
 except ImportError:
@@ -21,6 +27,15 @@ except ImportError:
     pass
 
 
+# Keeps IN () lists below the bind parameter limits of the usual backends
+_CHUNK = 500
+
+
+def _chunks(items, size=_CHUNK):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
 class NeutronOpsV2(object):
 
     def __init__(self, handler):
@@ -42,6 +57,41 @@ class NeutronOpsV2(object):
             tenant_id=member.tenant_id,
             address=member.address).count()
 
+    def member_get_ips(self, context, members, use_float=False):
+        """member_get_ip for many members; returns {address: server ip}."""
+        rv = dict((m.address, m.address) for m in members)
+        if not use_float:
+            return rv
+
+        floating = {}
+        for addresses in _chunks(list(rv)):
+            q = context.session.query(l3_db.FloatingIP.fixed_ip_address,
+                                      l3_db.FloatingIP.floating_ip_address).filter(
+                l3_db.FloatingIP.fixed_ip_address.in_(addresses))
+            for fixed_ip, floating_ip in q:
+                floating.setdefault(fixed_ip, str(floating_ip))
+
+        rv.update(floating)
+        return rv
+
+    def member_counts(self, context, members):
+        """member_count for many members; returns {(tenant_id, address): count}."""
+        keys = set((m.tenant_id, m.address) for m in members)
+        tenants = set(k[0] for k in keys)
+
+        rv = {}
+        for addresses in _chunks(list(set(k[1] for k in keys))):
+            q = context.session.query(
+                lb_db.MemberV2.tenant_id, lb_db.MemberV2.address,
+                sqlalchemy.func.count(lb_db.MemberV2.id)).filter(
+                lb_db.MemberV2.tenant_id.in_(tenants),
+                lb_db.MemberV2.address.in_(addresses)).group_by(
+                lb_db.MemberV2.tenant_id, lb_db.MemberV2.address)
+            for tenant_id, address, count in q:
+                if (tenant_id, address) in keys:
+                    rv[(tenant_id, address)] = count
+        return rv
+
     def loadbalancer_total(self, context, tenant_id):
         return context.session.query(lb_db.LoadBalancer).filter_by(
             tenant_id=tenant_id).count()
@@ -0,0 +1,294 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import copy
+import errno
+import fcntl
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from a10_neutron_lbaas.v2 import handler_lb
+from a10_neutron_lbaas.v2 import handler_pool
+
+LOG = logging.getLogger(__name__)
+
+
+class _Snapshot(object):
+
+    def __init__(self, taken_at, loadbalancers=None, pools=None):
+        self.taken_at = taken_at
+        self.loadbalancers = loadbalancers or {}
+        self.pools = pools or {}
+
+    def to_dict(self):
+        return {'taken_at': self.taken_at,
+                'loadbalancers': self.loadbalancers,
+                'pools': self.pools}
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(d['taken_at'], d.get('loadbalancers'), d.get('pools'))
+
+
+class StatsPoller(object):
+    """Background sweep of load balancer and pool stats on every device.
+
+    Each configured aXAPI v3 device is swept every `interval` seconds, one
+    partition at a time, with the collection stats calls for virtual servers
+    and service groups, and the results are kept keyed by virtual server and
+    service group name. Stats handlers answer from the snapshot while it is
+    younger than `max_age` seconds and go to the device themselves otherwise,
+    so the load stats put on a device no longer depends on how often they
+    are asked for.
+
+    With a `state_dir`, the neutron workers on a host elect one of them, by
+    holding a lock file there, to do the sweeps; the leader writes its
+    snapshots to the same directory and the other workers read them from
+    there. Should the leader exit, the next worker to try takes over.
+    """
+
+    LOCK_FILE = 'poller.lock'
+    SNAPSHOT_FILE = 'stats.json'
+
+    def __init__(self, driver, interval=30, max_age=None, state_dir=None):
+        self.driver = driver
+        self.interval = interval
+        self.max_age = max_age or 2 * interval
+        self.state_dir = state_dir
+        self._lock = threading.Lock()
+        self._snapshots = {}
+        self._loaded_mtime = None
+        self._lock_file = None
+        self._stop = threading.Event()
+        self._thread = None
+        self._pid = os.getpid()
+
+    def start(self):
+        self._after_fork()
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='a10-stats-poller')
+            self._thread.daemon = True
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    @property
+    def leader(self):
+        return self.state_dir is None or self._lock_file is not None
+
+    def loadbalancer_stats(self, name):
+        return self._lookup('loadbalancers', name)
+
+    def pool_stats(self, name):
+        return self._lookup('pools', name)
+
+    def sweep(self):
+        """Polls the devices if this process is, or becomes, the leader."""
+        if not self._lead():
+            return
+        self.poll()
+        if self.state_dir is not None:
+            self._save()
+
+    def poll(self):
+        for name, device_cfg in self.driver.config.get_devices().items():
+            if str(device_cfg.get('api_version')) != '3.0':
+                continue
+            try:
+                snapshot = self._poll_device(device_cfg)
+            except Exception:
+                LOG.exception("A10 stats poller: sweep of %s failed", name)
+                continue
+            with self._lock:
+                self._snapshots[name] = snapshot
+
+    def _after_fork(self):
+        # neutron-server builds the driver, and with it the poller, before
+        # forking its API workers. A worker inherits the parent's lock file
+        # and snapshots but not its thread; the parent still holds the lock
+        # through its own descriptor, so the worker drops its copy and
+        # starts over as a follower.
+        pid = os.getpid()
+        if pid == self._pid:
+            return
+        self._pid = pid
+        self._lock = threading.Lock()
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+        if self._thread is not None:
+            self._thread = None
+            self.start()
+
+    def _lead(self):
+        self._after_fork()
+        if self.leader:
+            return True
+
+        path = os.path.join(self.state_dir, self.LOCK_FILE)
+        try:
+            if not os.path.isdir(self.state_dir):
+                os.makedirs(self.state_dir)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+        f = open(path, 'a')
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except (IOError, OSError):
+            f.close()
+            return False
+
+        # Held until this process exits
+        self._lock_file = f
+        LOG.info("A10 stats poller: polling devices from this process")
+        return True
+
+    def _save(self):
+        with self._lock:
+            data = dict((name, s.to_dict()) for name, s in self._snapshots.items())
+        fd, tmp = tempfile.mkstemp(dir=self.state_dir, prefix='.stats')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+            os.rename(tmp, os.path.join(self.state_dir, self.SNAPSHOT_FILE))
+        except Exception:
+            os.unlink(tmp)
+            raise
+
+    def _load(self):
+        path = os.path.join(self.state_dir, self.SNAPSHOT_FILE)
+        try:
+            mtime = os.stat(path).st_mtime
+            if mtime == self._loaded_mtime:
+                return
+            with open(path) as f:
+                data = json.load(f)
+        except (IOError, OSError, ValueError):
+            return
+
+        snapshots = dict((name, _Snapshot.from_dict(d)) for name, d in data.items())
+        with self._lock:
+            self._snapshots = snapshots
+            self._loaded_mtime = mtime
+
+    def _lookup(self, kind, name):
+        self._after_fork()
+        if not self.leader:
+            self._load()
+
+        now = time.time()
+        with self._lock:
+            for snapshot in self._snapshots.values():
+                if now - snapshot.taken_at > self.max_age:
+                    continue
+                stats = getattr(snapshot, kind).get(name)
+                if stats is not None:
+                    # Callers are free to mangle what they get back
+                    return copy.deepcopy(stats)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.sweep()
+            except Exception:
+                LOG.exception("A10 stats poller: sweep failed")
+            self._stop.wait(self.interval)
+
+    def _poll_device(self, device_cfg):
+        snapshot = _Snapshot(time.time())
+        client = self.driver._get_a10_client(device_cfg)
+        try:
+            for partition in self._partitions(client, device_cfg):
+                self._activate(client, partition)
+                self._poll_partition(client, snapshot)
+        finally:
+            self.driver._release_a10_client(client)
+        return snapshot
+
+    def _partitions(self, client, device_cfg):
+        if device_cfg.get('v_method', 'LSI').lower() != 'adp':
+            return [device_cfg.get('shared_partition', 'shared')]
+
+        z = client.system.partition.all()
+        return [p['partition-name'] for p in
+                z['partition-all']['oper'].get('partition-list', [])]
+
+    def _activate(self, client, name):
+        pool = self.driver.session_pool
+        if pool is not None and pool.tracks(client):
+            pool.activate_partition(client, name)
+        else:
+            client.system.partition.active(name)
+
+    def _vs_port_stats(self, client):
+        # acos_client has no wrapper for the collection call
+        resp = client.slb.virtual_server._get('/slb/virtual-server/stats') or {}
+        return dict((vs['name'], {'port-list': vs['port-list']})
+                    for vs in resp.get('virtual-server-list', [])
+                    if 'port-list' in vs)
+
+    def _sg_stats(self, client):
+        resp = client.slb.service_group.all_stats() or {}
+        groups = {}
+        for sg in resp.get('service-group-list', []):
+            members = None
+            if 'member-list' in sg:
+                members = {'member-list': sg['member-list']}
+            groups[sg['name']] = ({'service-group': {'stats': sg.get('stats', {})}}, members)
+        return groups
+
+    def _poll_partition(self, client, snapshot):
+        # Three calls per partition: the virtual server definitions, for the
+        # port to service group mapping, and the stats of every virtual
+        # server port and every service group with its members. Anything
+        # missing from the latter is fetched on its own.
+        virtual_servers = client.slb.virtual_server.all() or {}
+        port_stats = self._vs_port_stats(client)
+        all_groups = self._sg_stats(client)
+
+        groups = {}
+        for vs in virtual_servers.get('virtual-server-list', []):
+            resp = port_stats.get(vs['name'])
+            if resp is None:
+                resp = client.slb.virtual_server.stats(vs['name'])
+            if not resp:
+                snapshot.loadbalancers[vs['name']] = handler_lb.empty_stats()
+                continue
+
+            fetched = []
+            for port in vs.get('port-list', []):
+                sg = port.get('service-group')
+                if not sg:
+                    continue
+                # Several ports can share a service group
+                if sg not in groups:
+                    stats, members = all_groups.get(sg, (None, None))
+                    if stats is None:
+                        stats = client.slb.service_group.stats(sg)
+                    if members is None:
+                        members = client.slb.service_group.get(sg + "/member/stats")
+                    groups[sg] = (stats, members)
+                fetched.append(groups[sg])
+
+            snapshot.loadbalancers[vs['name']] = handler_lb.merge_stats_v30(
+                copy.deepcopy(resp), {'virtual-server': vs}, copy.deepcopy(fetched))
+
+        for sg, (stats, members) in groups.items():
+            snapshot.pools[sg] = handler_pool.pool_stats(stats)
@@ -14,8 +14,6 @@
 
 import a10_neutron_lbaas.a10_context as a10_context
 
-from a10_neutron_lbaas.vthunder import keystone as keystone_helpers
-
 
 class A10Context(a10_context.A10Context):
     pass
@@ -57,8 +55,14 @@ class A10DeleteContext(a10_context.A10DeleteContextBase):
         if self.partition_key == self.tenant_id:
             return self.handler.neutron.loadbalancer_total(ctx, self.partition_key)
         else:
-            keystone_context = keystone_helpers.KeystoneFromContext(self.a10_driver.config,
-                                                                    self.openstack_context)
-            projects = keystone_context.client.projects.list()
-            idlist = [x.id for x in projects if x.parent_id == self.partition_key]
+            # Decides whether the partition is deleted; no cached answers
+            idlist = self.a10_driver.project_hierarchy.children_of(
+                self.openstack_context, self.partition_key, fresh=True)
             return self.handler.neutron.loadbalancer_parent(ctx, idlist)
+
+
+class A10BatchDeleteContext(A10DeleteContext):
+    """Delete context for a batch; the caller reports each object's status."""
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        super(A10DeleteContext, self).__exit__(exc_type, exc_value, traceback)
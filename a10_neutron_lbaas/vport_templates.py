@@ -0,0 +1,126 @@
+# Copyright 2026, A10 Networks
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from acos_client.v21.slb import virtual_port as v21_vport
+from acos_client.v30.slb import virtual_port as v30_vport
+from six import iteritems
+
+# Which vport_defaults keys apply to which vports. A key with a condition
+# is only sent when the condition holds for the vport being configured.
+# Conditions can be overridden, or added, with vport_default_conditions.
+VPORT_DEFAULT_CONDITIONS = {
+    "ha-conn-mirror": {"field": "protocol", "op": "in", "value": ("tcp", "udp")},
+    "template-http": {"field": "protocol", "op": "in", "value": ("http", "https")},
+    "no-dest-nat": {"field": "protocol", "op": "not in", "value": ("http", "https")},
+}
+
+# Conditions are written against protocol names; aXAPI 2.1 numbers them
+_PROTOCOL_NAMES = {
+    v21_vport.VirtualPort.TCP: "tcp",
+    v21_vport.VirtualPort.UDP: "udp",
+    v21_vport.VirtualPort.HTTP: "http",
+    v21_vport.VirtualPort.HTTPS: "https",
+}
+
+_OPS = {
+    "=": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    "in": lambda a, b: a in b,
+    "not in": lambda a, b: a not in b,
+}
+
+
+def _holds(condition, fields):
+    value = condition["value"]
+    if isinstance(value, (list, tuple, set)):
+        value = tuple(str(v).lower() for v in value)
+    else:
+        value = str(value).lower()
+    return _OPS[condition["op"]](fields.get(condition["field"]), value)
+
+
+class VportTemplate(object):
+    """The vport_defaults for one device and vport protocol.
+
+    The global and device defaults are merged, and keys whose condition does
+    not hold are dropped, once. build() only overlays the name expression
+    match on a copy.
+    """
+
+    def __init__(self, protocol, global_defaults, device_cfg, conditions):
+        self.protocol = protocol
+        self.sources = (global_defaults, device_cfg.get("vport_defaults"),
+                        device_cfg.get("templates"))
+
+        fields = {"protocol": str(_PROTOCOL_NAMES.get(protocol, protocol)).lower()}
+        self._dropped = frozenset(k for k, v in iteritems(conditions)
+                                  if not _holds(v, fields))
+
+        defaults = {}
+        defaults.update(global_defaults or {})
+        defaults.update(device_cfg.get("vport_defaults") or {})
+        self._defaults = self._strip(defaults)
+
+        templates = device_cfg.get("templates")
+        self.virtual_port_templates = templates.get("virtual-port") if templates else None
+
+    def _strip(self, d):
+        return dict((k, v) for k, v in iteritems(d) if k not in self._dropped)
+
+    def build(self, match=None):
+        """Returns the vport protocol and vport_defaults for one vport.
+
+        match is the name expression json for the vport, if any. A
+        "protocol" key in the defaults replaces the protocol of the vport.
+        """
+        rv = dict(self._defaults)
+        if match:
+            rv.update(self._strip(match))
+        return rv.pop("protocol", self.protocol), rv
+
+
+class VportTemplates(object):
+    """VportTemplate cache, per (device name, vport protocol).
+
+    A template is rebuilt when the defaults or templates it was built from
+    are replaced, e.g. for devices whose config is edited after loading.
+    """
+
+    def __init__(self, conditions=None):
+        self.conditions = dict(VPORT_DEFAULT_CONDITIONS)
+        self.conditions.update(conditions or {})
+        self._templates = {}
+
+    def get(self, device_cfg, protocol, global_defaults):
+        key = (device_cfg.get("name"), protocol)
+        template = self._templates.get(key)
+        if template is None or not self._current(template, device_cfg, global_defaults):
+            template = VportTemplate(protocol, global_defaults, device_cfg, self.conditions)
+            self._templates[key] = template
+        return template
+
+    def prime(self, devices, global_defaults):
+        """Builds the templates of the configured devices up front."""
+        for device_cfg in devices.values():
+            if str(device_cfg.get("api_version")).startswith("2"):
+                vport = v21_vport.VirtualPort
+            else:
+                vport = v30_vport.VirtualPort
+            for protocol in (vport.TCP, vport.UDP, vport.HTTP, vport.HTTPS):
+                self.get(device_cfg, protocol, global_defaults)
+
+    def _current(self, template, device_cfg, global_defaults):
+        sources = (global_defaults, device_cfg.get("vport_defaults"),
+                   device_cfg.get("templates"))
+        return all(a is b for a, b in zip(template.sources, sources))
@@ -17,13 +17,6 @@ import pprint
 import time
 import uuid
 
-import neutronclient.neutron.client as neutron_client
-
-import novaclient.client as nova_client
-import novaclient.exceptions as nova_exceptions
-
-import glanceclient.client as glance_client
-
 import a10_neutron_lbaas.a10_exceptions as a10_ex
 import a10_neutron_lbaas.vthunder.keystone as a10_keystone
 
@@ -84,6 +77,11 @@ class InstanceManager(object):
         else:
             self._network_ks_session = ks_session
 
+        # The API clients are only imported once a vThunder is managed
+        import glanceclient.client as glance_client
+        import neutronclient.neutron.client as neutron_client
+        import novaclient.client as nova_client
+
         # Yes, we really want both of these to use the "service tenant".
         self._nova_api = nova_api or nova_client.Client(
             nova_version, session=self._ks_session)
@@ -219,6 +217,8 @@ class InstanceManager(object):
             time.sleep(sleep_time)
 
     def delete_instance(self, instance_id):
+        import novaclient.exceptions as nova_exceptions
+
         try:
             return self._nova_api.servers.delete(instance_id)
         except nova_exceptions.NotFound:
@@ -279,6 +279,8 @@ class InstanceManager(object):
                 "Parameter networks must be specified.")
 
         try:
+            import neutronclient.neutron.client as neutron_client
+
             # Lookup as user, since names are not unique
             q_api = neutron_client.Client(NEUTRON_VERSION, session=session)
             network_list = q_api.list_networks()
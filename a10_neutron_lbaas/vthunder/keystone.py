@@ -10,14 +10,14 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-from keystoneauth1.identity import v2
-from keystoneauth1.identity import v3
-from keystoneauth1 import session
-from keystoneclient.v2_0 import client as keystone_v2_client
-from keystoneclient.v3 import client as keystone_v3_client
+import threading
+import time
 
 import a10_neutron_lbaas.a10_exceptions as a10_ex
 
+# keystoneauth1 and keystoneclient are imported where they are used, so that
+# importing the driver (which uses ProjectHierarchy) does not load them.
+
 
 class KeystoneBase(object):
 
@@ -33,11 +33,15 @@ class KeystoneBase(object):
         return self._keystone_client
 
     def _get_keystone_stuff(self, ks_version, auth):
+        from keystoneauth1 import session
+
         sess = session.Session(auth=auth)
 
         if int(ks_version) == 2:
+            from keystoneclient.v2_0 import client as keystone_v2_client
             ks = keystone_v2_client.Client(session=sess)
         else:
+            from keystoneclient.v3 import client as keystone_v3_client
             ks = keystone_v3_client.Client(session=sess)
 
         return (sess, ks)
@@ -55,6 +59,9 @@ class KeystoneFromConfig(KeystoneBase):
             password=vth['service_tenant']['password'])
 
     def _get_keystone_pw(self, ks_version, auth_url, user, password, tenant_name):
+        from keystoneauth1.identity import v2
+        from keystoneauth1.identity import v3
+
         if int(ks_version) == 2:
             auth = v2.Password(
                 auth_url=auth_url, username=user, password=password,
@@ -88,6 +95,9 @@ class KeystoneFromContext(KeystoneBase):
             auth_token=openstack_context.auth_token)
 
     def _get_keystone_token(self, ks_version, auth_url, auth_token, tenant_id):
+        from keystoneauth1.identity import v2
+        from keystoneauth1.identity import v3
+
         if int(ks_version) == 2:
             auth = v2.Token(auth_url=auth_url, token=auth_token, tenant_id=tenant_id)
         elif int(ks_version) == 3:
@@ -96,3 +106,87 @@ class KeystoneFromContext(KeystoneBase):
             raise a10_ex.InvalidConfig('keystone version must be protocol version 2 or 3')
 
         return self._get_keystone_stuff(ks_version, auth)
+
+
+class ProjectHierarchy(object):
+    """TTL cache of the keystone project tree, for use_parent_project.
+
+    Keeps a child->parent index filled one project at a time, and a
+    parent->children index filled by listing a single parent's children.
+    Entries expire after `ttl` seconds and are refreshed individually; the
+    keystone client is only built when something has to be looked up.
+    """
+
+    def __init__(self, a10_config, ttl=300):
+        self.a10_config = a10_config
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._parents = {}
+        self._children = {}
+
+    def _keystone(self, openstack_context):
+        return KeystoneFromContext(self.a10_config, openstack_context).client
+
+    def parent_of(self, openstack_context, project_id):
+        """The parent project id, or None for a top-level project."""
+        now = time.time()
+        with self._lock:
+            hit = self._parents.get(project_id)
+            if hit is not None and hit[1] > now:
+                return hit[0]
+
+        project = self._keystone(openstack_context).projects.get(project_id)
+        parent_id = project.parent_id
+        if parent_id == project.domain_id:
+            parent_id = None
+
+        with self._lock:
+            self._set_parent(project_id, parent_id, now + self.ttl)
+            siblings = self._children.get(parent_id)
+            if siblings is not None:
+                siblings[0].add(project_id)
+        return parent_id
+
+    def children_of(self, openstack_context, parent_id, fresh=False):
+        """The child project ids of a project.
+
+        Anything that deletes based on the answer should pass fresh=True;
+        a project created elsewhere within the TTL is not in the cache.
+        """
+        now = time.time()
+        if not fresh:
+            with self._lock:
+                hit = self._children.get(parent_id)
+                if hit is not None and hit[1] > now:
+                    return list(hit[0])
+
+        projects = self._keystone(openstack_context).projects.list(parent=parent_id)
+        children = set(x.id for x in projects if x.parent_id == parent_id)
+
+        with self._lock:
+            old = self._children.get(parent_id)
+            self._children[parent_id] = (children, now + self.ttl)
+            for child in children:
+                self._set_parent(child, parent_id, now + self.ttl)
+            # Moved elsewhere since; where to is looked up again when asked
+            for child in (old[0] - children) if old is not None else ():
+                self._parents.pop(child, None)
+        return list(children)
+
+    def _set_parent(self, project_id, parent_id, expires):
+        # A reparented project leaves its old parent's children
+        old = self._parents.get(project_id)
+        if old is not None and old[0] != parent_id:
+            siblings = self._children.get(old[0])
+            if siblings is not None:
+                siblings[0].discard(project_id)
+        self._parents[project_id] = (parent_id, expires)
+
+    def invalidate(self, project_id=None):
+        with self._lock:
+            if project_id is None:
+                self._parents.clear()
+                self._children.clear()
+                return
+            self._parents.pop(project_id, None)
+            self._children.pop(project_id, None)